@@ -9,6 +9,7 @@
 import os
 from typing import List, Tuple
 
+import click
 from PIL import Image, ImageDraw, ImageFont
 
 from spsdk.apps.spsdk_apps import main as spsdk_main
@@ -205,8 +206,7 @@ def get_spsdk_apps() -> List[str]:
 
     :return: list of all SPSDK apps
     """
-    commands = spsdk_main.commands
-    return list(commands.keys())
+    return spsdk_main.list_commands(click.Context(spsdk_main))
 
 
 def concat_img(im1: Image.Image, im2: Image.Image, im3: Image.Image) -> Image.Image:
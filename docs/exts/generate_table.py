@@ -9,6 +9,7 @@ import itertools
 import os
 from typing import Dict, List
 
+import click
 from pytablewriter import RstGridTableWriter
 
 from spsdk.apps.nxpimage import main as nxpimage_main
@@ -62,10 +63,7 @@ def is_nxpimage_subcommand(subcommand: str) -> bool:
     if subcommand in EXTRAS:
         return True
     subcommand = subcommand.replace("_", "-")
-    for command in nxpimage_main.commands.values():
-        if subcommand == command.name:
-            return True
-    return False
+    return subcommand in nxpimage_main.list_commands(click.Context(nxpimage_main))
 
 
 def get_targets() -> List[str]:
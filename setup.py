@@ -83,6 +83,7 @@ setup(
             "nxpdevscan=spsdk.apps.nxpdevscan:safe_main",
             "nxpdevhsm=spsdk.apps.nxpdevhsm:safe_main",
             "nxpele=spsdk.apps.nxpele:safe_main",
+            "nxpgang=spsdk.apps.nxpgang:safe_main",
             "nxpimage=spsdk.apps.nxpimage:safe_main",
             "nxpmemcfg=spsdk.apps.nxpmemcfg:safe_main",
             "nxpwpc=spsdk.apps.nxpwpc:safe_main",
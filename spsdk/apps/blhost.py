@@ -13,7 +13,8 @@ import logging
 import os
 import shlex
 import sys
-from typing import Optional
+from contextlib import ExitStack
+from typing import BinaryIO, Optional, Union
 
 import click
 
@@ -821,8 +822,7 @@ def receive_sb_file(ctx: click.Context, sb_file: click.File, check_errors: bool)
         with progress_bar(
             suppress=ctx.obj["suppress_progress_bar"], label="Sending SB file"
         ) as progress_callback:
-            data = sb_file.read()  # type: ignore
-            mboot.receive_sb_file(data, progress_callback, check_errors)
+            mboot.receive_sb_file(sb_file, progress_callback, check_errors)  # type: ignore
         display_output([], mboot.status_code, ctx.obj["use_json"], ctx.obj["silent"])
 
 
@@ -871,24 +871,29 @@ def write_memory(ctx: click.Context, address: int, data_source: str, memory_id:
                 - when using Jupyter notebook, use [[ ]] instead of {{ }}: eg. [[11 22 33]]
     MEMORY_ID   - id of memory to read from (default: 0)
     """
-    try:
-        data = parse_hex_data(data_source)
-    except SPSDKError:
-        file_path, size = parse_file_and_size(data_source)
-        with open(file_path, "rb") as f:
-            data = f.read(size)
-
-    with McuBoot(ctx.obj["interface"]) as mboot:
-        with progress_bar(
-            suppress=ctx.obj["suppress_progress_bar"], label="Writing memory"
-        ) as progress_callback:
-            response = mboot.write_memory(address, data, memory_id, progress_callback)
-        display_output(
-            [len(data)] if response else None,
-            mboot.status_code,
-            ctx.obj["use_json"],
-            ctx.obj["silent"],
-        )
+    with ExitStack() as stack:
+        data: Union[bytes, BinaryIO]
+        try:
+            data = parse_hex_data(data_source)
+            size = len(data)
+        except SPSDKError:
+            file_path, size = parse_file_and_size(data_source)
+            file_size = os.path.getsize(file_path)
+            size = file_size if size < 0 else min(size, file_size)
+            # stream the file instead of loading it into memory
+            data = stack.enter_context(open(file_path, "rb"))
+
+        with McuBoot(ctx.obj["interface"]) as mboot:
+            with progress_bar(
+                suppress=ctx.obj["suppress_progress_bar"], label="Writing memory"
+            ) as progress_callback:
+                response = mboot.write_memory(address, data, memory_id, progress_callback, size)
+            display_output(
+                [size] if response else None,
+                mboot.status_code,
+                ctx.obj["use_json"],
+                ctx.obj["silent"],
+            )
 
 
 @main.command(no_args_is_help=True)
@@ -0,0 +1,160 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+#
+# Copyright 2024 NXP
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""CLI application for gang programming of multiple targets over the MBoot protocol."""
+
+import json
+import logging
+import sys
+from typing import List, Optional
+
+import click
+
+from spsdk.apps.utils import spsdk_logger
+from spsdk.apps.utils.common_cli_options import CommandsTreeGroup, spsdk_apps_common_options
+from spsdk.apps.utils.utils import INT, SPSDKAppError, catch_spsdk_error
+from spsdk.mboot.gang import GangProgrammer, GangResult
+from spsdk.mboot.protocol.base import MbootProtocolBase
+from spsdk.mboot.scanner import get_mboot_interfaces
+
+logger = logging.getLogger(__name__)
+
+
+def get_gang_interfaces(
+    ports: List[str],
+    usb: List[str],
+    lpcusbsio: List[str],
+    timeout: int,
+) -> List[MbootProtocolBase]:
+    """Discover all targets for gang programming.
+
+    :param ports: List of serial port specifications (name[,speed])
+    :param usb: List of USB device identifiers, each identifier may match multiple devices
+    :param lpcusbsio: List of LPCUSBSIO configuration strings
+    :param timeout: Timeout in milliseconds
+    :return: List of interfaces
+    :raises SPSDKAppError: No target specified
+    """
+    interfaces: List[MbootProtocolBase] = []
+    for port in ports:
+        interfaces.extend(get_mboot_interfaces(port=port, timeout=timeout))
+    for usb_id in usb:
+        interfaces.extend(get_mboot_interfaces(usb=usb_id, timeout=timeout))
+    for usbsio_cfg in lpcusbsio:
+        interfaces.extend(get_mboot_interfaces(lpcusbsio=usbsio_cfg, timeout=timeout))
+    if not interfaces:
+        raise SPSDKAppError("At least one of '--port', '--usb' or '--lpcusbsio' must be specified.")
+    return interfaces
+
+
+@click.group(name="nxpgang", no_args_is_help=True, cls=CommandsTreeGroup)
+@spsdk_apps_common_options
+def main(log_level: int) -> None:
+    """Utility for programming multiple targets at once via the bootloader."""
+    spsdk_logger.install(level=log_level or logging.WARNING)
+
+
+@main.command(name="run", no_args_is_help=True)
+@click.option(
+    "-p",
+    "--port",
+    "ports",
+    metavar="COM[,speed]",
+    multiple=True,
+    help="Serial port of a target, can be used multiple times.",
+)
+@click.option(
+    "-u",
+    "--usb",
+    metavar="VID:PID|USB_PATH|DEV_NAME",
+    multiple=True,
+    help="USB device identifier, all matching devices are used. Can be used multiple times.",
+)
+@click.option(
+    "-l",
+    "--lpcusbsio",
+    metavar="usb,[spi|i2c]",
+    multiple=True,
+    help="LPCUSBSIO interface of a target, can be used multiple times.",
+)
+@click.option(
+    "-s",
+    "--script",
+    type=click.Path(exists=True, dir_okay=False, resolve_path=True),
+    required=True,
+    help=(
+        "Command script executed on each target, one command per line, e.g. "
+        "'write-memory 0x0 app.bin'. Supported commands: "
+        f"{', '.join(GangProgrammer.COMMANDS)}."
+    ),
+)
+@click.option(
+    "-w",
+    "--workers",
+    type=INT(),
+    required=False,
+    help="Maximal count of targets programmed at the same time, all targets by default.",
+)
+@click.option(
+    "-t",
+    "--timeout",
+    type=INT(),
+    default="5000",
+    help="Maximal waiting time in milliseconds for the response from a target.",
+)
+@click.option("-j", "--json", "use_json", is_flag=True, help="Use JSON output")
+def run(
+    ports: List[str],
+    usb: List[str],
+    lpcusbsio: List[str],
+    script: str,
+    workers: Optional[int],
+    timeout: int,
+    use_json: bool,
+) -> None:
+    """Run the command script on all specified targets concurrently."""
+    commands = GangProgrammer.load_script(script)
+    interfaces = get_gang_interfaces(ports, usb, lpcusbsio, timeout)
+    programmer = GangProgrammer(interfaces, commands, max_workers=workers)
+
+    def print_result(result: GangResult) -> None:
+        if not use_json:
+            click.echo(str(result))
+
+    results = programmer.run(progress_callback=print_result)
+    if use_json:
+        click.echo(
+            json.dumps(
+                [
+                    {
+                        "device": result.device,
+                        "success": result.success,
+                        "duration": round(result.duration, 3),
+                        "status": result.status,
+                        "failed_command": result.failed_command,
+                        "error": result.error,
+                    }
+                    for result in results
+                ],
+                indent=3,
+            )
+        )
+    failed = [result for result in results if not result.success]
+    if failed:
+        raise SPSDKAppError(f"Gang programming failed on {len(failed)} of {len(results)} device(s)")
+    if not use_json:
+        click.echo(f"Gang programming succeeded on all {len(results)} device(s)")
+
+
+@catch_spsdk_error
+def safe_main() -> None:
+    """Call the main function."""
+    sys.exit(main())  # pylint: disable=no-value-for-parameter
+
+
+if __name__ == "__main__":
+    safe_main()
@@ -0,0 +1,401 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+#
+# Copyright 2022-2024 NXP
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""NXP MCU Image tool - AHAB sub-commands."""
+import datetime
+import logging
+import mmap
+import os
+from typing import Optional, Union
+
+import click
+
+from spsdk.apps.utils.common_cli_options import (
+    spsdk_config_option,
+    spsdk_family_option,
+    spsdk_output_option,
+    spsdk_plugin_option,
+)
+from spsdk.apps.utils.utils import INT, SPSDKAppError
+from spsdk.exceptions import SPSDKError
+from spsdk.image.ahab import ahab_container
+from spsdk.image.ahab.ahab_container import AHABImage
+from spsdk.image.ahab.utils import ahab_update_keyblob
+from spsdk.image.bootable_image.bimg import BootableImage
+from spsdk.utils.misc import (
+    get_abs_path,
+    load_binary,
+    load_configuration,
+    load_hex_string,
+    write_file,
+)
+from spsdk.utils.plugins import load_plugin_from_source
+from spsdk.utils.schema_validator import CommentedConfig, check_config
+
+logger = logging.getLogger(__name__)
+
+
+@click.group(name="ahab", no_args_is_help=True)
+def ahab_group() -> None:
+    """Group of sub-commands related to AHAB."""
+
+
+@ahab_group.command(name="export", no_args_is_help=True)
+@spsdk_config_option(required=True)
+@spsdk_plugin_option
+def ahab_export_command(config: str, plugin: str) -> None:
+    """Generate AHAB Image from YAML/JSON configuration.
+
+    The configuration template files could be generated by subcommand 'get-template'.
+    """
+    ahab_export(config, plugin)
+
+
+def ahab_export(config: str, plugin: Optional[str] = None) -> None:
+    """Generate AHAB Image from YAML/JSON configuration."""
+    if plugin:
+        load_plugin_from_source(plugin)
+    config_data = load_configuration(config)
+    config_dir = os.path.dirname(config)
+    schemas = AHABImage.get_validation_schemas()
+    check_config(config_data, schemas, search_paths=[config_dir])
+    ahab = AHABImage.load_from_config(config_data, search_paths=[config_dir])
+    ahab_data = ahab.export()
+
+    ahab_output_file_path = get_abs_path(config_data["output"], config_dir)
+    write_file(ahab_data, ahab_output_file_path, mode="wb")
+
+    logger.info(f"Created AHAB Image:\n{str(ahab.image_info())}")
+    logger.info(f"Created AHAB Image memory map:\n{ahab.image_info().draw()}")
+    click.echo(f"Success. (AHAB: {ahab_output_file_path} created.)")
+
+    ahab_output_dir, ahab_output_file = os.path.split(ahab_output_file_path)
+    ahab_output_file_no_ext, _ = os.path.splitext(ahab_output_file)
+    for cnt_ix, container in enumerate(ahab.ahab_containers):
+        if container.flag_srk_set == "nxp":
+            logger.debug("Skipping generating hashes for NXP container")
+            continue
+        srk_table = container.signature_block.srk_table
+        file_name = f"{ahab_output_file_no_ext}_{container.flag_srk_set}{cnt_ix}_srk_hash"
+        if srk_table:
+            srkh = srk_table.compute_srk_hash()
+            write_file(srkh.hex().upper(), get_abs_path(f"{file_name}.txt", ahab_output_dir))
+            try:
+                blhost_script = ahab.create_srk_hash_blhost_script(cnt_ix)
+                write_file(blhost_script, get_abs_path(f"{file_name}_blhost.bcf", ahab_output_dir))
+            except SPSDKError:
+                pass
+            click.echo(f"Generated SRK hash files ({os.path.abspath(file_name)}*.*).")
+
+
+@ahab_group.command(name="parse", no_args_is_help=True)
+@spsdk_family_option(families=AHABImage.get_supported_families())
+@spsdk_output_option(directory=True)
+@click.option(
+    "-b",
+    "--binary",
+    type=click.Path(exists=True, readable=True, resolve_path=True),
+    required=True,
+    help="Path to binary AHAB image to parse.",
+)
+@click.option(
+    "-k",
+    "--dek",
+    type=str,
+    required=False,
+    help=(
+        "Data encryption key, if it's specified, the parse method tries decrypt all encrypted images. "
+        "It could be specified as binary/HEX text file path or directly HEX string"
+    ),
+)
+def ahab_parse_command(family: str, binary: str, dek: str, output: str) -> None:
+    """Parse AHAB Image into YAML configuration and binary images."""
+    ahab_parse(family, binary, dek, output)
+
+
+def map_binary(path: str) -> memoryview:
+    """Map the binary file into memory.
+
+    The file content is not loaded at once, the OS reads just the accessed parts of the file.
+
+    :param path: Path to binary file.
+    :return: Read-only memory view of the file content.
+    """
+    with open(path, "rb") as f:
+        if not os.fstat(f.fileno()).st_size:
+            return memoryview(b"")
+        # the mapping stays valid also after the file is closed
+        return memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+
+def ahab_parse_image(family: str, binary: Union[bytes, memoryview]) -> Optional[AHABImage]:
+    """Parse one AHAB Image.
+
+    :param family: Chip family.
+    :param binary: Binary to parse
+    :return: AHAB image if founded
+    """
+    for target_memory in AHABImage.TARGET_MEMORIES:
+        try:
+            ahab_image = AHABImage(family=family, target_memory=target_memory)
+            ahab_image.parse(binary)
+            ahab_image.update_fields(update_offsets=False)
+            ahab_image.validate()
+        except SPSDKError as exc:
+            logger.debug(
+                f"AHAB parse: Attempt to parse image for {target_memory} target failed: {str(exc)}"
+            )
+            ahab_image = None
+        else:
+            break
+
+    return ahab_image
+
+
+def ahab_parse(family: str, binary: str, dek: str, output: str) -> None:
+    """Parse AHAB Image into YAML configuration and binary images."""
+    data = map_binary(binary)
+    offset = 0
+    parsed_folder = output
+    while offset < len(data):
+        ahab_image = ahab_parse_image(family=family, binary=data[offset:])
+        if not ahab_image:
+            click.echo(f"Failed. (AHAB: {binary} parsing failed.)")
+            return
+        if offset != 0:
+            parsed_folder = output + f"_0x{offset:08X}"
+        if not os.path.exists(parsed_folder):
+            os.makedirs(parsed_folder, exist_ok=True)
+
+        logger.info(
+            f"Identified AHAB image for {ahab_image.target_memory} target,"
+            f" at offset {hex(offset)} in binary file"
+        )
+        logger.info(f"Parsed AHAB image memory map: {ahab_image.image_info().draw()}")
+        if dek:
+            for container in ahab_image.ahab_containers:
+                if container.flag_srk_set != "nxp":
+                    if container.signature_block.blob:
+                        container.signature_block.blob.dek = load_hex_string(
+                            dek, container.signature_block.blob._size // 8
+                        )
+                        container.decrypt_data()
+                    else:
+                        logger.info("Nothing to decrypt, the container doesn't contains BLOB")
+
+        config = ahab_image.create_config(parsed_folder)
+        write_file(
+            CommentedConfig(
+                main_title=(
+                    f"AHAB recreated configuration from :"
+                    f"{datetime.datetime.now().strftime('%d/%m/%Y %H:%M:%S')}."
+                ),
+                schemas=AHABImage.get_validation_schemas(),
+            ).get_config(config),
+            os.path.join(parsed_folder, "parsed_config.yaml"),
+        )
+        click.echo(f"Success. (AHAB: {binary} has been parsed and stored into {parsed_folder}.)")
+
+        for cnt_ix, container in enumerate(ahab_image.ahab_containers):
+            srk_table = container.signature_block.srk_table
+            file_name = os.path.join(parsed_folder, f"{container.flag_srk_set}{cnt_ix}_srk_hash")
+            if srk_table:
+                srkh = srk_table.compute_srk_hash()
+                write_file(srkh.hex().upper(), f"{file_name}.txt")
+                try:
+                    blhost_script = ahab_image.create_srk_hash_blhost_script(cnt_ix)
+                    write_file(blhost_script, f"{file_name}_blhost.bcf")
+                except SPSDKError:
+                    pass
+                click.echo(f"Generated SRK hash files ({file_name}*.*).")
+
+        offset += len(ahab_image)
+
+
+@ahab_group.command(name="verify", no_args_is_help=True)
+@spsdk_family_option(families=AHABImage.get_supported_families())
+@click.option(
+    "-b",
+    "--binary",
+    type=click.Path(exists=True, readable=True, resolve_path=True),
+    required=True,
+    help="Path to binary AHAB image to verify.",
+)
+def ahab_verify_command(family: str, binary: str) -> None:
+    """Verify AHAB Image.
+
+    The hashes of images and signatures of containers are checked. The binary
+    is memory mapped, so also huge boot images could be verified.
+    """
+    ahab_verify(family, binary)
+
+
+def ahab_verify(family: str, binary: str) -> None:
+    """Verify all AHAB Images in binary."""
+    data = map_binary(binary)
+    offset = 0
+    while offset < len(data):
+        ahab_image = ahab_parse_image(family=family, binary=data[offset:])
+        if not ahab_image:
+            raise SPSDKAppError(f"AHAB: {binary} verification failed at offset {hex(offset)}.")
+        logger.info(
+            f"Verified AHAB image for {ahab_image.target_memory} target,"
+            f" at offset {hex(offset)} in binary file"
+        )
+        logger.info(f"Verified AHAB image memory map: {ahab_image.image_info().draw()}")
+        offset += len(ahab_image)
+    click.echo(f"Success. (AHAB: {binary} has been verified.)")
+
+
+@ahab_group.command(name="update-keyblob", no_args_is_help=True)
+@click.option(
+    "-f",
+    "--family",
+    type=click.Choice(AHABImage.get_supported_families(), case_sensitive=False),
+    required=True,
+    help="Select the chip family.",
+)
+@click.option(
+    "-b",
+    "--binary",
+    type=click.Path(exists=True, readable=True, resolve_path=True),
+    required=True,
+    help="Path to binary AHAB image to update.",
+)
+@click.option(
+    "-k",
+    "--keyblob",
+    type=str,
+    required=True,
+    help=("Path to keyblob that will be inserted into AHAB Image"),
+)
+@click.option(
+    "-i",
+    "--container-id",
+    type=INT(),
+    required=True,
+    help="""
+    ID of the container where the keyblob will be replaced.
+    """,
+)
+@click.option(
+    "-m",
+    "--mem-type",
+    type=click.Choice(
+        BootableImage.get_supported_memory_types(),
+        case_sensitive=False,
+    ),
+    required=False,
+    help="Select memory type. Only applicable for bootable images "
+    "(image containing FCB or XMCD segments). Do not use for raw AHAB image",
+)
+def ahab_update_keyblob_command(
+    family: str, binary: str, keyblob: str, container_id: int, mem_type: str
+) -> None:
+    """Update keyblob in AHAB image."""
+    ahab_update_keyblob(family, binary, keyblob, container_id, mem_type)
+    click.echo(f"Success. (AHAB: {binary} keyblob has been updated)")
+
+
+@ahab_group.command(name="get-template", no_args_is_help=True)
+@spsdk_family_option(families=AHABImage.get_supported_families())
+@spsdk_output_option(force=True)
+def ahab_get_template_command(family: str, output: str) -> None:
+    """Create template of configuration in YAML format.
+
+    The template file name is specified as argument of this command.
+    """
+    ahab_get_template(family, output)
+
+
+def ahab_get_template(family: str, output: str) -> None:
+    """Create template of configuration in YAML format."""
+    click.echo(f"Creating {output} template file.")
+    write_file(AHABImage.generate_config_template(family)[f"{family}_ahab"], output)
+
+
+@ahab_group.group(name="certificate", no_args_is_help=True)
+def ahab_certificate_group() -> None:  # pylint: disable=unused-argument
+    """Group of sub-commands related to AHAB certificate blob."""
+
+
+@ahab_certificate_group.command(name="get-template", no_args_is_help=True)
+@spsdk_output_option(force=True)
+def ahab_cert_block_get_template_command(output: str) -> None:
+    """Create template of configuration in YAML format."""
+    ahab_cert_block_get_template(output)
+
+
+def ahab_cert_block_get_template(output: str) -> None:
+    """Create template of configuration in YAML format."""
+    click.echo(f"Creating {output} template file.")
+    write_file(ahab_container.Certificate.generate_config_template(), output)
+
+
+@ahab_certificate_group.command(name="export", no_args_is_help=True)
+@spsdk_config_option(required=True)
+@spsdk_output_option(required=True)
+@spsdk_plugin_option
+def ahab_cert_block_export_command(config: str, output: str, plugin: str) -> None:
+    """Generate AHAB Certificate Blob from YAML/JSON configuration.
+
+    The configuration template files could be generated by subcommand 'get-template'.
+    """
+    ahab_cert_block_export(config, output, plugin)
+
+
+def ahab_cert_block_export(config: str, output: str, plugin: Optional[str] = None) -> None:
+    """Generate AHAB Certificate Blob from YAML/JSON configuration."""
+    if plugin:
+        load_plugin_from_source(plugin)
+    config_data = load_configuration(config)
+    config_dir = os.path.dirname(config)
+    schemas = ahab_container.Certificate.get_validation_schemas()
+    check_config(config_data, schemas, search_paths=[config_dir])
+    cert_block = ahab_container.Certificate.load_from_config(config_data, search_paths=[config_dir])
+    # Sign the certificate blob
+    cert_block.update_fields()
+    cert_data = cert_block.export()
+
+    write_file(cert_data, output, mode="wb")
+
+    click.echo(f"Success. (AHAB Certificate Blob: {output} created.)")
+
+
+@ahab_certificate_group.command(name="parse", no_args_is_help=True)
+@click.option(
+    "-b",
+    "--binary",
+    type=click.Path(exists=True, readable=True, resolve_path=True),
+    required=True,
+    help="Path to binary AHAB Certificate blob image to parse.",
+)
+@click.option(
+    "-s",
+    "--srk_set",
+    type=click.Choice(["oem", "nxp"]),
+    default="oem",
+    help="SRK set that has been used for certificate.",
+)
+@spsdk_output_option(directory=True)
+def ahab_cert_block_parse_command(binary: str, srk_set: str, output: str) -> None:
+    """Parse AHAB Certificate Blob."""
+    ahab_cert_block_parse(binary, srk_set, output)
+
+
+def ahab_cert_block_parse(binary: str, srk_set: str, output: str) -> None:
+    """Parse AHAB Certificate Blob."""
+    cert_block = ahab_container.Certificate.parse(load_binary(binary))
+    logger.info(str(cert_block))
+    parsed_cfg = CommentedConfig(
+        "Parsed AHAB Certificate", ahab_container.Certificate.get_validation_schemas()
+    ).get_config(cert_block.create_config(0, output, srk_set))
+    write_file(
+        parsed_cfg,
+        os.path.join(output, "certificate_config.yaml"),
+    )
+    click.echo(f"Success. (AHAB Certificate Blob: {binary} has been parsed into {output}.)")
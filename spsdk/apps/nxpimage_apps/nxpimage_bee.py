@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+#
+# Copyright 2022-2024 NXP
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""NXP MCU Image tool - BEE sub-commands."""
+import logging
+import os
+
+import click
+
+from spsdk.apps.utils.common_cli_options import (
+    spsdk_config_option,
+    spsdk_family_option,
+    spsdk_output_option,
+)
+from spsdk.apps.utils.utils import filepath_from_config
+from spsdk.image.bee import BeeNxp
+from spsdk.utils.misc import get_abs_path, load_configuration, write_file
+from spsdk.utils.schema_validator import check_config
+
+logger = logging.getLogger(__name__)
+
+
+@click.group(name="bee", no_args_is_help=True)
+def bee_group() -> None:
+    """Group of sub-commands related to BEE."""
+
+
+@bee_group.command(name="export", no_args_is_help=True)
+@spsdk_config_option(required=True)
+def bee_export_command(config: str) -> None:
+    """Generate BEE Images from YAML/JSON configuration.
+
+    The configuration template files could be generated by subcommand 'get-template'.
+    """
+    bee_export(config)
+
+
+def bee_export(config: str) -> None:
+    """Generate BEE Images from YAML/JSON configuration."""
+    config_data = load_configuration(config)
+    config_dir = os.path.dirname(config)
+    schemas = BeeNxp.get_validation_schemas()
+    check_config(config_data, schemas, search_paths=[config_dir])
+    bee = BeeNxp.load_from_config(config_data, search_paths=[config_dir])
+
+    output_folder = get_abs_path(config_data["output_folder"], config_dir)
+    output_name = filepath_from_config(config_data, "output_name", "encrypted", output_folder)
+
+    write_file(bee.export_image(), output_name, mode="wb")
+    logger.info(f"Created BEE Image:\n{output_name}")
+
+    for idx, header in enumerate(bee.export_headers()):
+        if header:
+            header_output = filepath_from_config(
+                config_data, "header_name", "bee_ehdr", output_folder, file_extension=f"{idx}.bin"
+            )
+            write_file(header, header_output, mode="wb")
+            logger.info(f"Created BEE Header:\n{header_output}")
+
+    click.echo("Success. BEE files have been created")
+
+
+@bee_group.command(name="get-template", no_args_is_help=True)
+@spsdk_family_option(families=BeeNxp.get_supported_families())
+@spsdk_output_option(force=True)
+def bee_get_template_command(family: str, output: str) -> None:
+    """Create template of configuration in YAML format.
+
+    The template file name is specified as argument of this command.
+    """
+    bee_get_template(family, output)
+
+
+# pylint: disable=unused-argument    # preparation for the future
+def bee_get_template(family: str, output: str) -> None:
+    """Create template of configuration in YAML format."""
+    click.echo(f"Creating {output} template file.")
+    write_file(BeeNxp.generate_config_template(), output)
@@ -0,0 +1,294 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+#
+# Copyright 2022-2024 NXP
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""NXP MCU Image tool - Bootable Image sub-commands."""
+import logging
+import os
+from typing import Optional
+
+import click
+
+from spsdk.apps.utils.common_cli_options import (
+    spsdk_config_option,
+    spsdk_family_option,
+    spsdk_output_option,
+    spsdk_plugin_option,
+)
+from spsdk.image.bootable_image.bimg import BootableImage
+from spsdk.image.fcb.fcb import FCB
+from spsdk.image.xmcd.xmcd import XMCD, ConfigurationBlockType, MemoryType
+from spsdk.utils.misc import load_binary, load_configuration, write_file
+from spsdk.utils.plugins import load_plugin_from_source
+from spsdk.utils.schema_validator import check_config
+
+logger = logging.getLogger(__name__)
+
+
+@click.group(name="bootable-image", no_args_is_help=True)
+def bootable_image_group() -> None:
+    """Group of bootable image utilities."""
+
+
+@bootable_image_group.command(name="merge", no_args_is_help=True)
+@spsdk_config_option(required=True)
+@spsdk_output_option()
+@spsdk_plugin_option
+def bootable_image_merge_command(config: str, output: str, plugin: Optional[str] = None) -> None:
+    """Merge boot image blocks into one bootable image.
+
+    The configuration template files could be generated by subcommand 'get-templates'.
+    """
+    bootable_image_merge(config, output, plugin)
+
+
+def bootable_image_merge(config: str, output: str, plugin: Optional[str] = None) -> None:
+    """Merge boot image blocks into one bootable image."""
+    if plugin:
+        load_plugin_from_source(plugin)
+    config_data = load_configuration(config)
+    config_dir = os.path.dirname(config)
+    bimg_image = BootableImage.load_from_config(config_data, [config_dir])
+    bimg_image_info = bimg_image.image_info()
+
+    write_file(bimg_image_info.export(), output, mode="wb")
+
+    logger.info(f"Created Bootable Image:\n{str(bimg_image_info)}")
+    logger.info(f"Created Bootable Image memory map:\n{bimg_image_info.draw()}")
+    click.echo(f"Success. (Bootable Image: {output} created.)")
+
+
+@bootable_image_group.command(name="parse", no_args_is_help=True)
+@spsdk_family_option(families=BootableImage.get_supported_families())
+@click.option(
+    "-m",
+    "--mem-type",
+    type=click.Choice(
+        BootableImage.get_supported_memory_types(),
+        case_sensitive=False,
+    ),
+    required=False,
+    help="Select the chip used memory type.",
+)
+@click.option(
+    "-b",
+    "--binary",
+    type=click.Path(exists=True, readable=True),
+    required=True,
+    help="Path to binary Bootable image to parse.",
+)
+@spsdk_output_option(directory=True)
+def bootable_image_parse_command(family: str, mem_type: str, binary: str, output: str) -> None:
+    """Parse Bootable Image into YAML configuration and binary images."""
+    bootable_image_parse(family, mem_type, binary, output)
+
+
+def bootable_image_parse(family: str, mem_type: str, binary: str, output: str) -> None:
+    """Parse Bootable Image into YAML configuration and binary images."""
+    bimg_image = BootableImage.parse(load_binary(binary), family=family, mem_type=mem_type)
+    bimg_image_info = bimg_image.image_info()
+    logger.info(f"Parsed Bootable image memory map: {bimg_image_info.draw()}")
+    bimg_image.store_config(output)
+    click.echo(f"Success. (Bootable Image: {binary} has been parsed and stored into {output} .)")
+
+
+@bootable_image_group.command(name="get-templates", no_args_is_help=True)
+@spsdk_family_option(families=BootableImage.get_supported_families())
+@spsdk_output_option(directory=True, force=True)
+def bootable_image_get_templates_command(family: str, output: str) -> None:
+    """Create template of configurations in YAML format from all memory types.
+
+    The template files folder name is specified as argument of this command.
+    """
+    bootable_image_get_templates(family, output)
+
+
+def bootable_image_get_templates(family: str, output: str) -> None:
+    """Create template of configurations in YAML format from all memory types."""
+    mem_types = BootableImage.get_supported_memory_types(family)
+    for mem_type in mem_types:
+        output_file = os.path.join(output, f"bootimg_{family}_{mem_type}.yaml")
+        click.echo(f"Creating {output_file} template file.")
+        write_file(BootableImage.generate_config_template(family, mem_type), output_file)
+
+
+@bootable_image_group.group(name="fcb", no_args_is_help=True)
+def fcb() -> None:  # pylint: disable=unused-argument
+    """FCB (Flash Configuration Block) utilities."""
+
+
+@fcb.command(name="export", no_args_is_help=True)
+@spsdk_config_option(required=True)
+@spsdk_output_option()
+def fcb_export_command(config: str, output: str) -> None:
+    """Export FCB Image from YAML/JSON configuration.
+
+    The configuration template files could be generated by subcommand 'get-templates'.
+    """
+    fcb_export(config, output)
+
+
+def fcb_export(config: str, output: str) -> None:
+    """Export FCB Image from YAML/JSON configuration."""
+    config_data = load_configuration(config)
+    check_config(config_data, FCB.get_validation_schemas_family())
+    family = config_data["family"]
+    mem_type = config_data["type"]
+    revision = config_data.get("revision", "latest")
+    schemas = FCB.get_validation_schemas(family, mem_type, revision)
+    check_config(config_data, schemas, search_paths=[os.path.dirname(config)])
+    fcb_image = FCB.load_from_config(config_data)
+    fcb_data = fcb_image.export()
+    write_file(fcb_data, output, mode="wb")
+
+    logger.info(f"Created FCB Image:\n{str(fcb_image.registers.image_info())}")
+    logger.info(f"Created FCB Image memory map:\n{fcb_image.registers.image_info().draw()}")
+    click.echo(f"Success. (FCB: {output} created.)")
+
+
+@fcb.command(name="parse", no_args_is_help=True)
+@spsdk_family_option(families=FCB.get_supported_families())
+@click.option(
+    "-m",
+    "--mem-type",
+    default="flexspi_nor",
+    type=click.Choice(["flexspi_nor"], case_sensitive=False),
+    required=True,
+    help="Select the chip used memory type.",
+)
+@click.option(
+    "-b",
+    "--binary",
+    type=click.Path(exists=True, readable=True, resolve_path=True),
+    required=True,
+    help="Path to binary FCB image to parse.",
+)
+@spsdk_output_option()
+def fcb_parse_command(family: str, mem_type: str, binary: str, output: str) -> None:
+    """Parse FCB Image into YAML configuration."""
+    fcb_parse(family, mem_type, binary, output)
+
+
+def fcb_parse(family: str, mem_type: str, binary: str, output: str) -> None:
+    """Parse FCB Image into YAML configuration."""
+    fcb_image = FCB.parse(load_binary(binary), family=family, mem_type=mem_type)
+
+    logger.info(f"Parsed FCB image memory map: {fcb_image.registers.image_info().draw()}")
+    config = fcb_image.create_config()
+    write_file(config, output)
+    click.echo(f"Success. (FCB: {binary} has been parsed and stored into {output} .)")
+
+
+@fcb.command(name="get-templates", no_args_is_help=True)
+@spsdk_family_option(families=FCB.get_supported_families())
+@spsdk_output_option(directory=True, force=True)
+def fcb_get_templates_command(family: str, output: str) -> None:
+    """Create template of configurations in YAML format for all memory types.
+
+    The template files folder name is specified as argument of this command.
+    """
+    fcb_get_templates(family, output)
+
+
+def fcb_get_templates(family: str, output_folder: str) -> None:
+    """Create template of configurations in YAML format for all memory types."""
+    mem_types = FCB.get_supported_memory_types(family)
+    for mem_type in mem_types:
+        output = os.path.join(output_folder, f"fcb_{family}_{mem_type}.yaml")
+        click.echo(f"Creating {output} template file.")
+        write_file(FCB.generate_config_template(family, mem_type), output)
+
+
+@bootable_image_group.group(name="xmcd", no_args_is_help=True)
+def xmcd() -> None:  # pylint: disable=unused-argument
+    """XMCD (External Memory Configuration Data) utilities."""
+
+
+@xmcd.command(name="export", no_args_is_help=True)
+@spsdk_config_option(required=True)
+@spsdk_output_option()
+def xmcd_export_command(config: str, output: str) -> None:
+    """Export XMCD Image from YAML/JSON configuration.
+
+    The configuration template files could be generated by subcommand 'get-templates'.
+    """
+    xmcd_export(config, output)
+
+
+def xmcd_export(config: str, output: str) -> None:
+    """Export XMCD Image from YAML/JSON configuration."""
+    config_data = load_configuration(config)
+    config_dir = os.path.dirname(config)
+    check_config(config_data, XMCD.get_validation_schemas_family())
+    schemas = XMCD.get_validation_schemas(
+        config_data["family"],
+        MemoryType.from_label(config_data["mem_type"]),
+        ConfigurationBlockType.from_label(config_data["config_type"]),
+        config_data.get("revision", "latest"),
+    )
+    check_config(config_data, schemas, search_paths=[config_dir])
+    xmcd_image = XMCD.load_from_config(config_data)
+    xmcd_data = xmcd_image.export()
+    write_file(xmcd_data, output, mode="wb")
+
+    logger.info(f"Created XMCD :\n{str(xmcd_image.registers.image_info())}")
+    logger.info(f"Created XMCD memory map:\n{xmcd_image.registers.image_info().draw()}")
+    click.echo(f"Success. (XMCD: {output} created.)")
+
+
+@xmcd.command(name="parse", no_args_is_help=True)
+@spsdk_family_option(families=XMCD.get_supported_families())
+@click.option(
+    "-b",
+    "--binary",
+    type=click.Path(exists=True, readable=True, resolve_path=True),
+    required=True,
+    help="Path to binary XMCD image to parse.",
+)
+@spsdk_output_option()
+def xmcd_parse_command(family: str, binary: str, output: str) -> None:
+    """Parse XMCD Image into YAML configuration."""
+    xmcd_parse(family, binary, output)
+
+
+def xmcd_parse(family: str, binary: str, output: str) -> None:
+    """Parse XMCD Image into YAML configuration."""
+    xmcd_image = XMCD.parse(load_binary(binary), family=family)
+    logger.info(f"Parsed XMCD memory map: {xmcd_image.registers.image_info().draw()}")
+    config = xmcd_image.create_config()
+    write_file(config, output)
+    click.echo(f"Success. (XMCD: {binary} has been parsed and stored into {output} .)")
+
+
+@xmcd.command(name="get-templates", no_args_is_help=True)
+@spsdk_family_option(families=XMCD.get_supported_families())
+@spsdk_output_option(directory=True, force=True)
+def xmcd_get_templates_command(family: str, output: str) -> None:
+    """Create template of configurations in YAML format for all memory types.
+
+    The template files folder name is specified as argument of this command.
+    """
+    xmcd_get_templates(family, output)
+
+
+def xmcd_get_templates(family: str, output: str) -> None:
+    """Create template of configurations in YAML format for all memory types."""
+    mem_types = XMCD.get_supported_memory_types(family)
+    for mem_type in mem_types:
+        config_types = XMCD.get_supported_configuration_types(
+            family, MemoryType.from_label(mem_type)
+        )
+        for config_type in config_types:
+            output_file = os.path.join(output, f"xmcd_{family}_{mem_type}_{config_type}.yaml")
+            click.echo(f"Creating {output_file} template file.")
+            write_file(
+                XMCD.generate_config_template(
+                    family,
+                    MemoryType.from_label(mem_type),
+                    ConfigurationBlockType.from_label(config_type),
+                ),
+                output_file,
+            )
@@ -0,0 +1,121 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+#
+# Copyright 2022-2024 NXP
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""NXP MCU Image tool - Certification Block sub-commands."""
+import logging
+import os
+from typing import Optional
+
+import click
+
+from spsdk.apps.utils.common_cli_options import (
+    spsdk_config_option,
+    spsdk_family_option,
+    spsdk_output_option,
+    spsdk_plugin_option,
+)
+from spsdk.apps.utils.utils import SPSDKAppError
+from spsdk.utils.crypto.cert_blocks import CertBlock, CertBlockVx
+from spsdk.utils.misc import get_abs_path, load_binary, load_configuration, write_file
+from spsdk.utils.plugins import load_plugin_from_source
+from spsdk.utils.schema_validator import check_config
+
+logger = logging.getLogger(__name__)
+
+
+@click.group(name="cert-block", no_args_is_help=True)
+def cert_block_group() -> None:  # pylint: disable=unused-argument
+    """Group of sub-commands related to certification block."""
+
+
+@cert_block_group.command(name="get-template", no_args_is_help=True)
+@spsdk_family_option(families=CertBlock.get_all_supported_families())
+@spsdk_output_option(force=True)
+def cert_block_get_template_command(output: str, family: str) -> None:
+    """Create template of configuration in YAML format."""
+    cert_block_get_template(output, family)
+
+
+def cert_block_get_template(output: str, family: str) -> None:
+    """Create template of configuration in YAML format."""
+    click.echo(f"Creating {output} template file.")
+    cert_block_class = CertBlock.get_cert_block_class(family)
+    write_file(cert_block_class.generate_config_template(family), output)
+
+
+@cert_block_group.command(name="export", no_args_is_help=True)
+@spsdk_config_option(required=True)
+@spsdk_family_option(families=CertBlock.get_all_supported_families())
+@spsdk_plugin_option
+def cert_block_export_command(config: str, family: str, plugin: str) -> None:
+    """Generate Certificate Block from YAML/JSON configuration.
+
+    The configuration template files could be generated by subcommand 'get-template'.
+    """
+    cert_block_export(config, family, plugin)
+
+
+def cert_block_export(config: str, family: str, plugin: Optional[str] = None) -> None:
+    """Generate Certificate Block from YAML/JSON configuration."""
+    if plugin:
+        load_plugin_from_source(plugin)
+    config_data = load_configuration(config)
+    config_data["family"] = family
+    config_dir = os.path.dirname(config)
+    cert_block_class = CertBlock.get_cert_block_class(family)
+    schemas = cert_block_class.get_validation_schemas()
+    check_config(config_data, schemas, search_paths=[config_dir])
+    cert_block = cert_block_class.from_config(config_data, search_paths=[config_dir])
+    cert_data = cert_block.export()
+
+    try:
+        cert_block_output_file_path = get_abs_path(config_data["containerOutputFile"], config_dir)
+    except KeyError as e:
+        raise SPSDKAppError(
+            "containerOutputFile property must be provided in order to export cert-block"
+        ) from e
+    write_file(cert_data, cert_block_output_file_path, mode="wb")
+
+    if cert_block.rkth:
+        click.echo(f"RKTH: {cert_block.rkth.hex()}")
+    if hasattr(cert_block, "cert_hash"):
+        assert isinstance(cert_block, CertBlockVx), "Wrong instance of cert block"
+        click.echo(f"ISK Certificate hash [0:127]: {cert_block.cert_hash.hex()}\n")
+        otp_script_path = os.path.join(
+            os.path.dirname(cert_block_output_file_path), "otp_script.bcf"
+        )
+        write_file(cert_block.get_otp_script(), otp_script_path)
+        click.echo(f"OTP script written to: {otp_script_path}")
+    click.echo(f"Success. (Certificate Block: {cert_block_output_file_path} created.)")
+
+
+@cert_block_group.command(name="parse", no_args_is_help=True)
+@click.option(
+    "-b",
+    "--binary",
+    type=click.Path(exists=True, readable=True, resolve_path=True),
+    required=True,
+    help="Path to binary Certificate Block image to parse.",
+)
+@spsdk_family_option(families=CertBlock.get_all_supported_families())
+@spsdk_output_option(directory=True)
+def cert_block_parse_command(binary: str, family: str, output: str) -> None:
+    """Parse Certificate Block.
+
+    RoTKTH is printed out in verbose mode.
+    """
+    cert_block_parse(binary, family, output)
+
+
+# pylint: disable=unused-argument  # preparation for future updates
+def cert_block_parse(binary: str, family: str, output: str) -> None:
+    """Parse Certificate Block."""
+    cert_block = CertBlock.get_cert_block_class(family).parse(load_binary(binary))
+    logger.info(str(cert_block))
+    write_file(cert_block.create_config(output), os.path.join(output, "cert_block_config.yaml"))
+    click.echo(f"RKTH: {cert_block.rkth.hex()}")
+    click.echo(f"Success. (Certificate Block: {binary} has been parsed into {output}.)")
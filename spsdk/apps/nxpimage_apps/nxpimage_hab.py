@@ -0,0 +1,155 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+#
+# Copyright 2022-2024 NXP
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""NXP MCU Image tool - HAB sub-commands."""
+import os
+from typing import List, Optional
+
+import click
+
+from spsdk.apps.utils.common_cli_options import spsdk_output_option, spsdk_plugin_option
+from spsdk.apps.utils.utils import SPSDKAppError
+from spsdk.exceptions import SPSDKError
+from spsdk.image.hab import segments as hab_segments
+from spsdk.image.hab.hab_container import HabContainer
+from spsdk.sbfile.sb2 import sly_bd_parser as bd_parser
+from spsdk.utils.misc import load_binary, load_text, write_file
+from spsdk.utils.plugins import load_plugin_from_source
+from spsdk.utils.schema_validator import CommentedConfig, check_config
+
+
+@click.group(name="hab", no_args_is_help=True)
+def hab_group() -> None:  # pylint: disable=unused-argument
+    """Group of sub-commands related to HAB container."""
+
+
+@hab_group.command(name="get-template", no_args_is_help=True)
+@spsdk_output_option(force=True)
+def hab_get_template_command(output: str) -> None:
+    """Create template of configuration in YAML format."""
+    hab_get_template(output)
+
+
+def hab_get_template(output: str) -> None:
+    """Create template of configuration in YAML format."""
+    click.echo(f"Creating {output} template file.")
+    write_file(HabContainer.generate_config_template(), output)
+
+
+@hab_group.command(name="export", no_args_is_help=True)
+@click.option(
+    "-c",
+    "--command",
+    type=click.Path(exists=True),
+    required=True,
+    help="BD or YAML configuration file to produce HAB container",
+)
+@spsdk_output_option()
+@click.argument("external", type=click.Path(), nargs=-1)
+@spsdk_plugin_option
+def hab_export_command(
+    command: str,
+    output: str,
+    external: Optional[List[str]] = None,
+    plugin: Optional[str] = None,
+) -> None:
+    """Generate HAB container from configuration.
+
+    EXTERNAL is a space separated list of external binary files defined in BD file
+    """
+    image = hab_export(command, external, plugin)
+    write_file(image, output, mode="wb")
+    click.echo(f"Success. (HAB container: {output} created.)")
+
+
+def hab_export(command: str, external: Optional[List[str]], plugin: Optional[str] = None) -> bytes:
+    """Generate HAB container from configuration."""
+    if plugin:
+        load_plugin_from_source(plugin)
+    search_paths = [os.path.dirname(command)]
+    config = HabContainer.load_configuration(command, external, search_paths=search_paths)
+    hab = HabContainer.load_from_config(config, search_paths=search_paths)
+    return hab.export()
+
+
+@hab_group.command(name="convert", no_args_is_help=True)
+@click.option(
+    "-c",
+    "--command",
+    type=click.Path(exists=True),
+    required=True,
+    help="BD configuration file for conversion to YAML",
+)
+@spsdk_output_option()
+@click.argument("external", type=click.Path(), nargs=-1)
+def hab_convert_command(
+    command: str,
+    output: str,
+    external: List[str],
+) -> None:
+    """Convert BD Configuration to YAML.
+
+    EXTERNAL is a space separated list of external binary files defined in BD file
+    """
+    configuration = hab_convert(command, external)
+    write_file(configuration, output, mode="w")
+    click.echo(f"Success. (HAB Configuration converted to YAML: {output})")
+
+
+def hab_convert(command: str, external: List[str]) -> str:
+    """Convert HAB BD configuration to YAML configuration."""
+    try:
+        parser = bd_parser.BDParser()
+
+        bd_file_content = load_text(command)
+        bd_data = parser.parse(text=bd_file_content, extern=external)
+
+        if not bd_data:
+            raise SPSDKError("Invalid bd file, generation terminated")
+
+        config = HabContainer.transform_configuration(bd_data)
+        schemas = HabContainer.get_validation_schemas()
+        check_config(bd_data, schemas)
+        ret = CommentedConfig(main_title="HAB converted configuration", schemas=schemas).get_config(
+            config
+        )
+        return ret
+
+    except SPSDKError as exc:
+        raise SPSDKAppError(f"The conversion failed: ({str(exc)}).") from exc
+
+
+@hab_group.command(name="parse", no_args_is_help=True)
+@click.option(
+    "-b",
+    "--binary",
+    type=click.Path(exists=True, readable=True, resolve_path=True),
+    required=True,
+    help="Path to binary HAB image to parse.",
+)
+@spsdk_output_option(directory=True)
+def hab_parse_command(binary: str, output: str) -> None:
+    """Parse HAB container into individual segments."""
+    file_bin = load_binary(binary)
+    created_files = hab_parse(file_bin, output)
+    for file_path in created_files:
+        click.echo(f"File has been created: {file_path}")
+    click.echo(f"Success. (HAB container parsed into: {output}.)")
+
+
+def hab_parse(binary: bytes, output: str) -> List[str]:
+    """Generate HAB container from configuration."""
+    hab_container = HabContainer.parse(binary)
+    generated_bins = []
+    for seg_name in hab_segments.SEGMENTS_MAPPING.keys():
+        segment = hab_container.get_segment(seg_name)
+        if segment:
+            seg_data = segment.export()
+            seg_out = os.path.join(output, f"{seg_name.label}.bin")
+            write_file(seg_data, seg_out, mode="wb")
+            generated_bins.append(seg_out)
+    return generated_bins
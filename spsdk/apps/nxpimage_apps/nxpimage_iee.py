@@ -0,0 +1,125 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+#
+# Copyright 2022-2024 NXP
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""NXP MCU Image tool - IEE sub-commands."""
+import logging
+import os
+
+import click
+
+from spsdk.apps.utils.common_cli_options import (
+    spsdk_config_option,
+    spsdk_family_option,
+    spsdk_output_option,
+)
+from spsdk.apps.utils.utils import INT, filepath_from_config
+from spsdk.utils.crypto.iee import IeeNxp
+from spsdk.utils.database import DatabaseManager
+from spsdk.utils.misc import get_abs_path, load_configuration, write_file
+from spsdk.utils.schema_validator import check_config
+
+logger = logging.getLogger(__name__)
+
+
+@click.group(name="iee", no_args_is_help=True)
+def iee_group() -> None:  # pylint: disable=unused-argument
+    """Group of sub-commands related to IEE."""
+
+
+@iee_group.command(name="export", no_args_is_help=True)
+@spsdk_config_option(required=True)
+@click.option(
+    "-j",
+    "--processes",
+    type=INT(),
+    default="1",
+    help="How many processes to use for AES-XTS encryption of big images; "
+    f"0 to use cpu_count: {os.cpu_count()}",
+)
+def iee_export_command(config: str, processes: int) -> None:
+    """Generate IEE Images from YAML/JSON configuration.
+
+    The configuration template files could be generated by subcommand 'get-template'.
+    """
+    iee_export(config, processes)
+
+
+def iee_export(config: str, processes: int = 1) -> None:
+    """Generate IEE Images from YAML/JSON configuration."""
+    config_data = load_configuration(config)
+    config_dir = os.path.dirname(config)
+    check_config(config_data, IeeNxp.get_validation_schemas_family(), search_paths=[config_dir])
+    family = config_data["family"]
+    schemas = IeeNxp.get_validation_schemas(family)
+    check_config(config_data, schemas, search_paths=[config_dir])
+    iee = IeeNxp.load_from_config(
+        config_data, config_dir, search_paths=[config_dir], max_processes=processes or None
+    )
+
+    output_folder = get_abs_path(config_data["output_folder"], config_dir)
+    iee_all = filepath_from_config(config_data, "output_name", "iee_whole_image", output_folder)
+    keyblob_name = filepath_from_config(
+        config_data, "keyblob_name", "iee_keyblob", config_dir, output_folder
+    )
+
+    binary_image = iee.binary_image(keyblob_name=keyblob_name, image_name=iee_all)
+    logger.info(binary_image.draw())
+
+    if iee_all == "":
+        logger.info("Skipping export of IEE whole image")
+    else:
+        write_file(binary_image.export(), iee_all, mode="wb")
+        click.echo(f"Created IEE Image containing keyblobs and encrypted data:\n{iee_all}")
+
+    memory_map = (
+        "Output folder contains:\n"
+        "  -  Binary file that contains whole image data including "
+        f"IEE key blobs data {iee_all}.\n"
+        f"IEE memory map:\n{binary_image.draw(no_color=True)}"
+    )
+
+    for image in binary_image.sub_images:
+        if image.name != "":
+            write_file(image.export(), image.name, mode="wb")
+            logger.info(f"Created Encrypted IEE data blob {image.description}:\n{image.name}")
+            memory_map += f"\n{image.name}:\n{str(image)}"
+        else:
+            logger.info(
+                f"Skipping export of {str(image)}, value is blank in the configuration file"
+            )
+
+    readme_file = os.path.join(output_folder, "readme.txt")
+
+    if config_data.get("generate_readme", True):
+        write_file(memory_map, readme_file)
+        logger.info(f"Created IEE readme file:\n{readme_file}")
+    else:
+        logger.info("Skipping generation of IEE readme file")
+
+    if iee.db.get_bool(DatabaseManager.IEE, "has_kek_fuses") and config_data.get(
+        "generate_fuses_script"
+    ):
+        blhost_script = iee.get_blhost_script_otp_kek()
+        blhost_script_filename = os.path.join(output_folder, f"iee_{iee.family}_blhost.bcf")
+        write_file(blhost_script, blhost_script_filename)
+        click.echo(f"Created IEE BLHOST load fuses script:\n{blhost_script_filename}")
+    else:
+        logger.info("Skipping generation of IEE BLHOST load fuses script")
+
+    click.echo("Success. IEE files have been created")
+
+
+@iee_group.command(name="get-template", no_args_is_help=True)
+@spsdk_family_option(families=IeeNxp.get_supported_families())
+@spsdk_output_option(force=True)
+def iee_get_template(family: str, output: str) -> None:
+    """Create template of configuration in YAML format.
+
+    The template file name is specified as argument of this command.
+    """
+    click.echo(f"Creating {output} template file.")
+    write_file(IeeNxp.generate_config_template(family)[f"{family}_iee"], output)
@@ -0,0 +1,132 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+#
+# Copyright 2022-2024 NXP
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""NXP MCU Image tool - Master Boot Image sub-commands."""
+import datetime
+import os
+from typing import Optional
+
+import click
+
+from spsdk.apps.utils.common_cli_options import (
+    spsdk_config_option,
+    spsdk_family_option,
+    spsdk_output_option,
+    spsdk_plugin_option,
+)
+from spsdk.image.mbi.mbi import (
+    MasterBootImage,
+    get_mbi_class,
+    mbi_generate_config_templates,
+    mbi_get_supported_families,
+)
+from spsdk.utils.misc import get_abs_path, load_binary, load_configuration, write_file
+from spsdk.utils.plugins import load_plugin_from_source
+from spsdk.utils.schema_validator import CommentedConfig, check_config
+
+
+@click.group(name="mbi", no_args_is_help=True)
+def mbi_group() -> None:
+    """Group of sub-commands related to Master Boot Images."""
+
+
+@mbi_group.command(name="export", no_args_is_help=True)
+@spsdk_config_option(required=True)
+@spsdk_plugin_option
+def mbi_export_command(config: str, plugin: str) -> None:
+    """Generate Master Boot Image from YAML/JSON configuration.
+
+    The configuration template files could be generated by subcommand 'get-templates'.
+    """
+    mbi_export(config, plugin)
+
+
+def mbi_export(config: str, plugin: Optional[str] = None) -> None:
+    """Generate Master Boot Image from YAML/JSON configuration.
+
+    :param config: Path to the YAML/JSON configuration
+    :param plugin: Path to external python file containing a custom SignatureProvider implementation.
+    """
+    config_data = load_configuration(config)
+    if plugin:
+        load_plugin_from_source(plugin)
+    config_dir = os.path.dirname(config)
+    mbi_cls = get_mbi_class(config_data)
+    check_config(config_data, mbi_cls.get_validation_schemas(), search_paths=[config_dir, "."])
+    mbi_obj = mbi_cls()
+    mbi_obj.load_from_config(config_data, search_paths=[config_dir, "."])
+    mbi_data = mbi_obj.export()
+    if mbi_obj.rkth:
+        click.echo(f"RKTH: {mbi_obj.rkth.hex()}")
+    mbi_output_file_path = get_abs_path(config_data["masterBootOutputFile"], config_dir)
+    write_file(mbi_data, mbi_output_file_path, mode="wb")
+
+    click.echo(f"Success. (Master Boot Image: {mbi_output_file_path} created.)")
+
+
+@mbi_group.command(name="parse", no_args_is_help=True)
+@spsdk_family_option(families=mbi_get_supported_families())
+@click.option(
+    "-b",
+    "--binary",
+    type=click.Path(exists=True, readable=True, resolve_path=True),
+    required=True,
+    help="Path to binary MBI image to parse.",
+)
+@click.option(
+    "-k",
+    "--dek",
+    type=str,
+    required=False,
+    help=(
+        "Data encryption key, if it's specified, the parse method tries decrypt all encrypted images. "
+        "It could be specified as binary/HEX text file path or directly HEX string"
+    ),
+)
+@spsdk_output_option(directory=True)
+def mbi_parse_command(family: str, binary: str, dek: str, output: str) -> None:
+    """Parse MBI Image into YAML configuration and binary images."""
+    mbi_parse(family, binary, dek, output)
+
+
+def mbi_parse(family: str, binary: str, dek: str, output: str) -> None:
+    """Parse MBI Image into YAML configuration and binary images."""
+    mbi = MasterBootImage.parse(family=family, data=load_binary(binary), dek=dek)
+
+    if not mbi:
+        click.echo(f"Failed. (MBI: {binary} parsing failed.)")
+        return
+
+    cfg = mbi.create_config(output_folder=output)
+    yaml_data = CommentedConfig(
+        main_title=(
+            f"Master Boot Image ({mbi.__class__.__name__}) recreated configuration from :"
+            f"{datetime.datetime.now().strftime('%d/%m/%Y %H:%M:%S')}."
+        ),
+        schemas=mbi.get_validation_schemas(),
+    ).get_config(cfg)
+
+    write_file(yaml_data, os.path.join(output, "mbi_config.yaml"))
+
+    click.echo(f"Success. (MBI: {binary} has been parsed and stored into {output} )")
+
+
+@mbi_group.command(name="get-templates", no_args_is_help=True)
+@spsdk_family_option(families=mbi_get_supported_families())
+@spsdk_output_option(directory=True, force=True)
+def mbi_get_templates_command(family: str, output: str) -> None:
+    """Create template of MBI configurations in YAML format."""
+    mbi_get_templates(family, output)
+
+
+def mbi_get_templates(family: str, output: str) -> None:
+    """Create template of MBI configurations in YAML format."""
+    templates = mbi_generate_config_templates(family)
+    for file_name, template in templates.items():
+        full_file_name = os.path.join(output, file_name + ".yaml")
+        click.echo(f"Creating {full_file_name} template file.")
+        write_file(template, full_file_name)
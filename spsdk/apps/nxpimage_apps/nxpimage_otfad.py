@@ -0,0 +1,234 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+#
+# Copyright 2022-2024 NXP
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""NXP MCU Image tool - OTFAD sub-commands."""
+import logging
+import os
+from typing import Optional
+
+import click
+
+from spsdk.apps.utils.common_cli_options import (
+    spsdk_config_option,
+    spsdk_family_option,
+    spsdk_output_option,
+)
+from spsdk.apps.utils.utils import INT, filepath_from_config, store_key
+from spsdk.image.keystore import KeyStore
+from spsdk.utils.crypto.otfad import OtfadNxp
+from spsdk.utils.database import DatabaseManager
+from spsdk.utils.misc import get_abs_path, load_configuration, load_hex_string, write_file
+from spsdk.utils.schema_validator import check_config
+
+logger = logging.getLogger(__name__)
+
+
+@click.group(name="otfad", no_args_is_help=True)
+def otfad_group() -> None:
+    """Group of sub-commands related to OTFAD."""
+
+
+@otfad_group.command(name="export", no_args_is_help=True)
+@click.option(
+    "-a",
+    "--alignment",
+    default="512",
+    type=INT(),
+    help="Alignment of key blob data blocks. Default value is 512 B if not specified.",
+    required=False,
+)
+@click.option(
+    "-i",
+    "--index",
+    type=INT(),
+    help=(
+        "OTFAD peripheral index - This is needed to generate proper "
+        "indexes of fuses in optional BLHOST script. If not specified, BLHOST fuse script won't be generated"
+    ),
+    required=False,
+)
+@spsdk_config_option(required=True)
+def otfad_export_command(alignment: int, config: str, index: Optional[int] = None) -> None:
+    """Generate OTFAD Images from YAML/JSON configuration.
+
+    The configuration template files could be generated by subcommand 'get-template'.
+    """
+    otfad_export(alignment, config, index)
+
+
+def otfad_export(alignment: int, config: str, index: Optional[int] = None) -> None:
+    """Generate OTFAD Images from YAML/JSON configuration."""
+    config_data = load_configuration(config)
+    config_dir = os.path.dirname(config)
+    check_config(config_data, OtfadNxp.get_validation_schemas_family(), search_paths=[config_dir])
+    family = config_data["family"]
+    schemas = OtfadNxp.get_validation_schemas(family)
+    check_config(config_data, schemas, search_paths=[config_dir])
+    otfad = OtfadNxp.load_from_config(config_data, config_dir, search_paths=[config_dir])
+
+    output_folder = get_abs_path(config_data["output_folder"], config_dir)
+    otfad_table_name = filepath_from_config(
+        config_data, "keyblob_name", "OTFAD_Table", config_dir, output_folder
+    )
+    binary_image = otfad.binary_image(data_alignment=alignment, otfad_table_name=otfad_table_name)
+    logger.info(f" The OTFAD image structure:\n{binary_image.draw()}")
+    otfad_all = filepath_from_config(
+        config_data, "output_name", "otfad_whole_image", config_dir, output_folder
+    )
+    if otfad_all != "":
+        write_file(binary_image.export(), otfad_all, mode="wb")
+        logger.info(f"Created OTFAD Image:\n{otfad_all}")
+    else:
+        logger.info("Skipping export of OTFAD image")
+    sb21_supported = otfad.db.get_bool(DatabaseManager.OTFAD, "sb_21_supported", default=False)
+    memory_map = (
+        "In folder is stored two kind of files:\n"
+        "  -  Binary file that contains whole image data including "
+        "OTFAD table and key blobs data 'otfad_whole_image.bin'.\n"
+    )
+    if sb21_supported:
+        memory_map += "  -  Example of BD file to simplify creating the SB2.1 file from the OTFAD source files.\n"
+        bd_file_sources = "sources {"
+        bd_file_section0 = "section (0) {"
+
+    memory_map += (
+        "  -  Set of separated binary files, one with OTFAD table, and one for each used key blob.\n"
+        f"\nOTFAD memory map:\n{binary_image.draw(no_color=True)}"
+    )
+
+    for i, image in enumerate(binary_image.sub_images):
+        if image.name != "":
+            write_file(image.export(), image.name, mode="wb")
+            logger.info(f"Created OTFAD Image:\n{image.name}")
+            memory_map += f"\n{image.name}:\n{str(image)}"
+        else:
+            logger.info(
+                f"Skipping export of {str(image)}, value is blank in the configuration file"
+            )
+        if sb21_supported:
+            bd_file_sources += f'\n    image{i} = "{image.name}";'
+            bd_file_section0 += f"\n    // Load Image: {image.name}"
+            bd_file_section0 += f"\n    erase {hex(image.absolute_address)}..{hex(image.absolute_address+len(image))};"
+            bd_file_section0 += f"\n    load image{i} > {hex(image.absolute_address)}"
+
+    readme_file = os.path.join(output_folder, "readme.txt")
+
+    if config_data.get("generate_readme", True):
+        write_file(memory_map, readme_file)
+        logger.info(f"Created OTFAD readme file:\n{readme_file}")
+    else:
+        logger.info("Skipping generation of OTFAD readme file")
+
+    if sb21_supported:
+        bd_file_name = os.path.join(output_folder, "sb21_otfad_example.bd")
+        bd_file_sources += "\n}\n"
+        bd_file_section0 += "\n}\n"
+        bd_file = (
+            "options {\n"
+            "    flags = 0x8; // for sb2.1 use only 0x8 encrypted + signed\n"
+            "    buildNumber = 0x1;\n"
+            '    productVersion = "1.00.00";\n'
+            '    componentVersion = "1.00.00";\n'
+            '    secureBinaryVersion = "2.1";\n'
+            "}\n"
+        )
+        bd_file += bd_file_sources
+        bd_file += bd_file_section0
+
+        write_file(bd_file, bd_file_name)
+        logger.info(f"Created OTFAD BD file example:\n{bd_file_name}")
+
+    if otfad.db.get_bool(DatabaseManager.OTFAD, "has_kek_fuses", default=False) and index:
+        blhost_script = None
+        blhost_script = otfad.get_blhost_script_otp_kek(index)
+        if blhost_script:
+            blhost_script_filename = os.path.join(
+                output_folder, f"otfad{index}_{otfad.family}_blhost.bcf"
+            )
+            write_file(blhost_script, blhost_script_filename)
+            click.echo(f"Created OTFAD BLHOST load fuses script:\n{blhost_script_filename}")
+
+    click.echo("Success. OTFAD files have been created")
+
+
+@otfad_group.command(name="get-kek", no_args_is_help=False)
+@click.option(
+    "-m",
+    "--otp-master-key",
+    type=str,
+    help="OTP MASTER KEY in hexadecimal format or file name to binary or text file with key.",
+)
+@click.option(
+    "-k",
+    "--otfad-key",
+    type=str,
+    help="OTFAD KEY (OTFAD KEK seed) in hexadecimal format or file name to binary or text file with key.",
+)
+@spsdk_family_option(
+    families=OtfadNxp.get_supported_families(),
+    help=(
+        "Optional family, if specified, the tool generates the BLHOST scripts to load key fuses."
+        " To use this feature, the '-o' options has to be also defined!"
+    ),
+)
+@spsdk_output_option(
+    required=False,
+    directory=True,
+    help="Optional result output folder (otfad_kek.bin/txt, optionally BLHOST scripts to load keys into Fuses)",
+)
+def otfad_get_kek_command(otp_master_key: str, otfad_key: str, family: str, output: str) -> None:
+    """Compute OTFAD KEK value and optionally store it into folder in various formats.
+
+    The computed OTFAD KEK is shown in hexadecimal text, if the 'output-folder' is specified,
+    it is stored in folder also in binary format.
+    """
+    otfad_get_kek(otp_master_key, otfad_key, family, output)
+
+
+def otfad_get_kek(otp_master_key: str, otfad_key: str, family: str, output_folder: str) -> None:
+    """Compute OTFAD KEK value and optionally store it into folder in various formats."""
+    omk = load_hex_string(otp_master_key, KeyStore.OTP_MASTER_KEY_SIZE)
+    ok = load_hex_string(otfad_key, KeyStore.OTFAD_KEY_SIZE)  # pylint:disable=invalid-name
+
+    otfad_kek = KeyStore.derive_otfad_kek_key(omk, ok)
+
+    click.echo(f"OTP MASTER KEY: {omk.hex()}")
+    click.echo(f"OTFAD KEY:      {ok.hex()}")
+    click.echo(f"OTFAD KEK:      {otfad_kek.hex()}")
+
+    blhost_script = None
+    if family and family in OtfadNxp.get_supported_families():
+        blhost_script = OtfadNxp.get_blhost_script_otp_keys(
+            family, otp_master_key=omk, otfad_key_seed=ok
+        )
+        if not output_folder:
+            click.echo(f"OTFAD BLHOST load fuses script:\n{blhost_script}")
+
+    if output_folder:
+        store_key(os.path.join(output_folder, "otp_master_key"), omk)
+        store_key(os.path.join(output_folder, "otfad_key"), ok)
+        store_key(os.path.join(output_folder, "otfad_kek"), otfad_kek)
+        if blhost_script:
+            write_file(blhost_script, os.path.join(output_folder, "otfad_otp_fuses.bcf"))
+        click.echo(f"Result files has been stored into: {output_folder}")
+
+
+@otfad_group.command(name="get-template", no_args_is_help=True)
+@spsdk_family_option(families=OtfadNxp.get_supported_families())
+@spsdk_output_option(force=True)
+def otfad_get_template_command(family: str, output: str) -> None:
+    """Create template of configuration in YAML format.
+
+    The template file name is specified as argument of this command.
+    """
+    otfad_get_template(family, output)
+
+
+def otfad_get_template(family: str, output: str) -> None:
+    """Create template of configuration in YAML format."""
+    click.echo(f"Creating {output} template file.")
+    write_file(OtfadNxp.generate_config_template(family)[f"{family}_otfad"], output)
@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+#
+# Copyright 2022-2024 NXP
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""NXP MCU Image tool - Secure Binary 3.1 sub-commands."""
+import os
+from typing import Optional
+
+import click
+
+from spsdk.apps.utils.common_cli_options import (
+    spsdk_config_option,
+    spsdk_family_option,
+    spsdk_output_option,
+    spsdk_plugin_option,
+)
+from spsdk.apps.utils.utils import INT
+from spsdk.sbfile.sb31.images import SecureBinary31
+from spsdk.utils.misc import get_abs_path, load_configuration, write_file
+from spsdk.utils.plugins import load_plugin_from_source
+from spsdk.utils.schema_validator import check_config
+
+
+@click.group(name="sb31")
+def sb31_group() -> None:
+    """Group of sub-commands related to Secure Binary 3.1."""
+
+
+@sb31_group.command(name="export", no_args_is_help=True)
+@spsdk_config_option(required=True)
+@spsdk_plugin_option
+@click.option(
+    "--stream",
+    is_flag=True,
+    default=False,
+    help="Write the image directly into the output file without holding it whole in memory.",
+)
+@click.option(
+    "-j",
+    "--processes",
+    type=INT(),
+    default="1",
+    help="How many processes to use for encryption of big SB files; "
+    f"0 to use cpu_count: {os.cpu_count()}",
+)
+def sb31_export_command(config: str, plugin: str, stream: bool, processes: int) -> None:
+    """Generate Secure Binary v3.1 Image from YAML/JSON configuration.
+
+    SB3KDK is printed out in verbose mode.
+
+    The configuration template files could be generated by subcommand 'get-template'.
+    """
+    sb31_export(config, plugin, stream, processes)
+
+
+def sb31_export(
+    config: str, plugin: Optional[str] = None, stream: bool = False, processes: int = 1
+) -> None:
+    """Generate Secure Binary v3.1 Image from YAML/JSON configuration."""
+    if plugin:
+        load_plugin_from_source(plugin)
+    config_data = load_configuration(config)
+    config_dir = os.path.dirname(config)
+    check_config(config_data, SecureBinary31.get_validation_schemas_family())
+    schemas = SecureBinary31.get_validation_schemas(config_data["family"])
+    check_config(config_data, schemas, search_paths=[config_dir])
+    sb3 = SecureBinary31.load_from_config(
+        config_data, search_paths=[config_dir, "."], max_processes=processes or None
+    )
+
+    sb3_output_file_path = get_abs_path(config_data["containerOutputFile"], config_dir)
+    if stream:
+        os.makedirs(os.path.dirname(sb3_output_file_path), exist_ok=True)
+        with open(sb3_output_file_path, "wb") as f:
+            sb3.write_to(f)
+    else:
+        write_file(sb3.export(), sb3_output_file_path, mode="wb")
+
+    click.echo(f"RKTH: {sb3.cert_block.rkth.hex()}")
+    click.echo(f"Success. (Secure binary 3.1: {sb3_output_file_path} created.)")
+
+
+@sb31_group.command(name="get-template", no_args_is_help=True)
+@spsdk_family_option(families=SecureBinary31.get_supported_families())
+@spsdk_output_option(force=True)
+def sb31_get_template_command(family: str, output: str) -> None:
+    """Create template of configuration in YAML format.
+
+    The template file name is specified as argument of this command.
+    """
+    sb31_get_template(family, output)
+
+
+def sb31_get_template(family: str, output: str) -> None:
+    """Create template of configuration in YAML format."""
+    click.echo(f"Creating {output} template file.")
+    write_file(SecureBinary31.generate_config_template(family)[f"{family}_sb31"], output)
@@ -0,0 +1,129 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+#
+# Copyright 2022-2024 NXP
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""NXP MCU Image tool - Signed Message sub-commands."""
+import datetime
+import logging
+import os
+from typing import Optional
+
+import click
+
+from spsdk.apps.utils.common_cli_options import (
+    spsdk_config_option,
+    spsdk_family_option,
+    spsdk_output_option,
+    spsdk_plugin_option,
+)
+from spsdk.exceptions import SPSDKError
+from spsdk.image.ahab.ahab_container import AHABImage
+from spsdk.image.ahab.signed_msg import MessageCommands, SignedMessage
+from spsdk.utils.misc import get_abs_path, load_binary, load_configuration, write_file
+from spsdk.utils.plugins import load_plugin_from_source
+from spsdk.utils.schema_validator import CommentedConfig, check_config
+
+logger = logging.getLogger(__name__)
+
+
+@click.group(name="signed-msg", no_args_is_help=True)
+def signed_msg() -> None:  # pylint: disable=unused-argument
+    """Group of sub-commands related to Signed messages."""
+
+
+@signed_msg.command(name="export", no_args_is_help=True)
+@spsdk_config_option(required=True)
+@spsdk_plugin_option
+def signed_msg_export(config: str, plugin: str) -> None:
+    """Generate Signed message Image from YAML/JSON configuration.
+
+    The configuration template files could be generated by subcommand 'get-template'.
+    """
+    if plugin:
+        load_plugin_from_source(plugin)
+    config_data = load_configuration(config)
+    config_dir = os.path.dirname(config)
+    schemas = SignedMessage.get_validation_schemas()
+    check_config(config_data, schemas, search_paths=[config_dir])
+    smsg = SignedMessage.load_from_config(config_data, search_paths=[config_dir])
+
+    signed_msg_data = smsg.export()
+
+    signed_msg_output_file_path = get_abs_path(config_data["output"], config_dir)
+    write_file(signed_msg_data, signed_msg_output_file_path, mode="wb")
+
+    logger.info(f"Created Signed message Image:\n{str(smsg.image_info())}")
+    logger.info(f"Created Signed message Image memory map:\n{smsg.image_info().draw()}")
+    click.echo(f"Success. (Signed message: {signed_msg_output_file_path} created.)")
+
+
+@signed_msg.command(name="parse", no_args_is_help=True)
+@click.option(
+    "-b",
+    "--binary",
+    type=click.Path(exists=True, readable=True, resolve_path=True),
+    required=True,
+    help="Path to binary Signed message image to parse.",
+)
+@spsdk_output_option(directory=True)
+def signed_msg_parse(binary: str, output: str) -> None:
+    """Parse Signed message Image into YAML configuration and binary images."""
+    if not os.path.exists(output):
+        os.makedirs(output, exist_ok=True)
+    try:
+        signed_message = SignedMessage.parse(load_binary(binary))
+        signed_message.update_fields()
+        signed_message.validate({})
+    except SPSDKError as exc:
+        click.echo(f"Signed message parsing failed: {binary} ,({str(exc)})")
+        return
+
+    logger.info(f"Parsed Signed message image memory map: {signed_message.image_info().draw()}")
+
+    config = signed_message.create_config(output)
+    yaml_config = CommentedConfig(
+        main_title=(
+            f"Signed Message recreated configuration from :"
+            f"{datetime.datetime.now().strftime('%d/%m/%Y %H:%M:%S')}."
+        ),
+        schemas=SignedMessage.get_validation_schemas(),
+    ).get_config(config)
+
+    write_file(
+        yaml_config,
+        os.path.join(output, "parsed_config.yaml"),
+    )
+    click.echo(f"Success. (Signed message: {binary} has been parsed and stored into {output}.)")
+    srk_table = signed_message.signature_block.srk_table
+    file_name = os.path.join(output, f"{signed_message.flag_srk_set}_srk_hash")
+    if srk_table:
+        srkh = srk_table.compute_srk_hash()
+        write_file(srkh.hex().upper(), f"{file_name}.txt")
+        click.echo(f"Generated SRK hash files ({file_name}*.*).")
+
+
+@signed_msg.command(name="get-template", no_args_is_help=True)
+@spsdk_family_option(families=AHABImage.get_supported_families())
+@click.option(
+    "-m",
+    "--message",
+    required=False,
+    type=click.Choice(MessageCommands.labels()),
+    help="Select only one signed message to generate specific template if needed",
+)
+@spsdk_output_option(force=True)
+def signed_msg_get_template(family: str, message: Optional[str], output: str) -> None:
+    """Create template of configuration in YAML format.
+
+    The template file name is specified as argument of this command.
+    """
+    click.echo(f"Creating {output} template file.")
+    write_file(
+        SignedMessage.generate_config_template(
+            family, MessageCommands.from_attr(message) if message else None
+        )[f"{family}_signed_msg"],
+        output,
+    )
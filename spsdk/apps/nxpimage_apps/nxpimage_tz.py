@@ -0,0 +1,76 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+#
+# Copyright 2022-2024 NXP
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""NXP MCU Image tool - TrustZone sub-commands."""
+import os
+
+import click
+
+from spsdk.apps.utils.common_cli_options import (
+    spsdk_config_option,
+    spsdk_family_option,
+    spsdk_output_option,
+)
+from spsdk.image.trustzone import TrustZone
+from spsdk.utils.misc import get_abs_path, load_configuration, write_file
+from spsdk.utils.schema_validator import check_config
+
+
+@click.group(name="tz", no_args_is_help=True)
+def tz_group() -> None:
+    """Group of sub-commands related to Trust Zone."""
+
+
+@tz_group.command(name="export", no_args_is_help=True)
+@spsdk_config_option(required=True)
+def tz_export_command(config: str) -> None:
+    """Generate TrustZone Image from YAML/JSON configuration.
+
+    The configuration template files could be generated by subcommand 'get-template'.
+    """
+    tz_export(config)
+
+
+def tz_export(config: str) -> None:
+    """Generate TrustZone Image from YAML/JSON configuration."""
+    config_data = load_configuration(config)
+    config_dir = os.path.dirname(config)
+    check_config(config_data, TrustZone.get_validation_schemas_family())
+    check_config(
+        config_data,
+        TrustZone.get_validation_schemas(config_data["family"]),
+        search_paths=[config_dir],
+    )
+    trust_zone = TrustZone.from_config(config_data)
+    tz_data = trust_zone.export()
+    output_file = get_abs_path(config_data["tzpOutputFile"], config_dir)
+    write_file(tz_data, output_file, mode="wb")
+    click.echo(f"Success. (Trust Zone binary: {output_file} created.)")
+
+
+@tz_group.command(name="get-template", no_args_is_help=True)
+@spsdk_family_option(families=TrustZone.get_supported_families())
+@click.option(
+    "-r",
+    "--revision",
+    type=str,
+    default="latest",
+    help="Chip revision; if not specified, most recent one will be used",
+)
+@spsdk_output_option(force=True)
+def tz_get_template_command(family: str, revision: str, output: str) -> None:
+    """Create template of configuration in YAML format.
+
+    The template file name is specified as argument of this command.
+    """
+    tz_get_template(family, revision, output)
+
+
+def tz_get_template(family: str, revision: str, output: str) -> None:
+    """Create template of configuration in YAML format."""
+    click.echo(f"Creating {output} template file.")
+    write_file(TrustZone.generate_config_template(family, revision)[f"{family}_tz"], output)
@@ -10,73 +10,98 @@
 Its purpose is to provide easier discoverability.
 New users may not be aware of all available apps.
 """
+import importlib.util
 import sys
-from typing import Any
+from typing import Any, Dict, Tuple
 
 import click
 
 from spsdk import __version__ as spsdk_version
 from spsdk.apps.utils.common_cli_options import CommandsTreeGroup
-from spsdk.exceptions import SPSDKError
-from spsdk.utils.database import DatabaseManager
-
-from .blhost import main as blhost_main
-from .dk6prog import main as dk6prog_main
-from .ifr import main as ifr_main
-from .nxpcrypto import main as nxpcrypto_main
-from .nxpdebugmbox import main as nxpdebugmbox_main
-from .nxpdevhsm import main as nxpdevhsm_main
-from .nxpdevscan import main as nxpdevscan_main
-from .nxpele import main as nxpele_main
-from .nxpimage import main as nxpimage_main
-from .nxpmemcfg import main as nxpmemcfg_main
-from .nxpwpc import main as nxpwpc_main
-from .pfr import main as pfr_main
-from .sdphost import main as sdphost_main
-from .sdpshost import main as sdpshost_main
-from .shadowregs import main as shadowregs_main
-
-try:
-    TP = True
-    from .tpconfig import main as tpconfig_main
-    from .tphost import main as tphost_main
-except SPSDKError:
-    TP = False
-from .utils.utils import catch_spsdk_error
-
-
-@click.group(name="spsdk", no_args_is_help=True, cls=CommandsTreeGroup)
-@click.version_option(spsdk_version, "--version")
-def main() -> int:
-    """Main entry point for all SPSDK applications."""
-    return 0
-
-
-main.add_command(blhost_main, name="blhost")
-main.add_command(ifr_main, name="ifr")
-main.add_command(nxpcrypto_main, name="nxpcrypto")
-main.add_command(nxpdebugmbox_main, name="nxpdebugmbox")
-main.add_command(nxpdevscan_main, name="nxpdevscan")
-main.add_command(nxpdevhsm_main, name="nxpdevhsm")
-main.add_command(nxpele_main, name="nxpele")
-main.add_command(nxpimage_main, name="nxpimage")
-main.add_command(nxpmemcfg_main, name="nxpmemcfg")
-main.add_command(nxpwpc_main, name="nxpwpc")
-main.add_command(pfr_main, name="pfr")
-main.add_command(sdphost_main, name="sdphost")
-main.add_command(sdpshost_main, name="sdpshost")
-main.add_command(shadowregs_main, name="shadowregs")
-main.add_command(dk6prog_main, name="dk6prog")
-
+from spsdk.apps.utils.utils import catch_spsdk_error
+
+# Application name: (import path, short help), applications are imported just when invoked
+SPSDK_APPS: Dict[str, Tuple[str, str]] = {
+    "blhost": (
+        "spsdk.apps.blhost:main",
+        "Utility for communication with the bootloader on target.",
+    ),
+    "ifr": (
+        "spsdk.apps.ifr:main",
+        "Utility for generating and parsing IFR. "
+        "Please note that IFR0 ROMCFG region is one-time-programmable only.",
+    ),
+    "nxpcrypto": (
+        "spsdk.apps.nxpcrypto:main",
+        "Collection of utilities for cryptographic operations.",
+    ),
+    "nxpdebugmbox": ("spsdk.apps.nxpdebugmbox:main", "Tool for working with Debug Mailbox."),
+    "nxpdevscan": (
+        "spsdk.apps.nxpdevscan:main",
+        "Utility listing all connected NXP USB and UART devices.",
+    ),
+    "nxpdevhsm": (
+        "spsdk.apps.nxpdevhsm:main",
+        "Nxpdevhsm application is designed to create SB3 provisioning file "
+        "for initial provisioning of device by OEM.",
+    ),
+    "nxpele": (
+        "spsdk.apps.nxpele:main",
+        "Utility for communication with the EdgeLock Enclave on target over BLHOST.",
+    ),
+    "nxpgang": (
+        "spsdk.apps.nxpgang:main",
+        "Utility for programming multiple targets at once via the bootloader.",
+    ),
+    "nxpimage": ("spsdk.apps.nxpimage:main", "NXP Image tool."),
+    "nxpmemcfg": (
+        "spsdk.apps.nxpmemcfg:main",
+        "Collection of utilities for memory configuration operations.",
+    ),
+    "nxpwpc": ("spsdk.apps.nxpwpc:main", "Utility covering WPC operations."),
+    "pfr": (
+        "spsdk.apps.pfr:main",
+        "Utility for generating and parsing Protected Flash Region data (CMPA, CFPA).",
+    ),
+    "sdphost": (
+        "spsdk.apps.sdphost:main",
+        "Utility for communication with ROM on i.MX targets using SDP protocol.",
+    ),
+    "sdpshost": (
+        "spsdk.apps.sdpshost:main",
+        "Utility for communication with ROM on i.MX targets using SDPS protocol (i.MX8/9).",
+    ),
+    "shadowregs": ("spsdk.apps.shadowregs:main", "NXP Shadow Registers control Tool."),
+    "dk6prog": (
+        "spsdk.apps.dk6prog:main",
+        "Tool for reading and programming flash memory of DK6 target devices.",
+    ),
+}
+
+# Trust provisioning applications require pyscard package from 'tp' extras
+TP = importlib.util.find_spec("smartcard") is not None
 if TP:
-    main.add_command(tpconfig_main, name="tpconfig")
-    main.add_command(tphost_main, name="tphost")
+    SPSDK_APPS["tpconfig"] = (
+        "spsdk.apps.tpconfig:main",
+        "Application for configuration of trusted device.",
+    )
+    SPSDK_APPS["tphost"] = (
+        "spsdk.apps.tphost:main",
+        "Application to secure Trust provisioning process.",
+    )
 else:
     click.echo(
         "Please install SPSDK with pip install 'spsdk[tp]' in order to use tphost and tpconfig apps"
     )
 
 
+@click.group(name="spsdk", no_args_is_help=True, cls=CommandsTreeGroup, lazy_commands=SPSDK_APPS)
+@click.version_option(spsdk_version, "--version")
+def main() -> int:
+    """Main entry point for all SPSDK applications."""
+    return 0
+
+
 @main.command(name="clear-cache")
 @click.pass_context
 def clear_cache(ctx: click.Context) -> None:
@@ -84,6 +109,9 @@ def clear_cache(ctx: click.Context) -> None:
 
     :param ctx: Click content
     """
+    # pylint: disable=import-outside-toplevel
+    from spsdk.utils.database import DatabaseManager
+
     DatabaseManager.clear_cache()
     click.echo("SPSDK cache has been cleared.")
     ctx.exit()
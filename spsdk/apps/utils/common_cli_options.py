@@ -1,19 +1,20 @@
 #!/usr/bin/env python
 # -*- coding: UTF-8 -*-
 #
-# Copyright 2020-2023 NXP
+# Copyright 2020-2024 NXP
 #
 # SPDX-License-Identifier: BSD-3-Clause
 
 """CLI helper for Click."""
 
+import importlib
 import logging
 import os
 from gettext import gettext
 from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, TypeVar, Union
 
 import click
-from click_command_tree import _build_command_tree, _CommandWrapper
+from click_command_tree import _CommandWrapper
 
 from spsdk import __version__ as spsdk_version
 
@@ -374,11 +375,47 @@ def isp_interfaces(
 class CommandsTreeGroup(click.Group):
     """Custom help formatter, overrides click.Group standard formatter.
 
-    Provides command section in help as command tree
-
-    :param click: click.Group
+    Provides command section in help as command tree.
+    Sub-commands could be also registered lazily by import path of their module,
+    the module is imported just when the sub-command is invoked or its help is requested.
     """
 
+    def __init__(
+        self,
+        *args: Any,
+        lazy_commands: Optional[Dict[str, Tuple[str, str]]] = None,
+        **kwargs: Any,
+    ) -> None:
+        """Constructor of commands tree group.
+
+        :param lazy_commands: Lazily loaded sub-commands; name: (import path, short help),
+            the import path is in format 'module:attribute'
+        """
+        super().__init__(*args, **kwargs)
+        self.lazy_commands = lazy_commands or {}
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        """Get names of all sub-commands including the not loaded ones.
+
+        :param ctx: click Context
+        :return: Sorted list of sub-command names
+        """
+        return sorted(set(self.commands) | set(self.lazy_commands))
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        """Get sub-command, import its module if it's not loaded yet.
+
+        :param ctx: click Context
+        :param cmd_name: Name of sub-command
+        :return: Sub-command, None if it doesn't exist
+        """
+        if cmd_name not in self.commands and cmd_name in self.lazy_commands:
+            module_name, attr_name = self.lazy_commands[cmd_name][0].split(":")
+            command = getattr(importlib.import_module(module_name), attr_name)
+            assert isinstance(command, click.Command)
+            self.add_command(command, name=cmd_name)
+        return super().get_command(ctx, cmd_name)
+
     def format_commands(self, ctx: click.Context, formatter: click.HelpFormatter) -> None:
         """Extra format methods for multi methods that adds all the commands after the options.
 
@@ -393,6 +430,26 @@ class CommandsTreeGroup(click.Group):
             formatter.write_dl(rows, col_max=80)
 
 
+def _build_command_tree(command: click.Command) -> _CommandWrapper:
+    """Build tree of commands, the lazily loaded sub-commands are not imported.
+
+    :param command: Root command of the tree
+    :return: Command wrapper of the root command
+    """
+    wrapper = _CommandWrapper(command)
+    if isinstance(command, click.Group):
+        for cmd in command.commands.values():
+            if not getattr(cmd, "hidden", False):
+                wrapper.children.append(_build_command_tree(cmd))
+    if isinstance(command, CommandsTreeGroup):
+        for name, (_, short_help) in command.lazy_commands.items():
+            if name not in command.commands:
+                placeholder = click.Command(name, help=short_help)
+                placeholder.__doc__ = short_help
+                wrapper.children.append(_CommandWrapper(placeholder))
+    return wrapper
+
+
 def _get_tree(
     command: _CommandWrapper,
     rows: Optional[List] = None,
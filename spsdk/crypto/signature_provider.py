@@ -64,6 +64,16 @@ class SignatureProvider(abc.ABC):
         """Verify if given public key matches private key."""
         raise SPSDKUnsupportedOperation("Verify method is not supported.")
 
+    def sign_many(self, data: List[bytes]) -> List[bytes]:
+        """Get signatures for multiple data in the same format as `get_signature`.
+
+        Signature providers with expensive round trips may override it to sign all data at once.
+
+        :param data: List of data to be signed
+        :return: List of signatures in the same order as data
+        """
+        return [self.get_signature(item) for item in data]
+
     def get_signature(self, data: bytes) -> bytes:
         """Get signature. In case of ECC signature, the NXP format(r+s) is used.
 
@@ -71,7 +81,14 @@ class SignatureProvider(abc.ABC):
         :return: Signature of the data
 
         """
-        signature = self.sign(data)
+        return self._format_signature(self.sign(data))
+
+    def _format_signature(self, signature: bytes) -> bytes:
+        """Convert signature returned by `sign` into the format returned by `get_signature`.
+
+        :param signature: Signature returned by `sign`
+        :return: Signature in NXP format in case of ECC signature, otherwise unchanged
+        """
         try:
             ecdsa_sig = ECDSASignature.parse(signature)
             signature = ecdsa_sig.export(SPSDKEncoding.NXP)
@@ -280,7 +297,14 @@ class InteractivePlainFileSP(PlainFileSP):
 
 
 class HttpProxySP(SignatureProvider):
-    """Signature Provider implementation that delegates all operations to a proxy server."""
+    """Signature Provider implementation that delegates all operations to a proxy server.
+
+    The connection to the server is kept alive between the requests. Signature length and results
+    of public key verification don't change for given provider, so they are requested only once.
+    Multiple data may be signed by a single request using the 'sign_many' endpoint,
+    which takes list of hex strings in 'data' member and responds with list of signatures
+    (hex strings) in the same order.
+    """
 
     sp_type = "proxy"
     reserved_keys = ["type", "search_paths", "data"]
@@ -301,6 +325,9 @@ class HttpProxySP(SignatureProvider):
         self.base_url = f"http://{host}:{port}/"
         self.base_url += f"{url_prefix}/" if url_prefix else ""
         self.kwargs = kwargs
+        self.session = requests.Session()
+        self._signature_length: Optional[int] = None
+        self._verified_keys: Dict[bytes, bool] = {}
 
     def _handle_request(self, url: str, data: Optional[Dict] = None) -> Dict:
         """Handle REST API request.
@@ -315,7 +342,7 @@ class HttpProxySP(SignatureProvider):
         json_payload.update(self.kwargs)
         full_url = self.base_url + url
         logger.info(f"Requesting: {full_url}")
-        response = requests.get(url=full_url, json=json_payload, timeout=60)
+        response = self.session.get(url=full_url, json=json_payload, timeout=60)
         logger.info(f"Response: {response}")
         if not response.ok:
             try:
@@ -353,18 +380,43 @@ class HttpProxySP(SignatureProvider):
         self._check_response(response=response, names_types=[("data", str)])
         return bytes.fromhex(response["data"])
 
+    def sign_many(self, data: List[bytes]) -> List[bytes]:
+        """Get signatures for multiple data in the same format as `get_signature`, in single request.
+
+        :param data: List of data to be signed
+        :raises SPSDKError: Count of signatures doesn't match count of data
+        :return: List of signatures in the same order as data
+        """
+        if not data:
+            return []
+        response = self._handle_request("sign_many", {"data": [item.hex() for item in data]})
+        self._check_response(response=response, names_types=[("data", list)])
+        if len(response["data"]) != len(data):
+            raise SPSDKError(
+                f"Count of signatures ({len(response['data'])}) doesn't match count of data ({len(data)})"
+            )
+        return [self._format_signature(bytes.fromhex(signature)) for signature in response["data"]]
+
     @property
     def signature_length(self) -> int:
         """Return length of the signature."""
-        response = self._handle_request("signature_length")
-        self._check_response(response=response, names_types=[("data", int)])
-        return int(response["data"])
+        if self._signature_length is None:
+            response = self._handle_request("signature_length")
+            self._check_response(response=response, names_types=[("data", int)])
+            self._signature_length = int(response["data"])
+        return self._signature_length
 
     def verify_public_key(self, public_key: bytes) -> bool:
         """Verify if given public key matches private key."""
-        response = self._handle_request("verify_public_key", {"data": public_key.hex()})
-        self._check_response(response=response, names_types=[("data", bool)])
-        return response["data"]
+        if public_key not in self._verified_keys:
+            response = self._handle_request("verify_public_key", {"data": public_key.hex()})
+            self._check_response(response=response, names_types=[("data", bool)])
+            self._verified_keys[public_key] = response["data"]
+        return self._verified_keys[public_key]
+
+    def close(self) -> None:
+        """Close the connection to the proxy server."""
+        self.session.close()
 
 
 def get_signature_provider(
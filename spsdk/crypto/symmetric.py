@@ -9,13 +9,17 @@
 
 
 # Used security modules
+from struct import pack
 from typing import Optional
 
 from cryptography.hazmat.primitives import keywrap
 from cryptography.hazmat.primitives.ciphers import Cipher, aead, algorithms, modes
 
 from spsdk.exceptions import SPSDKError
-from spsdk.utils.misc import Endianness, align_block
+from spsdk.utils.misc import Endianness, align_block, xor_bytes
+
+# Size of data chunks encrypted at once in CTR mode with customizable counter
+AES_CTR_CHUNK_SIZE = 0x10_0000
 
 
 class Counter:
@@ -53,6 +57,26 @@ class Counter:
         """
         self._ctr += value
 
+    def get_blocks(self, count: int, step: int = 1) -> bytes:
+        """Get counter values of consecutive blocks joined together.
+
+        The counter is incremented by `step` for each block, the counter object is not modified.
+
+        :param count: Count of blocks
+        :param step: Increment of the counter between blocks
+        :return: Counter values of all blocks
+        """
+        byte_order = "<" if self._ctr_byteorder_encoding == Endianness.LITTLE else ">"
+        ctr_values = pack(
+            f"{byte_order}{count}L", *range(self._ctr, self._ctr + count * step, step)
+        )
+        blocks = bytearray(16 * count)
+        for i, nonce_byte in enumerate(self._nonce):
+            blocks[i::16] = bytes((nonce_byte,)) * count
+        for i in range(4):
+            blocks[12 + i :: 16] = ctr_values[i::4]
+        return bytes(blocks)
+
 
 def aes_key_wrap(kek: bytes, key_to_wrap: bytes) -> bytes:
     """Wraps a key using a key-encrypting key (KEK).
@@ -171,6 +195,45 @@ def aes_ctr_decrypt(key: bytes, encrypted_data: bytes, nonce: bytes) -> bytes:
     return enc.update(encrypted_data) + enc.finalize()
 
 
+def aes_ctr_encrypt_counter(
+    key: bytes, plain_data: bytes, counter: Counter, step: int = 1
+) -> bytes:
+    """Encrypt plain data with AES in CTR mode using counter with customizable byte ordering.
+
+    The data are encrypted by single cipher, the key stream is created by encryption of counter
+    values of all blocks. The counter is incremented by `step` for each encrypted block.
+
+    :param key: The key for data encryption
+    :param plain_data: Input data
+    :param counter: Counter of the first block
+    :param step: Increment of the counter between blocks
+    :return: Encrypted data
+    """
+    result = bytearray(len(plain_data))
+    enc = Cipher(algorithms.AES(key), modes.ECB()).encryptor()
+    for offset in range(0, len(plain_data), AES_CTR_CHUNK_SIZE):
+        chunk = plain_data[offset : offset + AES_CTR_CHUNK_SIZE]
+        count = (len(chunk) + 15) // 16
+        key_stream = enc.update(counter.get_blocks(count, step))
+        result[offset : offset + len(chunk)] = xor_bytes(chunk, key_stream[: len(chunk)])
+        counter.increment(count * step)
+    return bytes(result)
+
+
+def aes_ctr_decrypt_counter(
+    key: bytes, encrypted_data: bytes, counter: Counter, step: int = 1
+) -> bytes:
+    """Decrypt encrypted data with AES in CTR mode using counter with customizable byte ordering.
+
+    :param key: The key for data decryption
+    :param encrypted_data: Input data
+    :param counter: Counter of the first block
+    :param step: Increment of the counter between blocks
+    :return: Decrypted data
+    """
+    return aes_ctr_encrypt_counter(key, encrypted_data, counter, step)
+
+
 def aes_xts_encrypt(key: bytes, plain_data: bytes, tweak: bytes) -> bytes:
     """Encrypt plain data with AES in XTS mode.
 
@@ -14,6 +14,7 @@ manual of your device for allowed values.
 import logging
 import math
 import os
+from concurrent.futures import ThreadPoolExecutor
 from struct import calcsize, pack, unpack
 from typing import Any, Dict, List, Optional, Tuple, Union
 
@@ -251,9 +252,13 @@ class ImageArrayEntry(Container):
             Used only for encrypted images.
         """
         self._image_offset = 0
+        # purpose: (hashed data, hash algorithm, hash)
+        self._hash_cache: Dict[str, Tuple[Union[bytes, memoryview], EnumHashAlgorithm, bytes]] = {}
         self.parent = parent
         self.flags = flags
         self.already_encrypted_image = already_encrypted_image
+        self.plain_image: Union[bytes, memoryview] = b""
+        self.encrypted_image: Union[bytes, memoryview] = b""
         self.image = image if image else b""
         self.image_offset = image_offset
         self.image_size = self._get_valid_size(self.image)
@@ -262,7 +267,7 @@ class ImageArrayEntry(Container):
         self.image_meta_data = image_meta_data
         self.image_hash = image_hash
         self.image_iv = (
-            image_iv or get_hash(self.plain_image, algorithm=EnumHashAlgorithm.SHA256)
+            image_iv or self._get_image_hash("iv", self.plain_image, EnumHashAlgorithm.SHA256)
             if self.flags_is_encrypted
             else bytes(self.IV_LEN)
         )
@@ -331,10 +336,11 @@ class ImageArrayEntry(Container):
         )
 
     @property
-    def image(self) -> bytes:
+    def image(self) -> Union[bytes, memoryview]:
         """Image data for this Image array entry.
 
         The class decide by flags if encrypted of plain data has been returned.
+        The parsed images are read-only views into the parsed binary.
 
         :raises SPSDKError: Invalid Image - Image is not encrypted yet.
         :return: Image bytes.
@@ -347,14 +353,16 @@ class ImageArrayEntry(Container):
         return self.plain_image
 
     @image.setter
-    def image(self, data: bytes) -> None:
+    def image(self, data: Union[bytes, memoryview]) -> None:
         """Image data for this Image array entry.
 
         The class decide by flags if encrypted of plain data has been stored.
+        The already aligned memory view is stored as is, without copying of data.
         """
-        input_image = align_block(
-            data, 16 if self.flags_is_encrypted else 4, padding=RESERVED
-        )  # align to encryptable block
+        input_image = data
+        alignment = 16 if self.flags_is_encrypted else 4  # align to encryptable block
+        if not isinstance(input_image, memoryview) or len(input_image) % alignment:
+            input_image = align_block(bytes(input_image), alignment, padding=RESERVED)
         self.plain_image = input_image if not self.already_encrypted_image else b""
         self.encrypted_image = input_image if self.already_encrypted_image else b""
 
@@ -373,18 +381,38 @@ class ImageArrayEntry(Container):
             + "32s"  # Input Vector
         )
 
+    def _get_image_hash(
+        self, purpose: str, data: Union[bytes, memoryview], algorithm: EnumHashAlgorithm
+    ) -> bytes:
+        """Get hash of image data, the hash is computed again only if the data has changed.
+
+        The immutable data can't change, so the cached hash is used for the same data object.
+
+        :param purpose: Purpose of the hash (image hash or IV)
+        :param data: Data to hash
+        :param algorithm: Hash algorithm
+        :return: Hash of data
+        """
+        cached = self._hash_cache.get(purpose)
+        if cached and cached[0] is data and cached[1] == algorithm:
+            return cached[2]
+        digest = get_hash(data, algorithm=algorithm)
+        if isinstance(data, bytes) or (isinstance(data, memoryview) and data.readonly):
+            self._hash_cache[purpose] = (data, algorithm, digest)
+        return digest
+
     def update_fields(self) -> None:
         """Updates the image fields in container based on provided image."""
         # self.image = align_block(self.image, self.get_valid_alignment(), 0)
         self.image_size = self._get_valid_size(self.image)
         algorithm = self.get_hash_from_flags(self.flags)
         self.image_hash = extend_block(
-            get_hash(self.image, algorithm=algorithm),
+            self._get_image_hash("hash", self.image, algorithm),
             self.HASH_LEN,
             padding=0,
         )
         if not self.image_iv and self.flags_is_encrypted:
-            self.image_iv = get_hash(self.plain_image, algorithm=EnumHashAlgorithm.SHA256)
+            self.image_iv = self._get_image_hash("iv", self.plain_image, EnumHashAlgorithm.SHA256)
 
     @staticmethod
     def create_meta(start_cpu_id: int = 0, mu_cpu_id: int = 0, start_partition_id: int = 0) -> int:
@@ -574,9 +602,11 @@ class ImageArrayEntry(Container):
             raise SPSDKValueError("Image Entry: Invalid Image Hash.")
 
     @classmethod
-    def parse(cls, data: bytes, parent: "AHABContainer") -> Self:  # type: ignore # pylint: disable=arguments-differ
+    def parse(cls, data: Union[bytes, memoryview], parent: "AHABContainer") -> Self:  # type: ignore # pylint: disable=arguments-differ
         """Parse input binary chunk to the container object.
 
+        The image is not copied, if the data are provided as memory view.
+
         :param parent: Parent AHABContainer object.
         :param data: Binary data with Image Array Entry block to parse.
         :raises SPSDKLengthError: If invalid length of image is detected.
@@ -635,14 +665,15 @@ class ImageArrayEntry(Container):
                 f" but the loaded image length has only {hex(binary_size)}B size."
             )
         image = data[iae.image_offset - iae_offset : iae.image_offset - iae_offset + image_size]
-        image_hash_cmp = extend_block(
-            get_hash(image, algorithm=ImageArrayEntry.get_hash_from_flags(flags)),
-            ImageArrayEntry.HASH_LEN,
-            padding=0,
-        )
+        algorithm = ImageArrayEntry.get_hash_from_flags(flags)
+        digest = get_hash(image, algorithm=algorithm)
+        image_hash_cmp = extend_block(digest, ImageArrayEntry.HASH_LEN, padding=0)
         if image_hash != image_hash_cmp:
             raise SPSDKValueError("Parsed Container data image has invalid HASH!")
         iae.image = image
+        if iae.image is image:
+            # the image hash is already known, don't compute it again on update of fields
+            iae._hash_cache["hash"] = (iae.image, algorithm, digest)
         return iae
 
     @staticmethod
@@ -1387,6 +1418,8 @@ class ContainerSignature(HeaderContainer):
         super().__init__(tag=self.TAG, length=-1, version=self.VERSION)
         self._signature_data = signature_data or b""
         self.signature_provider = signature_provider
+        # signed data and signature provider used for the current signature
+        self._signed: Optional[Tuple[bytes, SignatureProvider]] = None
         self.length = len(self)
 
     def __eq__(self, other: object) -> bool:
@@ -1431,6 +1464,7 @@ class ContainerSignature(HeaderContainer):
         :param value: signature data.
         """
         self._signature_data = value
+        self._signed = None
         self.length = len(self)
 
     @classmethod
@@ -1450,7 +1484,16 @@ class ContainerSignature(HeaderContainer):
             )
 
         if self.signature_provider:
+            # The data are signed again only if they have changed since the last signing
+            if (
+                self._signed
+                and self._signature_data
+                and self._signed[1] is self.signature_provider
+                and self._signed[0] == data_to_sign
+            ):
+                return
             self._signature_data = self.signature_provider.get_signature(data_to_sign)
+            self._signed = (bytes(data_to_sign), self.signature_provider)
 
     def export(self) -> bytes:
         """Export signature data that is part of Signature Block.
@@ -2906,6 +2949,10 @@ class AHABContainer(AHABContainerBase):
     """
 
     TAG = AHABTags.CONTAINER_HEADER.tag
+    # Minimal total size of images to process the image entries in parallel
+    PARALLEL_MIN_SIZE = 0x10_0000
+    # Maximal count of worker threads, CPU count by default
+    max_workers: Optional[int] = None
 
     def __init__(
         self,
@@ -3005,32 +3052,48 @@ class AHABContainer(AHABContainerBase):
             + len(self.signature_block)
         )
 
-    def update_fields(self) -> None:
+    def _encrypt_image_entry(self, image_entry: ImageArrayEntry) -> None:
+        """Encrypt the image of the image entry.
+
+        :param image_entry: Image array entry to encrypt.
+        """
+        assert self.signature_block.blob
+        image_entry.encrypted_image = self.signature_block.blob.encrypt_data(
+            image_entry.image_iv[16:], image_entry.plain_image
+        )
+        image_entry.already_encrypted_image = True
+
+    def update_fields(self, sign: bool = True) -> None:
         """Updates all volatile information in whole container structure.
 
+        :param sign: Sign the container header, it could be skipped if the layout is not final.
         :raises SPSDKError: When inconsistent image array length is detected.
         """
-        # 1. Encrypt all images if applicable
-        for image_entry in self.image_array:
-            if (
-                image_entry.flags_is_encrypted
-                and not image_entry.already_encrypted_image
-                and self.signature_block.blob
-            ):
-                image_entry.encrypted_image = self.signature_block.blob.encrypt_data(
-                    image_entry.image_iv[16:], image_entry.plain_image
-                )
-                image_entry.already_encrypted_image = True
-
-        # 2. Update the signature block to get overall size of it
-        self.signature_block.update_fields()
-        # 3. Updates Image Entries
+        # 1. Encrypt all images if applicable, the encryption releases GIL,
+        # so the big images are encrypted in parallel
+        to_encrypt = []
+        if self.signature_block.blob:
+            to_encrypt = [
+                image_entry
+                for image_entry in self.image_array
+                if image_entry.flags_is_encrypted and not image_entry.already_encrypted_image
+            ]
+        images_size = sum(len(image_entry.plain_image) for image_entry in to_encrypt)
+        if len(to_encrypt) > 1 and images_size >= self.PARALLEL_MIN_SIZE:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                list(executor.map(self._encrypt_image_entry, to_encrypt))
+        else:
+            for image_entry in to_encrypt:
+                self._encrypt_image_entry(image_entry)
+        # 2. Update Image Entries
         for image_entry in self.image_array:
             image_entry.update_fields()
+        # 3. Update the signature block to get overall size of it
+        self.signature_block.update_fields()
         # 4. Update the Container header length
         self.length = self.header_length()
         # 5. Sign the image header
-        if self.flag_srk_set != "none":
+        if sign and self.flag_srk_set != "none":
             assert self.signature_block.signature
             self.signature_block.signature.sign(self.get_signature_data())
 
@@ -3155,9 +3218,11 @@ class AHABContainer(AHABContainerBase):
             image.validate()
 
     @classmethod
-    def parse(cls, data: bytes, parent: "AHABImage", container_id: int) -> Self:  # type: ignore# type: ignore # pylint: disable=arguments-differ
+    def parse(cls, data: Union[bytes, memoryview], parent: "AHABImage", container_id: int) -> Self:  # type: ignore# type: ignore # pylint: disable=arguments-differ
         """Parse input binary chunk to the container object.
 
+        Just the container header is copied, the images are kept as views into the data.
+
         :param data: Binary data with Container block to parse.
         :param parent: AHABImage object.
         :param container_id: AHAB container ID.
@@ -3165,6 +3230,7 @@ class AHABContainer(AHABContainerBase):
         """
         if parent is None:
             raise SPSDKValueError("Ahab Image must be specified.")
+        data = memoryview(data)
         (
             flags,
             sw_version,
@@ -3172,6 +3238,8 @@ class AHABContainer(AHABContainerBase):
             number_of_images,
             signature_block_offset,
         ) = AHABContainerBase._parse(data)
+        _, length, _ = AHABContainer.parse_head(data[: HeaderContainer.fixed_length()])
+        header = bytes(data[:length])
 
         parsed_container = cls(
             parent=parent,
@@ -3180,7 +3248,7 @@ class AHABContainer(AHABContainerBase):
             sw_version=sw_version,
             container_offset=parent.ahab_address_map[container_id],
         )
-        parsed_container.signature_block = SignatureBlock.parse(data[signature_block_offset:])
+        parsed_container.signature_block = SignatureBlock.parse(header[signature_block_offset:])
 
         for i in range(number_of_images):
             image_array_entry = ImageArrayEntry.parse(
@@ -3342,10 +3410,12 @@ class AHABImage:
 
         :param update_offsets: Update also offsets for serial_downloader.
         """
+        update_layout = self.target_memory == TARGET_MEMORY_SERIAL_DOWNLOADER and update_offsets
         for ahab_container in self.ahab_containers:
-            ahab_container.update_fields()
+            # the containers are signed after the final layout is known
+            ahab_container.update_fields(sign=not update_layout)
 
-        if self.target_memory == TARGET_MEMORY_SERIAL_DOWNLOADER and update_offsets:
+        if update_layout:
             # Update the Image offsets to be without gaps
             offset = self.start_image_address
             for ahab_container in self.ahab_containers:
@@ -3578,12 +3648,17 @@ class AHABImage:
 
         return ahab
 
-    def parse(self, binary: bytes) -> None:
+    def parse(self, binary: Union[bytes, memoryview]) -> None:
         """Parse input binary chunk to the container object.
 
+        The binary could be also a memory view of memory mapped file, the images are not copied,
+        they are kept as read-only views into the binary.
+
+        :param binary: Binary data with AHAB Image to parse.
         :raises SPSDKError: No AHAB container found in binary data.
         """
         self.clear()
+        binary = memoryview(binary)
 
         for i, address in enumerate(self.ahab_address_map):
             try:
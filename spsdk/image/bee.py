@@ -8,8 +8,9 @@
 
 
 import logging
+import time
 from struct import calcsize, pack, unpack_from
-from typing import Any, Dict, List, Optional, Sequence
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 from typing_extensions import Self
 
@@ -30,7 +31,7 @@ from spsdk.utils.misc import (
     extend_block,
     load_binary,
     load_hex_string,
-    split_data,
+    size_fmt,
     value_to_int,
 )
 from spsdk.utils.schema_validator import CommentedConfig
@@ -362,27 +363,78 @@ class BeeProtectRegionBlock(BeeBaseClass):
         """
         if len(data) > BEE_ENCR_BLOCK_SIZE:
             raise SPSDKError("Incorrect length of binary block to be encrypted")
-        if self.is_inside_region(start_addr):
-            if self.mode != BeeProtectRegionBlockAesMode.CTR:
-                raise SPSDKError("only AES/CTR encryption mode supported now")
-            if len(key) != 16:
-                raise SPSDKError("Invalid length of key")
-            for fac in self.fac_regions:
-                if fac.start_addr <= start_addr < fac.end_addr:
-                    if start_addr + len(data) > fac.end_addr:
-                        raise SPSDKError("Invalid range of region")
-                    cntr_key = Counter(
-                        self.counter,
-                        ctr_value=start_addr >> 4,
-                        ctr_byteorder_encoding=Endianness.BIG,
-                    )
-                    logger.debug(
-                        f"Encrypting data, start={hex(start_addr)},"
-                        f"end={hex(start_addr + len(data))} with {str(self)} using fac {str(fac)}"
-                    )
-                    data = align_block_fill_random(data, 16)  # align data to 16 bytes
-                    return aes_ctr_encrypt(key, data, cntr_key.value)
-        return data
+        return self.encrypt_data(key, start_addr, data)
+
+    def get_encrypted_spans(self, start_addr: int, length: int) -> List[Tuple[int, int]]:
+        """Get the spans of data encrypted by the region.
+
+        The data are split into blocks of BEE_ENCR_BLOCK_SIZE, each block starting in any FAC region
+        is encrypted. Consecutive encrypted blocks are joined into single span.
+
+        :param start_addr: start address of the data
+        :param length: length of the data
+        :return: list of start and end offsets of encrypted spans in the data
+        :raises SPSDKError: When the block exceeds the FAC region
+        """
+        spans: List[Tuple[int, int]] = []
+        for offset in range(0, length, BEE_ENCR_BLOCK_SIZE):
+            block_addr = start_addr + offset
+            block_end = min(offset + BEE_ENCR_BLOCK_SIZE, length)
+            if not self.is_inside_region(block_addr):
+                continue
+            fac = next(
+                (fac for fac in self.fac_regions if fac.start_addr <= block_addr < fac.end_addr),
+                None,
+            )
+            if fac is None:
+                continue
+            if start_addr + block_end > fac.end_addr:
+                raise SPSDKError("Invalid range of region")
+            if spans and spans[-1][1] == offset:
+                spans[-1] = (spans[-1][0], block_end)
+            else:
+                spans.append((offset, block_end))
+        return spans
+
+    def encrypt_data(self, key: bytes, start_addr: int, data: bytes) -> bytes:
+        """Encrypt all blocks of the data located in any FAC region.
+
+        The counter depends on the address only, so each contiguous encrypted span
+        is encrypted at once.
+
+        :param key: user for encryption
+        :param start_addr: start address of the data
+        :param data: binary data to be encrypted
+        :return: data with encrypted blocks inside any FAC region; blocks outside FAC regions untouched
+        :raises SPSDKError: When encryption mode different from AES/CTR provided
+        :raises SPSDKError: When invalid length of key
+        :raises SPSDKError: When invalid range of region
+        """
+        # offset of the first block inside the region
+        offset = (
+            max(0, -((start_addr - self._start_addr) // BEE_ENCR_BLOCK_SIZE)) * BEE_ENCR_BLOCK_SIZE
+        )
+        if offset >= len(data) or not self.is_inside_region(start_addr + offset):
+            return data
+        if self.mode != BeeProtectRegionBlockAesMode.CTR:
+            raise SPSDKError("only AES/CTR encryption mode supported now")
+        if len(key) != 16:
+            raise SPSDKError("Invalid length of key")
+        spans = self.get_encrypted_spans(start_addr, len(data))
+        result = bytearray(data)
+        for start, end in spans:
+            cntr_key = Counter(
+                self.counter,
+                ctr_value=(start_addr + start) >> 4,
+                ctr_byteorder_encoding=Endianness.BIG,
+            )
+            logger.debug(
+                f"Encrypting data, start={hex(start_addr + start)},"
+                f"end={hex(start_addr + end)} with {str(self)}"
+            )
+            span_data = align_block_fill_random(data[start:end], 16)  # align data to 16 bytes
+            result[start:end] = aes_ctr_encrypt(key, span_data, cntr_key.value)
+        return bytes(result)
 
 
 class BeeKIB(BeeBaseClass):
@@ -584,6 +636,15 @@ class BeeRegionHeader(BeeBaseClass):
         """
         return self._prdb.encrypt_block(self._sw_key, start_addr, data)
 
+    def encrypt_data(self, start_addr: int, data: bytes) -> bytes:
+        """Encrypt all blocks of the data located in any FAC region.
+
+        :param start_addr: start address of the data
+        :param data: binary data to be encrypted
+        :return: data with encrypted blocks inside any FAC region; blocks outside FAC regions untouched
+        """
+        return self._prdb.encrypt_data(self._sw_key, start_addr, data)
+
 
 class BeeNxp:
     """BeeNxp class."""
@@ -609,19 +670,17 @@ class BeeNxp:
 
         :return: encrypted image
         """
-        encrypted_data = bytearray()
-        image_data = bytearray(self.input_image)
-        base_address = self.base_address
-
-        for block in split_data(image_data, BEE_ENCR_BLOCK_SIZE):
-            logger.debug(f"Reading {hex(base_address)}, size={hex(len(block))}")
-            for header in self.headers:
-                if header:
-                    block = header.encrypt_block(base_address, block)
-            encrypted_data.extend(block)
-            base_address += len(block)
-
-        return bytes(encrypted_data)
+        start_time = time.perf_counter()
+        encrypted_data = bytes(self.input_image)
+        for header in self.headers:
+            if header:
+                encrypted_data = header.encrypt_data(self.base_address, encrypted_data)
+        duration = time.perf_counter() - start_time
+        logger.info(
+            f"Encrypted {size_fmt(len(encrypted_data))} in {duration:.3f} s"
+            f" ({len(encrypted_data) / max(duration, 1e-9) / 1e6:.2f} MB/s)"
+        )
+        return encrypted_data
 
     def export_headers(self) -> List[Optional[bytes]]:
         """Export BEE headers.
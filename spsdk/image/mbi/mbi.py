@@ -55,9 +55,33 @@ MAP_AUTHENTICATIONS = {
 }
 
 
+# Cache of created MBI classes, the key is family and class name
+_mbi_classes_cache: Dict[Tuple[str, str], Type["MasterBootImage"]] = {}
+# Cache of MBI class names, the key is family, execution target and authentication type
+_mbi_class_names_cache: Dict[Tuple[str, str, str], str] = {}
+# Cache of all MBI classes of the family
+_mbi_family_classes_cache: Dict[str, Dict[str, Tuple[Type["MasterBootImage"], str, str]]] = {}
+
+
 def create_mbi_class(name: str, family: str) -> Type["MasterBootImage"]:
     """Create Master Boot image class.
 
+    The classes are created just once, the same class is returned for the same name and family.
+
+    :param name: Name of Class
+    :param family: Name of chip family
+    :return: Master Boot Image class
+    """
+    mbi_cls = _mbi_classes_cache.get((family, name))
+    if mbi_cls is None:
+        mbi_cls = _create_mbi_class(name, family)
+        _mbi_classes_cache[(family, name)] = mbi_cls
+    return mbi_cls
+
+
+def _create_mbi_class(name: str, family: str) -> Type["MasterBootImage"]:
+    """Create new Master Boot image class.
+
     :param name: Name of Class
     :param family: Name of chip family
     :return: Master Boot Image class
@@ -98,13 +122,17 @@ def get_mbi_class(config: Dict[str, Any]) -> Type["MasterBootImage"]:
     # Validate needed configuration to recognize MBI class
     check_config(config, [schema_cfg["image_type"], schema_cfg["family"]])
     family = config["family"]
-    db = get_db(family)
     try:
         target = get_key_by_val(config["outputImageExecutionTarget"], MAP_IMAGE_TARGETS["targets"])
         authentication = get_key_by_val(
             config["outputImageAuthenticationType"], MAP_AUTHENTICATIONS
         )
-        cls_name = db.get_str(DatabaseManager.MBI, ["images", target, authentication])
+        cls_name = _mbi_class_names_cache.get((family, target, authentication))
+        if cls_name is None:
+            cls_name = get_db(family).get_str(
+                DatabaseManager.MBI, ["images", target, authentication]
+            )
+            _mbi_class_names_cache[(family, target, authentication)] = cls_name
     except (KeyError, SPSDKValueError) as exc:
         raise SPSDKUnsupportedImageType(
             f"Memory target {target} and authentication type {authentication} is not supported for {family} MBI."
@@ -121,6 +149,8 @@ def get_mbi_classes(family: str) -> Dict[str, Tuple[Type["MasterBootImage"], str
     :return: Dictionary with key like image name and values are Tuple with it's MBI Class
         and target and authentication type.
     """
+    if family in _mbi_family_classes_cache:
+        return dict(_mbi_family_classes_cache[family])
     db = get_db(family)
     ret: Dict[str, Tuple[Type["MasterBootImage"], str, str]] = {}
 
@@ -136,7 +166,8 @@ def get_mbi_classes(family: str) -> Dict[str, Tuple[Type["MasterBootImage"], str
                 MAP_AUTHENTICATIONS[authentication][0],
             )
 
-    return ret
+    _mbi_family_classes_cache[family] = ret
+    return dict(ret)
 
 
 def get_all_mbi_classes() -> List[Type["MasterBootImage"]]:
@@ -222,13 +253,35 @@ class MasterBootImage:
     finalize: Any  # finalize(self, image: bytes, revert: bool = False) -> bytes
     disassemble_image: Callable[[bytes], None]
 
+    _mixins: Tuple[Type[mbi_mixin.Mbi_Mixin], ...]
+    _mixin_methods: Dict[str, Tuple[Callable[..., Any], ...]]
+
     @classmethod
     def _get_mixins(cls) -> List[Type[mbi_mixin.Mbi_Mixin]]:
         """Get the list of Mbi Mixin classes.
 
         :return: List of Mbi_Mixins.
         """
-        return [x for x in cls.__bases__ if issubclass(x, mbi_mixin.Mbi_Mixin)]
+        # the list is stored in the class itself, it must not be inherited by subclasses
+        if "_mixins" not in cls.__dict__:
+            cls._mixins = tuple(x for x in cls.__bases__ if issubclass(x, mbi_mixin.Mbi_Mixin))
+            cls._mixin_methods = {}
+        return list(cls._mixins)
+
+    @classmethod
+    def _get_mixin_methods(cls, name: str) -> Tuple[Callable[..., Any], ...]:
+        """Get the method of all Mbi Mixin classes.
+
+        :param name: Name of the method
+        :return: Tuple of methods in the order of mixins.
+        """
+        if "_mixins" not in cls.__dict__:
+            cls._get_mixins()
+        methods = cls._mixin_methods.get(name)
+        if methods is None:
+            methods = tuple(getattr(mixin, name) for mixin in cls._mixins)
+            cls._mixin_methods[name] = methods
+        return methods
 
     @classmethod
     def get_image_type(cls, device: str, data: bytes) -> int:
@@ -283,16 +336,46 @@ class MasterBootImage:
             for member in base.NEEDED_MEMBERS:
                 assert hasattr(self, member), f"{member} is missing"
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set the attribute and invalidate cached lengths of the image."""
+        super().__setattr__(name, value)
+        self.clear_layout_cache()
+
+    def clear_layout_cache(self) -> None:
+        """Invalidate cached lengths of the image.
+
+        The lengths are cached just during the export and invalidated automatically when
+        any attribute of the image is set, this method must be called during the export
+        when an attribute is modified in place.
+        """
+        cache = self.__dict__.get("_layout_cache")
+        if cache:
+            cache.clear()
+
+    def _get_layout_len(self, name: str, compute: Callable[[], int]) -> int:
+        """Get length of the image, cached during the export.
+
+        :param name: Name of the length
+        :param compute: Function computing the length, if not cached
+        :return: Length in bytes.
+        """
+        cache: Optional[Dict[str, int]] = self.__dict__.get("_layout_cache")
+        if cache is None:
+            return compute()
+        if name not in cache:
+            cache[name] = compute()
+        return cache[name]
+
     @property
     def total_len(self) -> int:
         """Compute Master Boot Image data length.
 
         :return: Final image data length.
         """
-        ret = 0
-        for base in self._get_mixins():
-            ret += base.mix_len(self)  # type: ignore
-        return ret
+        return self._get_layout_len(
+            "total_len",
+            lambda: sum(mix_len(self) for mix_len in self._get_mixin_methods("mix_len")),
+        )
 
     @property
     def app_len(self) -> int:
@@ -300,13 +383,17 @@ class MasterBootImage:
 
         :return: Final image data length.
         """
-        ret = 0
-        for base in self._get_mixins():
-            mix_app_len = base.mix_app_len(self)  # type: ignore
-            if mix_app_len < 0:
-                mix_app_len = base.mix_len(self)  # type: ignore
-            ret += mix_app_len
-        return ret
+
+        def compute_app_len() -> int:
+            ret = 0
+            for mix_app_len, mix_len in zip(
+                self._get_mixin_methods("mix_app_len"), self._get_mixin_methods("mix_len")
+            ):
+                length = mix_app_len(self)
+                ret += length if length >= 0 else mix_len(self)
+            return ret
+
+        return self._get_layout_len("app_len", compute_app_len)
 
     @property
     def rkth(self) -> Optional[bytes]:
@@ -328,12 +415,24 @@ class MasterBootImage:
         """
         self.search_paths = search_paths
         self.family = config.get("family", "Unknown")
-        for base in self._get_mixins():
-            base.mix_load_from_config(self, config)  # type: ignore
+        for mix_load_from_config in self._get_mixin_methods("mix_load_from_config"):
+            mix_load_from_config(self, config)
 
     def export(self) -> bytes:
         """Export final bootable image.
 
+        :return: Bootable Image in bytes.
+        """
+        # the lengths are cached just within the export
+        self.__dict__["_layout_cache"] = {}
+        try:
+            return self._export()
+        finally:
+            del self.__dict__["_layout_cache"]
+
+    def _export(self) -> bytes:
+        """Export final bootable image with the lengths of the image cached.
+
         :return: Bootable Image in bytes.
         """
         # 1: Validate the input data
@@ -481,5 +580,5 @@ class MasterBootImage:
 
     def validate(self) -> None:
         """Validate the setting of image."""
-        for base in self._get_mixins():
-            base.mix_validate(self)  # type: ignore
+        for mix_validate in self._get_mixin_methods("mix_validate"):
+            mix_validate(self)
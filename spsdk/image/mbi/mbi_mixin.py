@@ -44,6 +44,9 @@ from spsdk.utils.spsdk_enum import SpsdkEnum
 
 logger = logging.getLogger(__name__)
 
+# CRC32-MPEG function with precomputed table, creating of the function is expensive
+_calc_crc32_mpeg = mkPredefinedCrcFun("crc-32-mpeg")
+
 
 class MasterBootImageManifest:
     """MasterBootImage Manifest."""
@@ -228,7 +231,7 @@ class MasterBootImageManifestMcxNx(MasterBootImageManifest):
 
         :param image: Image data to be used to compute CRC
         """
-        self.crc = mkPredefinedCrcFun("crc-32-mpeg")(image)
+        self.crc = _calc_crc32_mpeg(image)
 
 
 T_Manifest = TypeVar("T_Manifest", MasterBootImageManifest, MasterBootImageManifestMcxNx)
@@ -1998,6 +2001,7 @@ class Mbi_ExportMixinAppTrustZoneCertBlock(Mbi_ExportMixin):
     cert_block: Optional[Union[CertBlockV1, CertBlockV21]]
     get_app_data: Callable[[], bytes]
     disassembly_app_data: Callable[[bytes], bytes]
+    clear_layout_cache: Callable[[], None]
 
     def collect_data(self) -> bytes:
         """Collect application data and TrustZone including update IVT.
@@ -2011,6 +2015,8 @@ class Mbi_ExportMixinAppTrustZoneCertBlock(Mbi_ExportMixin):
             and isinstance(self.cert_block, CertBlockV1)
         )
         self.cert_block.alignment = 4
+        # the length of certification block depends on its alignment
+        self.clear_layout_cache()
         self.cert_block.image_length = self.app_len
         app = self.get_app_data() if hasattr(self, "get_app_data") else self.app
         return self.update_ivt(
@@ -2138,9 +2144,8 @@ class Mbi_ExportMixinCrcSign(Mbi_ExportMixin):
 
         # calculate CRC using MPEG2 specification over all of data (app and trustzone)
         # expect for 4 bytes at CRC_BLOCK_OFFSET
-        crc32_function = mkPredefinedCrcFun("crc-32-mpeg")
-        crc = crc32_function(image[: self.IVT_CRC_CERTIFICATE_OFFSET])
-        crc = crc32_function(image[self.IVT_CRC_CERTIFICATE_OFFSET + 4 :], crc)
+        crc = _calc_crc32_mpeg(image[: self.IVT_CRC_CERTIFICATE_OFFSET])
+        crc = _calc_crc32_mpeg(image[self.IVT_CRC_CERTIFICATE_OFFSET + 4 :], crc)
 
         # Recreate data with valid CRC value
         return self.update_crc_val_cert_offset(image, crc)
@@ -2343,6 +2348,7 @@ class Mbi_ExportMixinAppTrustZoneCertBlockEncrypt(Mbi_ExportMixin):
     cert_block: Optional[Union[CertBlockV1, CertBlockV21]]
     get_app_data: Callable[[], bytes]
     disassembly_app_data: Callable[[bytes], bytes]
+    clear_layout_cache: Callable[[], None]
 
     def collect_data(self) -> bytes:
         """Collect application data and TrustZone including update IVT.
@@ -2356,6 +2362,8 @@ class Mbi_ExportMixinAppTrustZoneCertBlockEncrypt(Mbi_ExportMixin):
             and isinstance(self.cert_block, CertBlockV1)
         )
         self.cert_block.alignment = 4
+        # the length of certification block depends on its alignment
+        self.clear_layout_cache()
         app = self.get_app_data() if hasattr(self, "get_app_data") else self.app
         return self.update_ivt(
             app + self.trust_zone.export(),
@@ -651,15 +651,9 @@ class SegBEE(BaseSegment):
             raise SPSDKError("Invalid start address")
         orig_len = len(data)
         data = align_block(data, BEE_ENCR_BLOCK_SIZE)
-        result = bytes()
-        offset = 0
-        while offset < len(data):
-            blck = data[offset : offset + BEE_ENCR_BLOCK_SIZE]
-            for region in self._regions:
-                blck = region.encrypt_block(start_addr + offset, blck)
-            result += blck
-            offset += BEE_ENCR_BLOCK_SIZE
-        return result[:orig_len]
+        for region in self._regions:
+            data = region.encrypt_data(start_addr, data)
+        return data[:orig_len]
 
 
 ########################################################################################################################
@@ -0,0 +1,271 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+#
+# Copyright 2024 NXP
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Gang programming of multiple targets over the MBoot protocol.
+
+The same command script is executed on all targets concurrently, each target being driven
+by its own McuBoot instance in a worker thread.
+"""
+
+import logging
+import os
+import shlex
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from spsdk.exceptions import SPSDKError
+from spsdk.mboot.error_codes import StatusCode, stringify_status_code
+from spsdk.mboot.exceptions import McuBootError
+from spsdk.mboot.mcuboot import McuBoot
+from spsdk.mboot.protocol.base import MbootProtocolBase
+from spsdk.utils.misc import load_binary, value_to_int
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class GangCommand:
+    """Single command of the gang programming script."""
+
+    name: str
+    args: List[str] = field(default_factory=list)
+    data: Optional[bytes] = None
+
+    def __str__(self) -> str:
+        return " ".join([self.name] + self.args)
+
+
+@dataclass
+class GangResult:
+    """Result of the gang programming script on a single target."""
+
+    device: str
+    success: bool = False
+    duration: float = 0.0
+    status_code: int = StatusCode.SUCCESS.tag
+    failed_command: Optional[str] = None
+    error: Optional[str] = None
+    command_durations: List[float] = field(default_factory=list)
+
+    @property
+    def status(self) -> str:
+        """Return status string of the last command."""
+        return stringify_status_code(self.status_code)
+
+    def __str__(self) -> str:
+        result = "OK" if self.success else "FAILED"
+        msg = f"{self.device}: {result} in {self.duration:.3f} s, status: {self.status}"
+        if self.failed_command:
+            msg += f", failed command: '{self.failed_command}'"
+        if self.error:
+            msg += f", error: {self.error}"
+        return msg
+
+
+def _cmd_flash_erase_all(mboot: McuBoot, cmd: GangCommand) -> bool:
+    mem_id = value_to_int(cmd.args[0]) if cmd.args else 0
+    return mboot.flash_erase_all(mem_id=mem_id)
+
+
+def _cmd_flash_erase_region(mboot: McuBoot, cmd: GangCommand) -> bool:
+    address, length = value_to_int(cmd.args[0]), value_to_int(cmd.args[1])
+    mem_id = value_to_int(cmd.args[2]) if len(cmd.args) > 2 else 0
+    return mboot.flash_erase_region(address=address, length=length, mem_id=mem_id)
+
+
+def _cmd_write_memory(mboot: McuBoot, cmd: GangCommand) -> bool:
+    assert cmd.data is not None
+    mem_id = value_to_int(cmd.args[2]) if len(cmd.args) > 2 else 0
+    return mboot.write_memory(address=value_to_int(cmd.args[0]), data=cmd.data, mem_id=mem_id)
+
+
+def _cmd_verify_memory(mboot: McuBoot, cmd: GangCommand) -> bool:
+    assert cmd.data is not None
+    mem_id = value_to_int(cmd.args[2]) if len(cmd.args) > 2 else 0
+    data = mboot.read_memory(address=value_to_int(cmd.args[0]), length=len(cmd.data), mem_id=mem_id)
+    if data != cmd.data:
+        raise McuBootError("Verification of written data failed")
+    return True
+
+
+def _cmd_receive_sb_file(mboot: McuBoot, cmd: GangCommand) -> bool:
+    assert cmd.data is not None
+    return mboot.receive_sb_file(data=cmd.data)
+
+
+def _cmd_reset(mboot: McuBoot, cmd: GangCommand) -> bool:  # pylint: disable=unused-argument
+    # the target re-enumerates after reset; the script must end with this command
+    return mboot.reset(reopen=False)
+
+
+class GangProgrammer:
+    """Run the same McuBoot command script on multiple targets concurrently."""
+
+    # command name: (handler, minimal count of arguments, index of argument with a file path)
+    COMMANDS: Dict[str, Tuple[Callable[[McuBoot, GangCommand], bool], int, Optional[int]]] = {
+        "flash-erase-all": (_cmd_flash_erase_all, 0, None),
+        "flash-erase-region": (_cmd_flash_erase_region, 2, None),
+        "write-memory": (_cmd_write_memory, 2, 1),
+        "verify-memory": (_cmd_verify_memory, 2, 1),
+        "receive-sb-file": (_cmd_receive_sb_file, 1, 0),
+        "reset": (_cmd_reset, 0, None),
+    }
+
+    def __init__(
+        self,
+        interfaces: Sequence[MbootProtocolBase],
+        commands: Sequence[GangCommand],
+        max_workers: Optional[int] = None,
+    ) -> None:
+        """Initialize the gang programmer.
+
+        :param interfaces: Interfaces of targets to program
+        :param commands: Commands to execute on each target
+        :param max_workers: Maximal count of targets processed at the same time, all by default
+        :raises SPSDKError: Invalid command or no interface specified
+        """
+        if not interfaces:
+            raise SPSDKError("No target device specified for gang programming")
+        self._validate_commands(commands)
+        self.interfaces = list(interfaces)
+        self.commands = list(commands)
+        self.max_workers = max_workers or len(self.interfaces)
+
+    @classmethod
+    def _validate_command(cls, cmd: GangCommand) -> None:
+        """Validate command name and count of arguments.
+
+        :param cmd: Command to validate
+        :raises SPSDKError: Invalid command
+        """
+        if cmd.name not in cls.COMMANDS:
+            raise SPSDKError(
+                f"Unknown command: {cmd.name}, supported commands: {', '.join(cls.COMMANDS)}"
+            )
+        _, min_args, file_index = cls.COMMANDS[cmd.name]
+        if len(cmd.args) < min_args:
+            raise SPSDKError(f"Command '{cmd}' requires at least {min_args} arguments")
+        if file_index is not None and cmd.data is None:
+            raise SPSDKError(f"Command '{cmd}' has no data loaded")
+
+    @classmethod
+    def _validate_commands(cls, commands: Sequence[GangCommand]) -> None:
+        """Validate all commands of the script.
+
+        The connection to the target is not reopened after reset, so reset must be the last command.
+
+        :param commands: Commands to validate
+        :raises SPSDKError: Invalid command or command following the reset
+        """
+        for index, cmd in enumerate(commands):
+            cls._validate_command(cmd)
+            if cmd.name == "reset" and index < len(commands) - 1:
+                raise SPSDKError(f"Command '{commands[index + 1]}' follows the reset")
+
+    @classmethod
+    def parse_script(
+        cls, script: str, search_paths: Optional[List[str]] = None
+    ) -> List[GangCommand]:
+        """Parse the command script.
+
+        The script contains one command per line in blhost-like syntax, e.g.
+        "write-memory 0x0 app.bin". Everything after '#' is a comment.
+        Data files are loaded once and shared by all targets.
+
+        :param script: Text of the script
+        :param search_paths: List of paths where to search for data files
+        :return: List of commands
+        :raises SPSDKError: Invalid command in the script
+        """
+        commands = []
+        for line in script.splitlines():
+            tokens = shlex.split(line, comments=True)
+            if not tokens:
+                continue
+            name, *args = tokens
+            cmd = GangCommand(name=name, args=args)
+            if name in cls.COMMANDS:
+                file_index = cls.COMMANDS[name][2]
+                if file_index is not None and len(args) > file_index:
+                    cmd.data = load_binary(args[file_index], search_paths=search_paths)
+            cls._validate_command(cmd)
+            commands.append(cmd)
+        cls._validate_commands(commands)
+        return commands
+
+    @classmethod
+    def load_script(cls, script_path: str) -> List[GangCommand]:
+        """Load the command script from file.
+
+        Relative paths of data files are resolved against the directory of the script.
+
+        :param script_path: Path to the script
+        :return: List of commands
+        """
+        with open(script_path, encoding="utf-8") as f:
+            script = f.read()
+        return cls.parse_script(script, search_paths=[os.path.dirname(script_path)])
+
+    def run_device(
+        self,
+        interface: MbootProtocolBase,
+        progress_callback: Optional[Callable[[GangResult], None]] = None,
+    ) -> GangResult:
+        """Run the command script on single target.
+
+        :param interface: Interface of the target
+        :param progress_callback: Called with the result after processing the target
+        :return: Result for the target
+        """
+        result = GangResult(device=str(interface))
+        start_time = time.perf_counter()
+        try:
+            with McuBoot(interface, cmd_exception=True) as mboot:
+                for cmd in self.commands:
+                    cmd_start = time.perf_counter()
+                    result.failed_command = str(cmd)
+                    handler = self.COMMANDS[cmd.name][0]
+                    if not handler(mboot, cmd):
+                        result.status_code = mboot.status_code
+                        raise McuBootError(f"Command failed: {mboot.status_string}")
+                    result.status_code = mboot.status_code
+                    result.command_durations.append(time.perf_counter() - cmd_start)
+                result.failed_command = None
+                result.success = True
+        # failure of a single target must not affect the others
+        except Exception as exc:  # pylint: disable=broad-except
+            result.error = str(exc) or exc.__class__.__name__
+            error_value = getattr(exc, "error_value", None)
+            if error_value is not None:
+                result.status_code = error_value
+            elif result.status_code == StatusCode.SUCCESS:
+                result.status_code = StatusCode.FAIL.tag
+            logger.error(f"Gang programming of {result.device} failed: {exc}")
+        result.duration = time.perf_counter() - start_time
+        if progress_callback:
+            progress_callback(result)
+        return result
+
+    def run(
+        self, progress_callback: Optional[Callable[[GangResult], None]] = None
+    ) -> List[GangResult]:
+        """Run the command script on all targets concurrently.
+
+        :param progress_callback: Called with the result after processing each target
+        :return: Results in the same order as the interfaces
+        """
+        logger.info(
+            f"Gang programming of {len(self.interfaces)} device(s) using {self.max_workers} worker(s)"
+        )
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [
+                executor.submit(self.run_device, interface, progress_callback)
+                for interface in self.interfaces
+            ]
+            return [future.result() for future in futures]
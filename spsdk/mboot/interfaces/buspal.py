@@ -11,6 +11,7 @@ import struct
 import time
 from dataclasses import dataclass
 from enum import Enum
+from functools import partial
 from typing import Any, Dict, List, Optional, Tuple
 
 from serial import SerialException
@@ -21,6 +22,7 @@ from spsdk.exceptions import SPSDKError
 from spsdk.mboot.exceptions import McuBootConnectionError, McuBootDataAbortError
 from spsdk.mboot.protocol.serial_protocol import FPType, MbootSerialProtocol, to_int
 from spsdk.utils.interfaces.device.serial_device import SerialDevice
+from spsdk.utils.interfaces.scanner_helper import scan_ports
 
 logger = logging.getLogger(__name__)
 
@@ -186,11 +188,10 @@ class MbootBuspalProtocol(MbootSerialProtocol):
             device = cls._check_port_buspal(port, timeout, props)
             devices = [device] if device else []
         else:
-            all_ports = [
-                cls._check_port_buspal(comport.device, timeout, props)
-                for comport in comports(include_links=True)
-            ]
-            devices = list(filter(None, all_ports))
+            devices = scan_ports(
+                [comport.device for comport in comports(include_links=True)],
+                partial(cls._check_port_buspal, timeout=timeout, props=props),
+            )
         return devices
 
     @classmethod
@@ -81,6 +81,8 @@ class MbootUARTInterface(MbootSerialProtocol):
         port: Optional[str] = None,
         baudrate: Optional[int] = None,
         timeout: Optional[int] = None,
+        max_workers: Optional[int] = None,
+        scan_timeout: Optional[int] = None,
     ) -> List[Self]:
         """Scan connected UART devices.
 
@@ -91,19 +93,33 @@ class MbootUARTInterface(MbootSerialProtocol):
         :param port: name of preferred serial port, defaults to None
         :param baudrate: speed of the UART interface, defaults to 56700
         :param timeout: timeout in milliseconds, defaults to 5000
+        :param max_workers: maximal count of ports checked at the same time
+        :param scan_timeout: overall time limit of the scan in milliseconds, defaults to no limit
         :return: list of interfaces responding to the PING command
         """
         devices = SerialDevice.scan(
-            port=port, baudrate=baudrate or cls.default_baudrate, timeout=timeout
+            port=port,
+            baudrate=baudrate or cls.default_baudrate,
+            timeout=timeout,
+            check=cls._check_device,
+            max_workers=max_workers,
+            scan_timeout=scan_timeout,
         )
-        interfaces = []
-        for device in devices:
-            try:
-                interface = cls(device)
-                interface.open()
-                interface._ping()
-                interface.close()
-                interfaces.append(interface)
-            except Exception:
-                interface.close()
-        return interfaces
+        return [cls(device) for device in devices]
+
+    @classmethod
+    def _check_device(cls, device: SerialDevice) -> bool:
+        """Check whether the device responds to PING command.
+
+        :param device: device to check
+        :return: True if the device responds, False otherwise
+        """
+        interface = cls(device)
+        try:
+            interface.open()
+            interface._ping()
+            return True
+        except Exception:  # pylint: disable=broad-except
+            return False
+        finally:
+            interface.close()
@@ -8,11 +8,26 @@
 
 """Module for communication with the bootloader."""
 
+import itertools
 import logging
+import os
 import struct
 import time
 from types import TracebackType
-from typing import Callable, Dict, List, Optional, Sequence, Type
+from typing import (
+    BinaryIO,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+    cast,
+)
 
 from spsdk.mboot.protocol.base import MbootProtocolBase
 from spsdk.utils.interfaces.device.usb_device import UsbDevice
@@ -49,6 +64,9 @@ from .properties import PropertyTag, PropertyValueBase, Version, parse_property_
 
 logger = logging.getLogger(__name__)
 
+# Data accepted by commands with data phase: bytes-like object, binary file object or chunk iterable
+DataSource = Union[bytes, bytearray, memoryview, BinaryIO, Iterable[bytes]]
+
 
 ########################################################################################################################
 # McuBoot Class
@@ -57,6 +75,28 @@ class McuBoot:  # pylint: disable=too-many-public-methods
     """Class for communication with the bootloader."""
 
     DEFAULT_MAX_PACKET_SIZE = 32
+    DEFAULT_READ_WINDOW_PACKETS = 64
+    DEFAULT_READ_RETRIES = 3
+    SB_HEADER_PEEK_SIZE = 0x400
+    # properties which don't change during a session, unless the target gets reconfigured
+    CACHED_PROPERTY_TAGS = [
+        PropertyTag.CURRENT_VERSION.tag,
+        PropertyTag.AVAILABLE_PERIPHERALS.tag,
+        PropertyTag.FLASH_START_ADDRESS.tag,
+        PropertyTag.FLASH_SIZE.tag,
+        PropertyTag.FLASH_SECTOR_SIZE.tag,
+        PropertyTag.FLASH_BLOCK_COUNT.tag,
+        PropertyTag.AVAILABLE_COMMANDS.tag,
+        PropertyTag.MAX_PACKET_SIZE.tag,
+        PropertyTag.RESERVED_REGIONS.tag,
+        PropertyTag.RAM_START_ADDRESS.tag,
+        PropertyTag.RAM_SIZE.tag,
+        PropertyTag.SYSTEM_DEVICE_IDENT.tag,
+        PropertyTag.UNIQUE_DEVICE_IDENT.tag,
+        PropertyTag.TARGET_VERSION.tag,
+        PropertyTag.EXTERNAL_MEMORY_ATTRIBUTES.tag,
+        PropertyTag.FLASH_PAGE_SIZE.tag,
+    ]
 
     @property
     def status_code(self) -> int:
@@ -73,14 +113,20 @@ class McuBoot:  # pylint: disable=too-many-public-methods
         """Return True if the device is open."""
         return self._interface.is_opened
 
-    def __init__(self, interface: MbootProtocolBase, cmd_exception: bool = False) -> None:
+    def __init__(
+        self,
+        interface: MbootProtocolBase,
+        cmd_exception: bool = False,
+        cache_properties: bool = True,
+    ) -> None:
         """Initialize the McuBoot object.
 
         :param interface: The instance of communication interface class
         :param cmd_exception: True to throw McuBootCommandError on any error;
                 False to set status code only
                 Note: some operation might raise McuBootCommandError is all cases
-
+        :param cache_properties: True to cache static properties (see CACHED_PROPERTY_TAGS)
+                for the duration of the connection; False to always query the target
         """
         self._cmd_exception = cmd_exception
         self._status_code = StatusCode.SUCCESS.tag
@@ -88,6 +134,10 @@ class McuBoot:  # pylint: disable=too-many-public-methods
         self.reopen = False
         self.enable_data_abort = False
         self._pause_point: Optional[int] = None
+        self.read_window_packets = self.DEFAULT_READ_WINDOW_PACKETS
+        self.read_retries = self.DEFAULT_READ_RETRIES
+        self.cache_properties = cache_properties
+        self._property_cache: Dict[Tuple[int, int], List[int]] = {}
 
     def __enter__(self) -> "McuBoot":
         self.reopen = True
@@ -148,28 +198,72 @@ class McuBoot:  # pylint: disable=too-many-public-methods
         :raises McuBootCommandError: Error during command execution on the target
         :return: Data read from the device
         """
-        data = b""
+        buffer = bytearray(length)
+        with memoryview(buffer) as view:
+            received = self._read_data_into(cmd_tag, view, progress_callback)
+        del buffer[received:]
+        return bytes(buffer)
+
+    def _read_data_into(
+        self,
+        cmd_tag: CommandTag,
+        buffer: memoryview,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+    ) -> int:
+        """Read data from device directly into preallocated buffer.
+
+        :param cmd_tag: Tag indicating the read command.
+        :param buffer: Buffer for the incoming data, its length is the expected length of data
+        :param progress_callback: Callback for updating the caller about the progress
+        :raises McuBootConnectionError: Timeout error or a problem opening the interface
+        :raises McuBootCommandError: Error during command execution on the target
+        :return: Number of bytes received into the buffer
+        """
+        received, response = self._receive_data_into(cmd_tag, buffer, progress_callback)
+        if len(buffer) > received or self.status_code != StatusCode.SUCCESS:
+            if self._cmd_exception:
+                assert isinstance(response, CmdResponse)
+                raise McuBootCommandError(cmd_tag.label, response.status)
+        return received
+
+    def _receive_data_into(
+        self,
+        cmd_tag: CommandTag,
+        buffer: memoryview,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+    ) -> Tuple[int, Optional[CmdResponse]]:
+        """Receive data from device into preallocated buffer, without raising on command errors.
 
+        :param cmd_tag: Tag indicating the read command.
+        :param buffer: Buffer for the incoming data, its length is the expected length of data
+        :param progress_callback: Callback for updating the caller about the progress
+        :raises McuBootConnectionError: Timeout error or a problem opening the interface
+        :return: Number of bytes received into the buffer and the final response
+        """
         if not self.is_opened:
             logger.error("RX: Device not opened")
             raise McuBootConnectionError("Device not opened")
+
+        length = len(buffer)
+        received = 0
+        response = None
         while True:
             try:
-                response = self._interface.read()
+                response = self._interface.readinto(buffer[received:])
             except McuBootDataAbortError as e:
                 logger.error(f"RX: {e}")
                 logger.info("Try increasing the timeout value")
-                response = self._interface.read()
+                response = self._interface.readinto(buffer[received:])
             except TimeoutError:
                 self._status_code = StatusCode.NO_RESPONSE.tag
                 logger.error("RX: No Response, Timeout Error !")
                 response = NoResponse(cmd_tag=cmd_tag.tag)
                 break
 
-            if isinstance(response, bytes):
-                data += response
+            if isinstance(response, int):
+                received += response
                 if progress_callback:
-                    progress_callback(len(data), length)
+                    progress_callback(received, length)
 
             elif isinstance(response, GenericResponse):
                 logger.debug(f"RX-PACKET: {str(response)}")
@@ -177,32 +271,31 @@ class McuBoot:  # pylint: disable=too-many-public-methods
                 if response.cmd_tag == cmd_tag:
                     break
 
-        if len(data) < length or self.status_code != StatusCode.SUCCESS:
+        if received < length or self.status_code != StatusCode.SUCCESS:
             status_info = (
                 StatusCode.get_label(self._status_code)
                 if self._status_code in StatusCode.tags()
                 else f"0x{self._status_code:08X}"
             )
-            logger.debug(f"CMD: Received {len(data)} from {length} Bytes, {status_info}")
-            if self._cmd_exception:
-                assert isinstance(response, CmdResponse)
-                raise McuBootCommandError(cmd_tag.label, response.status)
+            logger.debug(f"CMD: Received {received} from {length} Bytes, {status_info}")
         else:
-            logger.info(f"CMD: Successfully Received {len(data)} from {length} Bytes")
+            logger.info(f"CMD: Successfully Received {received} from {length} Bytes")
 
-        return data[:length] if len(data) > length else data
+        return received, response if isinstance(response, CmdResponse) else None
 
     def _send_data(
         self,
         cmd_tag: CommandTag,
-        data: List[bytes],
+        data: Iterable[bytes],
         progress_callback: Optional[Callable[[int, int], None]] = None,
+        length: Optional[int] = None,
     ) -> bool:
         """Send Data part of specific command.
 
         :param cmd_tag: Tag indicating the command
-        :param data: List of data chunks to send
+        :param data: Data chunks to send
         :param progress_callback: Callback for updating the caller about the progress
+        :param length: Total length of data, if not specified chunks are collected to compute it
         :raises McuBootConnectionError: Timeout error
         :raises McuBootCommandError: Error during command execution on the target
         :return: True if the operation is successful
@@ -211,8 +304,11 @@ class McuBoot:  # pylint: disable=too-many-public-methods
             logger.info("TX: Device Disconnected")
             raise McuBootConnectionError("Device Disconnected !")
 
+        if length is None:
+            data = list(data)
+            length = sum(len(chunk) for chunk in data)
         total_sent = 0
-        total_to_send = sum(len(chunk) for chunk in data)
+        total_to_send = length
         # this difference is applicable for load-image and program-aeskey commands
         expect_response = cmd_tag != CommandTag.NO_COMMAND
         self._interface.allow_abort = self.enable_data_abort
@@ -274,26 +370,36 @@ class McuBoot:  # pylint: disable=too-many-public-methods
             )
         return packet_size_property[0]
 
-    def _split_data(self, data: bytes) -> List[bytes]:
+    def _split_data(self, data: DataSource, length: Optional[int] = None) -> Iterator[bytes]:
         """Split data to send if necessary.
 
+        Chunks are produced lazily: bytes-like data are sliced via memoryview (no copies),
+        file objects are read chunk by chunk and chunks of an iterable are split further if needed.
+
         :param data: Data to send
-        :return: List of data splices
+        :param length: Maximal count of bytes to take from a file object
+        :return: Iterator over data splices
         """
-        if not self._interface.need_data_split:
-            return [data]
-        max_packet_size = self._get_max_packet_size()
-        logger.info(f"CMD: Max Packet Size = {max_packet_size}")
-        return [data[i : i + max_packet_size] for i in range(0, len(data), max_packet_size)]
+        max_packet_size = None
+        if self._interface.need_data_split:
+            max_packet_size = self._get_max_packet_size()
+            logger.info(f"CMD: Max Packet Size = {max_packet_size}")
+        return _iter_data_chunks(data, max_packet_size, length)
+
+    def clear_property_cache(self) -> None:
+        """Clear cached values of static properties."""
+        self._property_cache.clear()
 
     def open(self) -> None:
         """Connect to the device."""
         logger.info(f"Connect: {str(self._interface)}")
+        self.clear_property_cache()
         self._interface.open()
 
     def close(self) -> None:
         """Disconnect from the device."""
         logger.info(f"Closing: {str(self._interface)}")
+        self.clear_property_cache()
         self._interface.close()
 
     def get_property_list(self) -> List[PropertyValueBase]:
@@ -524,74 +630,131 @@ class McuBoot:  # pylint: disable=too-many-public-methods
 
         # workaround for better USB-HID reliability
         if isinstance(self._interface.device, UsbDevice) and not fast_mode:
-            payload_size = self._get_max_packet_size()
-            packets = length // payload_size
-            remainder = length % payload_size
-            if remainder:
-                packets += 1
+            return self._read_memory_windowed(address, length, mem_id, progress_callback)
+
+        cmd_packet = CmdPacket(
+            CommandTag.READ_MEMORY, CommandFlag.NONE.tag, address, length, mem_id
+        )
+        cmd_response = self._process_cmd(cmd_packet)
+        if cmd_response.status == StatusCode.SUCCESS:
+            assert isinstance(cmd_response, ReadMemoryResponse)
+            return self._read_data(CommandTag.READ_MEMORY, cmd_response.length, progress_callback)
+        return None
 
-            data = b""
+    def _read_memory_windowed(
+        self,
+        address: int,
+        length: int,
+        mem_id: int,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+    ) -> bytes:
+        """Read data from MCU memory in bounded windows.
 
-            for idx in range(packets):
-                if idx == packets - 1 and remainder:
-                    data_len = remainder
-                else:
-                    data_len = payload_size
+        The read is split into windows of `read_window_packets` max-size packets, each window
+        being a separate READ_MEMORY command. If the device stops responding within a window,
+        only the rest of that window is requested again (up to `read_retries` times).
 
+        :param address: Start address
+        :param length: Count of bytes
+        :param mem_id: Memory ID
+        :param progress_callback: Callback for updating the caller about the progress
+        :return: Data read from the memory; partial data in case of a failure
+        """
+        window_size = self._get_max_packet_size() * max(self.read_window_packets, 1)
+        data = bytearray(length)
+        received = 0
+        windows = 0
+        retries = 0
+        start_time = time.perf_counter()
+
+        with memoryview(data) as view:
+            while received < length:
+                window_len = min(window_size, length - received)
                 cmd_packet = CmdPacket(
                     CommandTag.READ_MEMORY,
                     CommandFlag.NONE.tag,
-                    address + idx * payload_size,
-                    data_len,
+                    address + received,
+                    window_len,
                     mem_id,
                 )
-                cmd_response = self._process_cmd(cmd_packet)
-                if cmd_response.status == StatusCode.SUCCESS:
-                    data += self._read_data(CommandTag.READ_MEMORY, data_len)
+                windows += 1
+                chunk_len = 0
+                try:
+                    cmd_response = self._process_cmd(cmd_packet)
+                    if cmd_response.status == StatusCode.SUCCESS:
+                        # the data received before a failure are kept, the next window
+                        # continues at the first missing byte
+                        chunk_len, _ = self._receive_data_into(
+                            CommandTag.READ_MEMORY, view[received : received + window_len]
+                        )
+                    elif cmd_response.status != StatusCode.NO_RESPONSE:
+                        break
+                except McuBootCommandError as exc:
+                    if exc.error_value != StatusCode.NO_RESPONSE or retries >= self.read_retries:
+                        raise
+
+                if chunk_len:
+                    received += chunk_len
                     if progress_callback:
-                        progress_callback(len(data), length)
-                    if self._status_code == StatusCode.NO_RESPONSE:
-                        logger.warning(f"CMD: NO RESPONSE, received {len(data)}/{length} B")
-                        return data
-                else:
-                    return b""
+                        progress_callback(received, length)
 
-            return data
+                if chunk_len == window_len and self._status_code == StatusCode.SUCCESS:
+                    retries = 0
+                    continue
+                if (
+                    self._status_code not in [StatusCode.SUCCESS, StatusCode.NO_RESPONSE]
+                    or retries >= self.read_retries
+                ):
+                    logger.warning(f"CMD: Read failed, received {received}/{length} B")
+                    if self._cmd_exception:
+                        raise McuBootCommandError(CommandTag.READ_MEMORY.label, self._status_code)
+                    break
+                retries += 1
+                logger.info(
+                    f"CMD: Incomplete window, resuming read at 0x{address + received:08X} "
+                    f"(retry {retries}/{self.read_retries})"
+                )
 
-        cmd_packet = CmdPacket(
-            CommandTag.READ_MEMORY, CommandFlag.NONE.tag, address, length, mem_id
-        )
-        cmd_response = self._process_cmd(cmd_packet)
-        if cmd_response.status == StatusCode.SUCCESS:
-            assert isinstance(cmd_response, ReadMemoryResponse)
-            return self._read_data(CommandTag.READ_MEMORY, cmd_response.length, progress_callback)
-        return None
+        elapsed = time.perf_counter() - start_time
+        if received == length and elapsed > 0:
+            logger.info(
+                f"CMD: Read {received} B in {windows} window(s), {elapsed:.3f} s, "
+                f"{received / elapsed / 1024:.1f} kB/s, "
+                f"{elapsed * 1000 / windows:.1f} ms/window"
+            )
+        del data[received:]
+        return bytes(data)
 
     def write_memory(
         self,
         address: int,
-        data: bytes,
+        data: DataSource,
         mem_id: int = 0,
         progress_callback: Optional[Callable[[int, int], None]] = None,
+        length: Optional[int] = None,
     ) -> bool:
         """Write data into MCU memory.
 
         :param address: Start address
-        :param data: List of bytes
+        :param data: Data to write; bytes-like object, binary file object or iterable of chunks
         :param progress_callback: Callback for updating the caller about the progress
         :param mem_id: Memory ID, see ExtMemId; additionally use `0` for internal memory
+        :param length: Count of bytes to write; mandatory if data are provided as an iterable,
+            for file object the rest of the file is written by default
         :return: False in case of any problem; True otherwise
         """
-        logger.info(
-            f"CMD: WriteMemory(address=0x{address:08X}, length={len(data)}, mem_id={mem_id})"
-        )
-        data_chunks = self._split_data(data=data)
+        data = _buffer_unseekable(data)
+        length = _get_data_length(data, length)
+        logger.info(f"CMD: WriteMemory(address=0x{address:08X}, length={length}, mem_id={mem_id})")
+        data_chunks = self._split_data(data=data, length=length)
         mem_id = _clamp_down_memory_id(memory_id=mem_id)
         cmd_packet = CmdPacket(
-            CommandTag.WRITE_MEMORY, CommandFlag.HAS_DATA_PHASE.tag, address, len(data), mem_id
+            CommandTag.WRITE_MEMORY, CommandFlag.HAS_DATA_PHASE.tag, address, length, mem_id
         )
         if self._process_cmd(cmd_packet).status == StatusCode.SUCCESS:
-            return self._send_data(CommandTag.WRITE_MEMORY, data_chunks, progress_callback)
+            return self._send_data(
+                CommandTag.WRITE_MEMORY, data_chunks, progress_callback, length=length
+            )
         return False
 
     def fill_memory(self, address: int, length: int, pattern: int = 0xFFFFFFFF) -> bool:
@@ -620,6 +783,8 @@ class McuBoot:  # pylint: disable=too-many-public-methods
         if len(backdoor_key) != 8:
             raise McuBootError("Backdoor key must by 8 bytes long")
         logger.info(f"CMD: FlashSecurityDisable(backdoor_key={backdoor_key!r})")
+        # security state and available commands are changed
+        self.clear_property_cache()
         key_high = backdoor_key[0:4][::-1]
         key_low = backdoor_key[4:8][::-1]
         cmd_packet = CmdPacket(
@@ -635,11 +800,18 @@ class McuBoot:  # pylint: disable=too-many-public-methods
         :return: list integers representing the property; None in case no response from device
         :raises McuBootError: If received invalid get-property response
         """
+        cache_key = (prop_tag.tag, index)
+        if self.cache_properties and cache_key in self._property_cache:
+            logger.info(f"CMD: GetProperty({prop_tag.label}, index={index!r}) [cached]")
+            self._status_code = StatusCode.SUCCESS.tag
+            return list(self._property_cache[cache_key])
         logger.info(f"CMD: GetProperty({prop_tag.label}, index={index!r})")
         cmd_packet = CmdPacket(CommandTag.GET_PROPERTY, CommandFlag.NONE.tag, prop_tag.tag, index)
         cmd_response = self._process_cmd(cmd_packet)
         if cmd_response.status == StatusCode.SUCCESS:
             if isinstance(cmd_response, GetPropertyResponse):
+                if self.cache_properties and prop_tag.tag in self.CACHED_PROPERTY_TAGS:
+                    self._property_cache[cache_key] = list(cmd_response.values)
                 return cmd_response.values
             raise McuBootError(f"Received invalid get-property response: {str(cmd_response)}")
         return None
@@ -652,31 +824,39 @@ class McuBoot:  # pylint: disable=too-many-public-methods
         :return: False in case of any problem; True otherwise
         """
         logger.info(f"CMD: SetProperty({prop_tag.label}, value=0x{value:08X})")
+        self.clear_property_cache()
         cmd_packet = CmdPacket(CommandTag.SET_PROPERTY, CommandFlag.NONE.tag, prop_tag.tag, value)
         cmd_response = self._process_cmd(cmd_packet)
         return cmd_response.status == StatusCode.SUCCESS
 
     def receive_sb_file(
         self,
-        data: bytes,
+        data: DataSource,
         progress_callback: Optional[Callable[[int, int], None]] = None,
         check_errors: bool = False,
+        length: Optional[int] = None,
     ) -> bool:
         """Receive SB file.
 
-        :param  data: SB file data
+        :param  data: SB file data; bytes-like object, binary file object or iterable of chunks
         :param progress_callback: Callback for updating the caller about the progress
         :param check_errors: Check for ABORT_FRAME (and related errors) on USB interface between data packets.
             When this parameter is set to `False` significantly improves USB transfer speed (cca 20x)
             However, the final status code might be misleading (original root cause may get overridden)
             In case `receive-sb-file` fails, re-run the operation with this flag set to `True`
+        :param length: Length of SB file; mandatory if data are provided as an iterable
         :return: False in case of any problem; True otherwise
         """
-        logger.info(f"CMD: ReceiveSBfile(data_length={len(data)})")
-        data_chunks = self._split_data(data=data)
-        cmd_packet = CmdPacket(
-            CommandTag.RECEIVE_SB_FILE, CommandFlag.HAS_DATA_PHASE.tag, len(data)
-        )
+        data = _buffer_unseekable(data)
+        length = _get_data_length(data, length)
+        logger.info(f"CMD: ReceiveSBfile(data_length={length})")
+        # SB file may reconfigure the target (e.g. external memories)
+        self.clear_property_cache()
+        header = b""
+        if isinstance(self._interface.device, UsbDevice):
+            header, data = _peek_data(data, self.SB_HEADER_PEEK_SIZE)
+        data_chunks = self._split_data(data=data, length=length)
+        cmd_packet = CmdPacket(CommandTag.RECEIVE_SB_FILE, CommandFlag.HAS_DATA_PHASE.tag, length)
         cmd_response = self._process_cmd(cmd_packet)
         if cmd_response.status == StatusCode.SUCCESS:
             self.enable_data_abort = check_errors
@@ -685,7 +865,7 @@ class McuBoot:  # pylint: disable=too-many-public-methods
                     # pylint: disable=import-outside-toplevel   # import only if needed to save time
                     from spsdk.sbfile.sb2.images import ImageHeaderV2
 
-                    sb2_header = ImageHeaderV2.parse(data=data)
+                    sb2_header = ImageHeaderV2.parse(data=header)
                     self._pause_point = sb2_header.first_boot_tag_block * 16
                 except SPSDKError:
                     pass
@@ -693,11 +873,13 @@ class McuBoot:  # pylint: disable=too-many-public-methods
                     # pylint: disable=import-outside-toplevel   # import only if needed to save time
                     from spsdk.sbfile.sb31.images import SecureBinary31Header
 
-                    sb3_header = SecureBinary31Header.parse(data=data)
+                    sb3_header = SecureBinary31Header.parse(data=header)
                     self._pause_point = sb3_header.image_total_length
                 except SPSDKError:
                     pass
-            result = self._send_data(CommandTag.RECEIVE_SB_FILE, data_chunks, progress_callback)
+            result = self._send_data(
+                CommandTag.RECEIVE_SB_FILE, data_chunks, progress_callback, length=length
+            )
             self.enable_data_abort = False
             return result
         return False
@@ -771,6 +953,8 @@ class McuBoot:  # pylint: disable=too-many-public-methods
         :return: False in case of any problem; True otherwise
         """
         logger.info("CMD: FlashEraseAllUnsecure")
+        # security state and available commands are changed
+        self.clear_property_cache()
         cmd_packet = CmdPacket(CommandTag.FLASH_ERASE_ALL_UNSECURE, CommandFlag.NONE.tag)
         return self._process_cmd(cmd_packet).status == StatusCode.SUCCESS
 
@@ -800,6 +984,8 @@ class McuBoot:  # pylint: disable=too-many-public-methods
             f"CMD: FlashProgramOnce(index={index}, value=0x{value:X}) "
             f"with{'' if verify else 'out'} verification."
         )
+        # fuses may change security state of the target
+        self.clear_property_cache()
         cmd_packet = CmdPacket(CommandTag.FLASH_PROGRAM_ONCE, CommandFlag.NONE.tag, index, 4, value)
         cmd_response = self._process_cmd(cmd_packet)
         if cmd_response.status != StatusCode.SUCCESS:
@@ -883,6 +1069,7 @@ class McuBoot:  # pylint: disable=too-many-public-methods
         :return: False in case of any problem; True otherwise
         """
         logger.info(f"CMD: ConfigureMemory({mem_id}, address=0x{address:08X})")
+        self.clear_property_cache()
         cmd_packet = CmdPacket(CommandTag.CONFIGURE_MEMORY, CommandFlag.NONE.tag, mem_id, address)
         return self._process_cmd(cmd_packet).status == StatusCode.SUCCESS
 
@@ -1676,6 +1863,106 @@ def _tp_sentinel_frame(command: int, args: List[int], tag: int = 0x17, version:
     return data
 
 
+def _buffer_unseekable(data: DataSource) -> DataSource:
+    """Read a non-seekable file object (e.g. stdin or a pipe) into memory.
+
+    Length of such stream cannot be determined and its beginning cannot be peeked.
+
+    :param data: Data to send
+    :return: Data in memory for non-seekable file object; the original data otherwise
+    """
+    if hasattr(data, "read") and not cast(BinaryIO, data).seekable():
+        return cast(BinaryIO, data).read()
+    return data
+
+
+def _get_data_length(data: DataSource, length: Optional[int] = None) -> int:
+    """Get length of data to be sent.
+
+    :param data: Data to send
+    :param length: Explicit length of data, mandatory for iterables; negative value means all data
+    :return: Length of data in bytes
+    :raises McuBootError: Length of data cannot be determined
+    """
+    if length is not None and length < 0:
+        length = None
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        data_length = memoryview(data).nbytes
+    elif hasattr(data, "read"):
+        stream = cast(BinaryIO, data)
+        position = stream.tell()
+        data_length = stream.seek(0, os.SEEK_END) - position
+        stream.seek(position)
+    elif length is None:
+        raise McuBootError("Length of data must be specified when sending data from an iterable")
+    else:
+        return length
+    return data_length if length is None else min(length, data_length)
+
+
+def _peek_data(data: DataSource, size: int) -> Tuple[bytes, DataSource]:
+    """Get the beginning of data without consuming it.
+
+    :param data: Data to send
+    :param size: Count of bytes to peek
+    :return: Tuple of the peeked bytes and data source to be used instead of the original one
+    """
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        return bytes(memoryview(data).cast("B")[:size]), data
+    if hasattr(data, "read"):
+        stream = cast(BinaryIO, data)
+        position = stream.tell()
+        header = stream.read(size)
+        stream.seek(position)
+        return header, stream
+    iterator = iter(data)
+    first_chunk = next(iterator, b"")
+    return bytes(first_chunk[:size]), itertools.chain([first_chunk], iterator)
+
+
+def _iter_data_chunks(
+    data: DataSource, chunk_size: Optional[int] = None, length: Optional[int] = None
+) -> Iterator[bytes]:
+    """Produce data chunks of at most `chunk_size` bytes.
+
+    :param data: Data to send
+    :param chunk_size: Maximal size of a chunk, None to keep the data in one piece if possible
+    :param length: Maximal count of bytes to take from bytes-like data or a file object
+    :return: Iterator over data chunks
+    """
+    if length is not None and length < 0:
+        length = None
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        view = memoryview(data).cast("B")[:length]
+        if not chunk_size:
+            yield cast(bytes, view)
+            return
+        for offset in range(0, len(view), chunk_size):
+            yield cast(bytes, view[offset : offset + chunk_size])
+        return
+    if hasattr(data, "read"):
+        stream = cast(BinaryIO, data)
+        remaining = length
+        while remaining is None or remaining > 0:
+            read_size = chunk_size or -1
+            if remaining is not None:
+                read_size = remaining if read_size < 0 else min(read_size, remaining)
+            chunk = stream.read(read_size)
+            if not chunk:
+                return
+            if remaining is not None:
+                remaining -= len(chunk)
+            yield chunk
+        return
+    for block in data:
+        if not chunk_size or len(block) <= chunk_size:
+            yield block
+            continue
+        block_view = memoryview(block).cast("B")
+        for offset in range(0, len(block_view), chunk_size):
+            yield cast(bytes, block_view[offset : offset + chunk_size])
+
+
 def _clamp_down_memory_id(memory_id: int) -> int:
     if memory_id > 255 or memory_id == 0:
         return memory_id
@@ -6,6 +6,9 @@
 # SPDX-License-Identifier: BSD-3-Clause
 
 """MBoot protocol base."""
+from typing import Union
+
+from spsdk.utils.interfaces.commands import CmdResponseBase
 from spsdk.utils.interfaces.protocol.protocol_base import ProtocolBase
 
 
@@ -14,3 +17,18 @@ class MbootProtocolBase(ProtocolBase):
 
     allow_abort: bool = False
     need_data_split: bool = True
+
+    def readinto(self, buffer: memoryview) -> Union[CmdResponseBase, int]:
+        """Read data from device directly into the provided buffer.
+
+        Data exceeding the size of the buffer are dropped.
+
+        :param buffer: Writable buffer for the incoming data
+        :return: Command response or number of bytes stored in the buffer
+        """
+        response = self.read(len(buffer))
+        if isinstance(response, CmdResponseBase):
+            return response
+        length = min(len(response), len(buffer))
+        buffer[:length] = response[:length]
+        return length
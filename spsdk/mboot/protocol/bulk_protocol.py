@@ -88,6 +88,29 @@ class MbootBulkProtocol(MbootProtocolBase):
             raise SPSDKTimeoutError()
         return self._parse_frame(bytes(data))
 
+    def readinto(self, buffer: memoryview) -> Union[CmdResponse, int]:
+        """Read data from device directly into the provided buffer.
+
+        :param buffer: Writable buffer for the incoming data
+        :return: Command response or number of bytes stored in the buffer
+        :raises SPSDKTimeoutError: Timeout occurred
+        :raises McuBootDataAbortError: Transaction aborted by target
+        """
+        raw_data = self.device.read(1024)
+        if not raw_data:
+            logger.error("Cannot read from HID device")
+            raise SPSDKTimeoutError()
+        report_id, _, plen = unpack_from("<2BH", raw_data)
+        if report_id == ReportId.CMD_IN or plen == 0:
+            response = self._parse_frame(bytes(raw_data))
+            assert isinstance(response, CmdResponse)
+            return response
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"IN [{len(raw_data)}]: {', '.join(f'{b:02X}' for b in raw_data)}")
+        length = min(plen, len(raw_data) - 4, len(buffer))
+        buffer[:length] = memoryview(raw_data)[4 : 4 + length]
+        return length
+
     def _create_frame(self, data: bytes, report_id: ReportId) -> bytes:
         """Encode the USB packet.
 
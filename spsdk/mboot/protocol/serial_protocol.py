@@ -21,11 +21,16 @@ from spsdk.mboot.commands import CmdResponse, parse_cmd_response
 from spsdk.mboot.exceptions import McuBootConnectionError, McuBootDataAbortError
 from spsdk.mboot.protocol.base import MbootProtocolBase
 from spsdk.utils.interfaces.commands import CmdPacketBase
+from spsdk.utils.interfaces.device.base import DeviceBase
+from spsdk.utils.interfaces.device.serial_device import SerialDevice
 from spsdk.utils.misc import Endianness, Timeout
 from spsdk.utils.spsdk_enum import SpsdkEnum
 
 logger = logging.getLogger(__name__)
 
+# CRC16-XMODEM function with precomputed table, creating of the function is expensive
+_calc_crc16_xmodem = mkPredefinedCrcFun("xmodem")
+
 
 class PingResponse(NamedTuple):
     """Special type of response for Ping Command."""
@@ -81,9 +86,39 @@ class MbootSerialProtocol(MbootProtocolBase):
     PING_TIMEOUT_MS = 500
     MAX_PING_RESPONSE_DUMMY_BYTES = 50
     MAX_UART_OPEN_ATTEMPTS = 3
+    # Frame header (start byte, frame type, payload length) and CRC of the frame
+    FRAME_HEADER = struct.Struct("<BBH")
+    FRAME_CRC = struct.Struct("<H")
     protocol_version: int = 0
     options: int = 0
 
+    def __init__(self, device: DeviceBase) -> None:
+        """Initialize the MbootSerialProtocol object.
+
+        :param device: The device instance
+        """
+        super().__init__(device)
+        self._overlapped_ack = False
+        self._pending_acks = 0
+
+    @property
+    def overlapped_ack(self) -> bool:
+        """Send next data frame before the ACK of the previous one is received.
+
+        The round trip of the ACK is overlapped with sending of the next frame, so the ACK of
+        each data frame is checked one frame later. Disabled by default.
+        """
+        return self._overlapped_ack
+
+    @overlapped_ack.setter
+    def overlapped_ack(self, value: bool) -> None:
+        """Enable or disable overlapped ACK of data frames."""
+        self._wait_for_pending_acks()
+        self._overlapped_ack = value
+        # pending ACK must not be discarded when the next frame is sent
+        if isinstance(self.device, SerialDevice):
+            self.device.reset_input_on_write = not value
+
     def open(self) -> None:
         """Open the interface.
 
@@ -111,6 +146,7 @@ class MbootSerialProtocol(MbootProtocolBase):
 
     def close(self) -> None:
         """Close the interface."""
+        self._pending_acks = 0
         self.device.close()
 
     @property
@@ -124,7 +160,14 @@ class MbootSerialProtocol(MbootProtocolBase):
         :param data: Data to be sent
         """
         frame = self._create_frame(data, FPType.DATA)
-        self._send_frame(frame)
+        if self._overlapped_ack:
+            self._send_frame(frame, wait_for_ack=False)
+            self._pending_acks += 1
+            # only the ACK of the previous frame is waited for
+            if self._pending_acks > 1:
+                self._wait_for_pending_acks(keep=1)
+        else:
+            self._send_frame(frame)
 
     def write_command(self, packet: CmdPacketBase) -> None:
         """Encapsulate command into frames and send them to device.
@@ -136,6 +179,7 @@ class MbootSerialProtocol(MbootProtocolBase):
         if not data:
             raise SPSDKAttributeError("Incorrect packet type")
         frame = self._create_frame(data, FPType.CMD)
+        self._wait_for_pending_acks()
         self._send_frame(frame)
 
     def read(self, length: Optional[int] = None) -> Union[CmdResponse, bytes]:
@@ -145,6 +189,7 @@ class MbootSerialProtocol(MbootProtocolBase):
         :raises McuBootDataAbortError: Indicates data transmission abort
         :raises McuBootConnectionError: When received invalid CRC
         """
+        self._wait_for_pending_acks()
         _, frame_type = self._read_frame_header()
         _length = to_int(self._read(2))
         crc = to_int(self._read(2))
@@ -160,14 +205,22 @@ class MbootSerialProtocol(MbootProtocolBase):
             return parse_cmd_response(data)
         return data
 
+    def _wait_for_pending_acks(self, keep: int = 0) -> None:
+        """Wait for ACKs of data frames sent in overlapped mode.
+
+        :param keep: Count of ACKs that may stay pending
+        """
+        while self._pending_acks > keep:
+            self._pending_acks -= 1
+            self._read_frame_header(FPType.ACK)
+
     def _read(self, length: int, timeout: Optional[int] = None) -> bytes:
         """Internal read, done mainly due BUSPAL, where this is overriden."""
         return self.device.read(length, timeout)
 
     def _send_ack(self) -> None:
         """Send ACK command."""
-        ack_frame = struct.pack("<BB", self.FRAME_START_BYTE, FPType.ACK.tag)
-        self._send_frame(ack_frame, wait_for_ack=False)
+        self._send_frame(bytes((self.FRAME_START_BYTE, FPType.ACK.tag)), wait_for_ack=False)
 
     def _send_frame(self, frame: bytes, wait_for_ack: bool = True) -> None:
         """Write frame to the device and wait for ack.
@@ -179,17 +232,14 @@ class MbootSerialProtocol(MbootProtocolBase):
             self._read_frame_header(FPType.ACK)
 
     def _create_frame(self, data: bytes, frame_type: FPType) -> bytes:
-        """Encapsulate data into frame."""
-        crc = self._calc_frame_crc(data, frame_type.tag)
-        frame = struct.pack(
-            f"<BBHH{len(data)}B",
-            self.FRAME_START_BYTE,
-            frame_type.tag,
-            len(data),
-            crc,
-            *data,
-        )
-        return frame
+        """Encapsulate data into frame.
+
+        The payload is copied just once into the frame, the CRC is computed incrementally
+        over the header and payload.
+        """
+        header = self.FRAME_HEADER.pack(self.FRAME_START_BYTE, frame_type.tag, len(data))
+        crc = self._calc_crc(data, self._calc_crc(header))
+        return b"".join((header, self.FRAME_CRC.pack(crc), data))
 
     def _calc_frame_crc(self, data: bytes, frame_type: int) -> int:
         """Calculate the CRC of a frame.
@@ -198,20 +248,20 @@ class MbootSerialProtocol(MbootProtocolBase):
         :param frame_type: frame type
         :return: calculated CRC
         """
-        crc_data = struct.pack(
-            f"<BBH{len(data)}B", self.FRAME_START_BYTE, frame_type, len(data), *data
-        )
-        return self._calc_crc(crc_data)
+        header = self.FRAME_HEADER.pack(self.FRAME_START_BYTE, frame_type, len(data))
+        return self._calc_crc(data, self._calc_crc(header))
 
     @staticmethod
-    def _calc_crc(data: bytes) -> int:
+    def _calc_crc(data: bytes, crc: Optional[int] = None) -> int:
         """Calculate CRC from the data.
 
         :param data: data to calculate CRC from
+        :param crc: CRC of the previous data to continue with, defaults to None
         :return: calculated CRC
         """
-        crc_function = mkPredefinedCrcFun("xmodem")
-        return crc_function(data)
+        if crc is None:
+            return _calc_crc16_xmodem(data)
+        return _calc_crc16_xmodem(data, crc)
 
     def _read_frame_header(self, expected_frame_type: Optional[FPType] = None) -> Tuple[int, int]:
         """Read frame header and frame type. Return them as tuple of integers.
@@ -296,10 +346,7 @@ class MbootSerialProtocol(MbootProtocolBase):
             # ping response has different crc computation than the other responses
             # that's why we can't use calc_frame_crc method
             # crc data for ping excludes the last 2B of response data, which holds the CRC from device
-            crc_data = struct.pack(
-                f"<BB{len(response_data) -2}B", header, frame_type, *response_data[:-2]
-            )
-            crc = self._calc_crc(crc_data)
+            crc = self._calc_crc(response_data[:-2], self._calc_crc(bytes([header, frame_type])))
             if crc != response.crc:
                 raise McuBootConnectionError("Received CRC doesn't match")
 
@@ -37,6 +37,44 @@ def get_mboot_interface(
     :raises SPSDKError: Only one of the appropriate interfaces must be specified
     :raises SPSDKError: When SPSDK-specific error occurs
     """
+    devices = get_mboot_interfaces(
+        port=port,
+        usb=usb,
+        sdio=sdio,
+        buspal=buspal,
+        lpcusbsio=lpcusbsio,
+        plugin=plugin,
+        timeout=timeout,
+    )
+    if len(devices) > 1:
+        raise SPSDKError(f"Multiple '{devices[0].identifier}' devices found: {len(devices)}")
+    return devices[0]
+
+
+def get_mboot_interfaces(
+    port: Optional[str] = None,
+    usb: Optional[str] = None,
+    sdio: Optional[str] = None,
+    buspal: Optional[str] = None,
+    lpcusbsio: Optional[str] = None,
+    plugin: Optional[str] = None,
+    timeout: int = 5000,
+) -> List[MbootProtocolBase]:
+    """Get all interfaces matching the given parameters.
+
+    'port', 'usb', 'sdio', 'lpcusbsio' parameters are mutually exclusive; one of them is required.
+
+    :param port: name and speed of the serial port (format: name[,speed]), defaults to None
+    :param usb: PID,VID of the USB interface, defaults to None
+    :param sdio: SDIO path of the SDIO interface, defaults to None
+    :param buspal: buspal interface settings, defaults to None
+    :param timeout: timeout in milliseconds
+    :param lpcusbsio: LPCUSBSIO spi or i2c config string
+    :param plugin: Additional plugin to be used
+    :return: List of found interface instances
+    :raises SPSDKError: Only one of the appropriate interfaces must be specified
+    :raises SPSDKError: No device found
+    """
     # check that one and only one interface is defined
     interface_params: List[InterfaceParams] = []
     plugin_params = parse_plugin_config(plugin) if plugin else ("Unknown", "")
@@ -90,8 +128,4 @@ def get_mboot_interface(
     )
     if len(devices) == 0:
         raise SPSDKError(f"Selected '{interface_params[0].identifier}' device not found.")
-    if len(devices) > 1:
-        raise SPSDKError(
-            f"Multiple '{interface_params[0].identifier}' devices found: {len(devices)}"
-        )
-    return devices[0]
+    return devices
@@ -375,8 +375,9 @@ class BootImageV20(BaseClass):
             counter.increment(SecBootBlckSize.to_num_blocks(len(cert_sect_bin)))
             data += cert_sect_bin
         # Add Boot Sections data
-        for sect in self._boot_sections:
-            data += sect.export(dek=self.dek, mac=self.mac, counter=counter)
+        data += b"".join(
+            sect.export(dek=self.dek, mac=self.mac, counter=counter) for sect in self._boot_sections
+        )
         # Add Signature data
         if self.signed:
             if self.signature_provider is None:
@@ -680,7 +681,6 @@ class BootImageV21(BaseClass):
         # Update internals
         self.update()
         # Export Boot Sections
-        bs_data = bytes()
         bs_offset = (
             ImageHeaderV2.SIZE
             + self.HEADER_MAC_SIZE
@@ -694,8 +694,9 @@ class BootImageV21(BaseClass):
         if not self._header.nonce:
             raise SPSDKError("Invalid header's nonce")
         counter = Counter(self._header.nonce, SecBootBlckSize.to_num_blocks(bs_offset))
-        for sect in self.boot_sections:
-            bs_data += sect.export(dek=self.dek, mac=self.mac, counter=counter)
+        bs_data = b"".join(
+            sect.export(dek=self.dek, mac=self.mac, counter=counter) for sect in self.boot_sections
+        )
         # Export Header
         signed_data = self._header.export(padding=padding)
         #  Add HMAC data
@@ -11,7 +11,13 @@ from struct import unpack_from
 from typing import Iterator, List, Optional
 
 from spsdk.crypto.hmac import hmac
-from spsdk.crypto.symmetric import Counter, aes_ctr_decrypt, aes_ctr_encrypt
+from spsdk.crypto.symmetric import (
+    Counter,
+    aes_ctr_decrypt,
+    aes_ctr_decrypt_counter,
+    aes_ctr_encrypt,
+    aes_ctr_encrypt_counter,
+)
 from spsdk.exceptions import SPSDKError
 from spsdk.sbfile.misc import SecBootBlckSize
 from spsdk.utils.abstract import BaseClass
@@ -142,39 +148,33 @@ class BootSectionV2(BaseClass):
         if not self._commands:
             raise SPSDKError("SB2 must contain commands")
         # Export commands
-        commands_data = b""
-        for cmd in self._commands:
-            cmd_data = cmd.export()
-            commands_data += cmd_data
+        commands_data = b"".join(cmd.export() for cmd in self._commands)
         if len(commands_data) % 16:
             commands_data += b"\x00" * (16 - (len(commands_data) % 16))
         # Encrypt header
         self._header.data = self.hmac_count
         self._header.count = len(commands_data) // 16
         encrypted_header = aes_ctr_encrypt(dek, self._header.export(), counter.value)
-        hmac_data = hmac(mac, encrypted_header)
+        hmac_data = [hmac(mac, encrypted_header)]
         counter.increment(1 + (self.hmac_count + 1) * 2)
 
-        # Encrypt commands
-        encrypted_commands = b""
-        for index in range(0, len(commands_data), 16):
-            encrypted_block = aes_ctr_encrypt(dek, commands_data[index : index + 16], counter.value)
-            encrypted_commands += encrypted_block
-            counter.increment()
+        # Encrypt commands, the counter is incremented for each block
+        encrypted_commands = aes_ctr_encrypt_counter(dek, commands_data, counter)
         # Calculate HMAC of commands
+        commands_view = memoryview(encrypted_commands)
         index = 0
         hmac_count = self._header.data
         block_size = (self._header.count // hmac_count) * 16
         while hmac_count > 0:
             enc_block = (
-                encrypted_commands[index:]
+                commands_view[index:]
                 if hmac_count == 1
-                else encrypted_commands[index : index + block_size]
+                else commands_view[index : index + block_size]
             )
-            hmac_data += hmac(mac, enc_block)
+            hmac_data.append(hmac(mac, enc_block))
             hmac_count -= 1
             index += len(enc_block)
-        return encrypted_header + hmac_data + encrypted_commands
+        return b"".join([encrypted_header, *hmac_data, encrypted_commands])
 
     # pylint: disable=too-many-locals
     @classmethod
@@ -226,25 +226,23 @@ class BootSectionV2(BaseClass):
         hmac_count = header.data
         block_size = (header.count // hmac_count) * 16
         section_size = header.count * 16
+        data_view = memoryview(data)
         while hmac_count > 0:
             if hmac_count == 1:
                 block_size = section_size
-            hmac_block = hmac(mac, data[offset : offset + block_size])
+            hmac_block = hmac(mac, data_view[offset : offset + block_size])
             if hmac_block != hmac_data[hmac_index : hmac_index + cls.HMAC_SIZE]:
                 raise SPSDKError("HMAC failed")
             hmac_count -= 1
             hmac_index += cls.HMAC_SIZE
             section_size -= block_size
             offset += block_size
-        # Decrypt commands
-        decrypted_commands = b""
-        for hmac_index in range(0, len(encrypted_commands), 16):
-            encr_block = encrypted_commands[hmac_index : hmac_index + 16]
-            decrypted_block = (
-                encr_block if plain_sect else aes_ctr_decrypt(dek, encr_block, counter.value)
-            )
-            decrypted_commands += decrypted_block
-            counter.increment()
+        # Decrypt commands, the counter is incremented for each block
+        if plain_sect:
+            decrypted_commands = encrypted_commands
+            counter.increment((len(encrypted_commands) + 15) // 16)
+        else:
+            decrypted_commands = aes_ctr_decrypt_counter(dek, encrypted_commands, counter)
         # ...
         cmd_offset = 0
         obj = cls(header.address, hmac_count=header.data)
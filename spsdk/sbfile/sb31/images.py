@@ -5,10 +5,14 @@
 #
 # SPDX-License-Identifier: BSD-3-Clause
 """Module used for generation SecureBinary V3.1."""
+import concurrent.futures
 import logging
+from collections import deque
 from datetime import datetime
+from io import BytesIO
+from itertools import chain, islice
 from struct import calcsize, pack, unpack_from
-from typing import Any, Dict, List, Optional
+from typing import Any, BinaryIO, Deque, Dict, Iterator, List, Optional, Tuple
 
 from typing_extensions import Self
 
@@ -21,11 +25,11 @@ from spsdk.crypto.signature_provider import (
 from spsdk.crypto.symmetric import aes_cbc_encrypt
 from spsdk.exceptions import SPSDKError, SPSDKValueError
 from spsdk.sbfile.sb31.commands import CFG_NAME_TO_CLASS, CmdSectionHeader, MainCmd
-from spsdk.sbfile.sb31.functions import KeyDerivator
+from spsdk.sbfile.sb31.functions import KeyDerivator, derive_block_key
 from spsdk.utils.abstract import BaseClass
 from spsdk.utils.crypto.cert_blocks import CertBlockV21
 from spsdk.utils.database import DatabaseManager, get_db, get_families, get_schema_file
-from spsdk.utils.misc import align_block, load_hex_string, value_to_int
+from spsdk.utils.misc import align, align_block, get_process_count, load_hex_string, value_to_int
 from spsdk.utils.schema_validator import CommentedConfig
 
 logger = logging.getLogger(__name__)
@@ -221,10 +225,36 @@ class SecureBinary31Header(BaseClass):
             raise SPSDKError("Invalid SB3.1 header image description.")
 
 
+def _encrypt_blocks(
+    kdk: bytes, key_length: int, kdk_access_rights: int, blocks: List[Tuple[int, bytes]]
+) -> List[Tuple[int, bytes]]:
+    """Encrypt the command blocks, each by its own derived key.
+
+    :param kdk: Key Derivation Key
+    :param key_length: Length of block keys (128/256b)
+    :param kdk_access_rights: Key Derivation Key access rights (0-3)
+    :param blocks: List of block numbers and data blocks
+    :return: List of block numbers and encrypted data blocks
+    """
+    return [
+        (
+            block_number,
+            aes_cbc_encrypt(
+                derive_block_key(kdk, block_number, key_length, kdk_access_rights), block_data
+            ),
+        )
+        for block_number, block_data in blocks
+    ]
+
+
 class SecureBinary31Commands(BaseClass):
     """Blob containing SB3.1 commands."""
 
     DATA_CHUNK_LENGTH = 256
+    # Minimal size of data encrypted in more processes
+    PARALLEL_MIN_SIZE = 0x40_0000
+    # Count of blocks encrypted at once by single process
+    PARALLEL_BATCH_BLOCKS = 256
 
     def __init__(
         self,
@@ -234,6 +264,7 @@ class SecureBinary31Commands(BaseClass):
         pck: Optional[bytes] = None,
         timestamp: Optional[int] = None,
         kdk_access_rights: Optional[int] = None,
+        max_processes: Optional[int] = 1,
     ) -> None:
         """Initialize container for SB3.1 commands.
 
@@ -243,6 +274,8 @@ class SecureBinary31Commands(BaseClass):
         :param pck: Part Common Key (needed if `is_encrypted` is True), defaults to None
         :param timestamp: Timestamp used for encryption (needed if `is_encrypted` is True), defaults to None
         :param kdk_access_rights: Key Derivation Key access rights (needed if `is_encrypted` is True), defaults to None
+        :param max_processes: Count of processes used for encryption of big SB files,
+            None for cpu_count, defaults to 1
         :raises SPSDKError: Key derivation arguments are not provided if `is_encrypted` is True
         :raises SPSDKValueError: Invalid hash type
         """
@@ -255,6 +288,7 @@ class SecureBinary31Commands(BaseClass):
         self.block_count = 0
         self.final_hash = bytes(get_hash_length(hash_type))
         self.commands: List[MainCmd] = []
+        self.max_processes = max_processes
         self.key_derivator = None
         if is_encrypted:
             if pck is None or timestamp is None or kdk_access_rights is None:
@@ -317,9 +351,62 @@ class SecureBinary31Commands(BaseClass):
 
         return data_blocks
 
+    def iter_cmd_blocks_reversed(self) -> Iterator[Tuple[int, bytes]]:
+        """Iterate over the data blocks of commands from the last one.
+
+        The commands are exported twice, first just to get the total length, so only
+        a single exported command is held in memory at once.
+
+        :return: Iterator of block numbers and data blocks, the same blocks as from
+            `get_cmd_blocks_to_export` in reversed order
+        :raises SPSDKError: Length of the exported command has changed
+        """
+        commands_length = sum(len(command.export()) for command in self.commands)
+        section_header = CmdSectionHeader(length=commands_length).export()
+        total_length = len(section_header) + commands_length
+        block_number = align(total_length, self.DATA_CHUNK_LENGTH) // self.DATA_CHUNK_LENGTH
+        self.block_count = block_number
+        # the last block is padded by zeros
+        tail = bytes(block_number * self.DATA_CHUNK_LENGTH - total_length)
+        exports = (command.export() for command in reversed(self.commands))
+        for piece in chain(exports, [section_header]):
+            data = piece + tail
+            # the end of data is always aligned to the block
+            split = len(data) % self.DATA_CHUNK_LENGTH
+            for offset in range(
+                len(data) - self.DATA_CHUNK_LENGTH, split - 1, -self.DATA_CHUNK_LENGTH
+            ):
+                yield block_number, data[offset : offset + self.DATA_CHUNK_LENGTH]
+                block_number -= 1
+            tail = data[:split]
+        if block_number or tail:
+            raise SPSDKError("Length of exported commands has changed during the export")
+
+    def write_to(self, fileobj: BinaryIO) -> int:
+        """Write the processed blocks of commands into the binary file object.
+
+        The blocks are chained by hash from the last one, so they are written directly at their
+        positions from the end, holding just a single block in memory.
+        The file object must be seekable.
+
+        :param fileobj: Binary file object to write to, the data are written at its current position
+        :return: Length of written data
+        """
+        start = fileobj.tell()
+        self.final_hash = bytes(get_hash_length(self.hash_type))
+        full_block_size = 4 + len(self.final_hash) + self.DATA_CHUNK_LENGTH
+        blocks = self._iter_encrypted_blocks(self.iter_cmd_blocks_reversed())
+        for block_number, encrypted_block in blocks:
+            fileobj.seek(start + (block_number - 1) * full_block_size)
+            fileobj.write(self._chain_block(block_number, encrypted_block))
+        length = self.block_count * full_block_size
+        fileobj.seek(start + length)
+        return length
+
     def process_cmd_blocks_to_export(self, data_blocks: List[bytes]) -> bytes:
         """Process given data blocks for export."""
         self.block_count = len(data_blocks)
+        self.final_hash = bytes(get_hash_length(self.hash_type))
 
         processed_blocks = [
             self._process_block(block_number, block_data)
@@ -330,19 +417,77 @@ class SecureBinary31Commands(BaseClass):
 
     def export(self) -> bytes:
         """Export commands as bytes."""
-        data_blocks = self.get_cmd_blocks_to_export()
-        return self.process_cmd_blocks_to_export(data_blocks)
+        output = BytesIO()
+        self.write_to(output)
+        return output.getvalue()
+
+    def _iter_encrypted_blocks(
+        self, blocks: Iterator[Tuple[int, bytes]]
+    ) -> Iterator[Tuple[int, bytes]]:
+        """Encrypt the data blocks.
+
+        The blocks are encrypted independently, so a big count of blocks is encrypted
+        in batches by more processes, keeping the order of blocks.
+
+        :param blocks: Iterator of block numbers and data blocks
+        :return: Iterator of block numbers and encrypted blocks
+        :raises SPSDKError: No key derivator
+        """
+        if not self.is_encrypted:
+            yield from blocks
+            return
+        if not self.key_derivator:
+            raise SPSDKError("No key derivator")
+        # the count of blocks is known after the first one
+        first_block = next(blocks, None)
+        if first_block is None:
+            return
+        blocks = chain([first_block], blocks)
+        process_count = get_process_count(
+            self.max_processes, self.block_count * self.DATA_CHUNK_LENGTH, self.PARALLEL_MIN_SIZE
+        )
+        if process_count == 1:
+            for block_number, block_data in blocks:
+                yield block_number, self._encrypt_block(block_number, block_data)
+            return
+
+        logger.debug(f"Using {process_count} processes for encryption of {self.block_count} blocks")
+        key_derivator = self.key_derivator
+        with concurrent.futures.ProcessPoolExecutor(max_workers=process_count) as executor:
+            # limited count of batches is processed at once, to keep the memory usage low
+            pending: Deque[concurrent.futures.Future] = deque()
+            while True:
+                batch = list(islice(blocks, self.PARALLEL_BATCH_BLOCKS))
+                if batch:
+                    pending.append(
+                        executor.submit(
+                            _encrypt_blocks,
+                            key_derivator.kdk,
+                            key_derivator.key_length,
+                            key_derivator.kdk_access_rights,
+                            batch,
+                        )
+                    )
+                if not pending:
+                    break
+                if len(pending) >= 2 * process_count or not batch:
+                    yield from pending.popleft().result()
+
+    def _encrypt_block(self, block_number: int, block_data: bytes) -> bytes:
+        """Encrypt single block."""
+        if not self.is_encrypted:
+            return block_data
+        if not self.key_derivator:
+            raise SPSDKError("No key derivator")
+        block_key = self.key_derivator.get_block_key(block_number)
+        return aes_cbc_encrypt(block_key, block_data)
 
     def _process_block(self, block_number: int, block_data: bytes) -> bytes:
         """Process single block."""
-        if self.is_encrypted:
-            if not self.key_derivator:
-                raise SPSDKError("No key derivator")
-            block_key = self.key_derivator.get_block_key(block_number)
-            encrypted_block = aes_cbc_encrypt(block_key, block_data)
-        else:
-            encrypted_block = block_data
+        return self._chain_block(block_number, self._encrypt_block(block_number, block_data))
 
+    def _chain_block(self, block_number: int, encrypted_block: bytes) -> bytes:
+        """Chain the encrypted block by hash of the following block."""
         full_block = pack(
             f"<L{len(self.final_hash)}s{len(encrypted_block)}s",
             block_number,
@@ -400,6 +545,7 @@ class SecureBinary31(BaseClass):
         flags: int = 0,
         timestamp: Optional[int] = None,
         is_encrypted: bool = True,
+        max_processes: Optional[int] = 1,
     ) -> None:
         """Constructor for Secure Binary v3.1 data container.
 
@@ -413,6 +559,8 @@ class SecureBinary31(BaseClass):
         :param flags: Flags for SB file, defaults to 0
         :param timestamp: Timestamp used for encryption (needed if `is_encrypted` is True), defaults to None
         :param is_encrypted: Indicate whether commands should be encrypted or not, defaults to True
+        :param max_processes: Count of processes used for encryption of big SB files,
+            None for cpu_count, defaults to 1
         """
         # in our case, timestamp is the number of seconds since "Jan 1, 2000"
         self.family = family
@@ -445,6 +593,7 @@ class SecureBinary31(BaseClass):
             pck=pck,
             timestamp=self.timestamp,
             kdk_access_rights=self.kdk_access_rights,
+            max_processes=max_processes,
         )
         if self.pck:
             logger.info(f"SB3KDK: {self.pck.hex()}")
@@ -512,12 +661,17 @@ class SecureBinary31(BaseClass):
 
     @classmethod
     def load_from_config(
-        cls, config: Dict[str, Any], search_paths: Optional[List[str]] = None
+        cls,
+        config: Dict[str, Any],
+        search_paths: Optional[List[str]] = None,
+        max_processes: Optional[int] = 1,
     ) -> "SecureBinary31":
         """Creates an instance of SecureBinary31 from configuration.
 
         :param config: Input standard configuration.
         :param search_paths: List of paths where to search for the file, defaults to None
+        :param max_processes: Count of processes used for encryption of big SB files,
+            None for cpu_count, defaults to 1
         :return: Instance of Secure Binary V3.1 class
         """
         family = config["family"]
@@ -577,6 +731,7 @@ class SecureBinary31(BaseClass):
             signature_provider=signature_provider,
             timestamp=timestamp,
             is_encrypted=is_encrypted,
+            max_processes=max_processes,
         )
 
         # Add commands into the SB3 object
@@ -607,32 +762,63 @@ class SecureBinary31(BaseClass):
     def export(self, cert_block: Optional[bytes] = None) -> bytes:
         """Generate binary output of SB3.1 file.
 
+        :param cert_block: Exported certification block to use, defaults to export of `cert_block`
         :return: Content of SB3.1 file in bytes.
         """
+        output = BytesIO()
+        self.write_to(output, cert_block=cert_block)
+        return output.getvalue()
+
+    def write_to(self, fileobj: BinaryIO, cert_block: Optional[bytes] = None) -> int:
+        """Write SB3.1 file into the binary file object.
+
+        The command blocks are written first from the last one, the signed header is written
+        back before them at the end, so the whole file is never held in memory.
+        The file object must be seekable.
+
+        :param fileobj: Binary file object to write to, the file is written at its current position
+        :param cert_block: Exported certification block to use, defaults to export of `cert_block`
+        :return: Length of written data
+        :raises SPSDKError: Length of the signature differs from the announced one
+        """
         self.validate()
 
         if cert_block:
             cert_block_data = cert_block
         else:
             cert_block_data = self.cert_block.export()
-        sb3_commands_data = self.sb_commands.export()
 
-        final_data = bytes()
+        start = fileobj.tell()
+        signed_length = (
+            SecureBinary31Header.HEADER_SIZE
+            + get_hash_length(self.sb_header.hash_type)
+            + len(cert_block_data)
+        )
+        # the commands are written before the signature, so its length must be known in advance
+        signature_length = self.signature_provider.signature_length
+        # COMMANDS BLOBS DATA
+        fileobj.seek(start + signed_length + signature_length)
+        commands_length = self.sb_commands.write_to(fileobj)
+
         # HEADER OF SB 3.1 FILE
         self.sb_header.update(self.sb_commands, self.cert_block)
-        final_data += self.sb_header.export()
-
+        signed_data = self.sb_header.export()
         # HASH OF PREVIOUS BLOCK
-        final_data += self.sb_commands.final_hash
-        final_data += cert_block_data
+        signed_data += self.sb_commands.final_hash
+        signed_data += cert_block_data
 
         # SIGNATURE
-        final_data += self.signature_provider.get_signature(final_data)
-
-        # COMMANDS BLOBS DATA
-        final_data += sb3_commands_data
-
-        return final_data
+        signature = self.signature_provider.get_signature(signed_data)
+        if len(signature) != signature_length:
+            raise SPSDKError(
+                f"Invalid length of signature: {len(signature)}, expected {signature_length}"
+            )
+        fileobj.seek(start)
+        fileobj.write(signed_data)
+        fileobj.write(signature)
+        length = len(signed_data) + len(signature) + commands_length
+        fileobj.seek(start + length)
+        return length
 
     def __repr__(self) -> str:
         return f"SB3.1, TimeStamp: {self.timestamp}"
@@ -82,6 +82,8 @@ class SdpUARTInterface(SDPSerialProtocol):
         port: Optional[str] = None,
         baudrate: Optional[int] = None,
         timeout: Optional[int] = None,
+        max_workers: Optional[int] = None,
+        scan_timeout: Optional[int] = None,
     ) -> List[Self]:
         """Scan connected serial ports.
 
@@ -92,16 +94,31 @@ class SdpUARTInterface(SDPSerialProtocol):
         :param port: name of preferred serial port, defaults to None
         :param baudrate: speed of the UART interface, defaults to 56700
         :param timeout: timeout in milliseconds, defaults to 5000
+        :param max_workers: maximal count of ports checked at the same time
+        :param scan_timeout: overall time limit of the scan in milliseconds, defaults to no limit
         :return: list of interfaces responding to the PING command
         """
-        devices = SerialDevice.scan(port=port, baudrate=baudrate, timeout=timeout)
-        interfaces = []
-        for device in devices:
-            try:
-                interface = cls(device)
-                interface.open()
-                interface.close()
-                interfaces.append(interface)
-            except Exception:
-                pass
-        return interfaces
+        devices = SerialDevice.scan(
+            port=port,
+            baudrate=baudrate,
+            timeout=timeout,
+            check=cls._check_device,
+            max_workers=max_workers,
+            scan_timeout=scan_timeout,
+        )
+        return [cls(device) for device in devices]
+
+    @classmethod
+    def _check_device(cls, device: SerialDevice) -> bool:
+        """Check whether the interface can be opened on the device.
+
+        :param device: device to check
+        :return: True if the interface was opened, False otherwise
+        """
+        try:
+            interface = cls(device)
+            interface.open()
+            interface.close()
+            return True
+        except Exception:  # pylint: disable=broad-except
+            return False
@@ -7,10 +7,12 @@
 
 """The module provides support for IEE for RTxxxx devices."""
 
+import concurrent.futures
 import logging
+from collections import deque
 from copy import deepcopy
 from struct import pack
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Deque, Dict, List, Optional, Tuple, Union
 
 from crcmod.predefined import mkPredefinedCrcFun
 
@@ -24,9 +26,11 @@ from spsdk.utils.images import BinaryImage
 from spsdk.utils.misc import (
     Endianness,
     align_block,
+    get_process_count,
+    get_range_owner,
+    get_unit_regions,
     load_hex_string,
     reverse_bytes_in_longs,
-    split_data,
     value_to_bytes,
     value_to_int,
 )
@@ -143,6 +147,23 @@ class IeeKeyBlobAttribute:
         return pack(self._FORMAT, self.lock.tag, self.key_attribute.tag, self.aes_mode.tag, 0)
 
 
+def _encrypt_xts_units(key: bytes, data: bytes, address: int, unit_size: int) -> bytes:
+    """Encrypt the data units using AES-XTS, each unit with tweak based on its address.
+
+    :param key: Both XTS keys joined together
+    :param data: Data to be encrypted
+    :param address: Address of the data in target memory
+    :param unit_size: Size of data unit
+    :return: Encrypted data
+    """
+    encrypted_data = bytearray(len(data))
+    for offset in range(0, len(data), unit_size):
+        unit = data[offset : offset + unit_size]
+        tweak = IeeKeyBlob.calculate_tweak(address + offset)
+        encrypted_data[offset : offset + len(unit)] = aes_xts_encrypt(key, unit, tweak)
+    return bytes(encrypted_data)
+
+
 class IeeKeyBlob:
     """IEE KeyBlob.
 
@@ -182,6 +203,11 @@ class IeeKeyBlob:
 
     _END_ADDR_MASK = 0x3F8
 
+    # Minimal size of data encrypted in more processes
+    PARALLEL_MIN_SIZE = 0x400_0000
+    # Size of data encrypted at once by single process
+    PARALLEL_CHUNK_SIZE = 0x10_0000
+
     def __init__(
         self,
         attributes: IeeKeyBlobAttribute,
@@ -191,6 +217,7 @@ class IeeKeyBlob:
         key2: Optional[bytes] = None,
         page_offset: int = 0,
         crc: Optional[bytes] = None,
+        max_processes: Optional[int] = 1,
     ):
         """Constructor.
 
@@ -200,6 +227,8 @@ class IeeKeyBlob:
         :param key1: Encryption key1 for XTS-AES mode, encryption key for AES-CTR mode.
         :param key2: Encryption key2 for XTS-AES mode, initial_counter for AES-CTR mode.
         :param crc: optional value for unused CRC fill (for testing only); None to use calculated value
+        :param max_processes: count of processes used for AES-XTS encryption of big images,
+            None for cpu_count, defaults to 1
         :raises SPSDKError: Start or end address are not aligned
         :raises SPSDKError: When there is invalid key
         :raises SPSDKError: When there is invalid start/end address
@@ -230,6 +259,7 @@ class IeeKeyBlob:
         self.page_offset = page_offset
 
         self.crc_fill = crc
+        self.max_processes = max_processes
 
     def __str__(self) -> str:
         """Text info about the instance."""
@@ -281,23 +311,34 @@ class IeeKeyBlob:
         :param data: to be encrypted (e.g. plain image); base_address + len(data) must be <= self.end_addr
         :return: encrypted data
         """
-        encrypted_data = bytes()
-        current_start = base_address
-        key1 = reverse_bytes_in_longs(self.key1)
-        key2 = reverse_bytes_in_longs(self.key2)
-
-        for block in split_data(bytearray(data), self._IEE_ENCR_BLOCK_SIZE_XTS):
-            tweak = self.calculate_tweak(current_start)
-
-            encrypted_block = aes_xts_encrypt(
-                key1 + key2,
-                block,
-                tweak,
-            )
-            encrypted_data += encrypted_block
-            current_start += len(block)
-
-        return encrypted_data
+        key = reverse_bytes_in_longs(self.key1) + reverse_bytes_in_longs(self.key2)
+        process_count = get_process_count(self.max_processes, len(data), self.PARALLEL_MIN_SIZE)
+        if process_count == 1:
+            return _encrypt_xts_units(key, data, base_address, self._IEE_ENCR_BLOCK_SIZE_XTS)
+
+        # data units are encrypted independently, so the chunks of data are split between processes
+        logger.debug(f"Using {process_count} processes for AES-XTS encryption")
+        chunk_size = self.PARALLEL_CHUNK_SIZE
+        encrypted_data = bytearray(len(data))
+        with concurrent.futures.ProcessPoolExecutor(max_workers=process_count) as executor:
+            # the chunks are copied only when submitted and limited count of them is processed
+            # at once, to keep the memory usage low
+            pending: Deque[Tuple[int, concurrent.futures.Future]] = deque()
+            for offset in range(0, len(data), chunk_size):
+                future = executor.submit(
+                    _encrypt_xts_units,
+                    key,
+                    data[offset : offset + chunk_size],
+                    base_address + offset,
+                    self._IEE_ENCR_BLOCK_SIZE_XTS,
+                )
+                pending.append((offset, future))
+                if len(pending) >= 2 * process_count:
+                    offset, future = pending.popleft()
+                    encrypted_data[offset : offset + chunk_size] = future.result()
+            for offset, future in pending:
+                encrypted_data[offset : offset + chunk_size] = future.result()
+        return bytes(encrypted_data)
 
     def encrypt_image_ctr(self, base_address: int, data: bytes) -> bytes:
         """Encrypt specified data using AES-CTR.
@@ -306,22 +347,20 @@ class IeeKeyBlob:
         :param data: to be encrypted (e.g. plain image); base_address + len(data) must be <= self.end_addr
         :return: encrypted data
         """
-        encrypted_data = bytes()
         key = reverse_bytes_in_longs(self.key1)
         nonce = reverse_bytes_in_longs(self.key2)
 
+        # the counter is incremented by one for each block, just like in the standard AES-CTR,
+        # as long as its 32-bit value doesn't overflow
+        last_ctr = (
+            int.from_bytes(nonce[12:], Endianness.BIG.value)
+            + (base_address >> 4)
+            + (len(data) - 1) // self._ENCRYPTION_BLOCK_SIZE
+        )
+        if last_ctr > 0xFFFFFFFF:
+            raise SPSDKError("Counter overflow, the data are too long for the initial counter")
         counter = Counter(nonce, ctr_value=base_address >> 4, ctr_byteorder_encoding=Endianness.BIG)
-
-        for block in split_data(bytearray(data), self._ENCRYPTION_BLOCK_SIZE):
-            encrypted_block = aes_ctr_encrypt(
-                key,
-                block,
-                counter.value,
-            )
-            encrypted_data += encrypted_block
-            counter.increment(self._ENCRYPTION_BLOCK_SIZE >> 4)
-
-        return encrypted_data
+        return aes_ctr_encrypt(key, data, counter.value)
 
     def encrypt_image(self, base_address: int, data: bytes) -> bytes:
         """Encrypt specified data.
@@ -354,12 +393,7 @@ class IeeKeyBlob:
         :param address: start address of encryption
         :return: 16 byte tweak values
         """
-        sector = address >> 12
-        tweak = bytearray(16)
-        for n in range(16):
-            tweak[n] = sector & 0xFF
-            sector = sector >> 8
-        return bytes(tweak)
+        return (address >> 12).to_bytes(16, Endianness.LITTLE.value)
 
 
 class Iee:
@@ -394,18 +428,20 @@ class Iee:
         :return: encrypted image
         """
         encrypted_data = bytearray(image)
-        addr = base_addr
-        for block in split_data(image, self.IEE_DATA_UNIT):
-            for key_blob in self._key_blobs:
-                if key_blob.matches_range(addr, addr + len(block)):
-                    logger.debug(
-                        f"Encrypting {hex(addr)}:{hex(len(block) + addr)}"
-                        f" with keyblob: \n {str(key_blob)}"
-                    )
-                    encrypted_data[
-                        addr - base_addr : len(block) + addr - base_addr
-                    ] = key_blob.encrypt_image(addr, block)
-            addr += len(block)
+        # consecutive data units encrypted by the same key blob are encrypted at once
+        regions = get_unit_regions(
+            base_addr,
+            len(image),
+            self.IEE_DATA_UNIT,
+            lambda start, end: get_range_owner(
+                self._key_blobs, start, end, IeeKeyBlob.matches_range
+            ),
+        )
+        for start, end, key_blob in regions:
+            logger.debug(f"Encrypting {hex(start)}:{hex(end)} with keyblob: \n {str(key_blob)}")
+            encrypted_data[start - base_addr : end - base_addr] = key_blob.encrypt_image(
+                start, image[start - base_addr : end - base_addr]
+            )
 
         return bytes(encrypted_data)
 
@@ -702,7 +738,10 @@ class IeeNxp(Iee):
 
     @staticmethod
     def load_from_config(
-        config: Dict[str, Any], config_dir: str, search_paths: Optional[List[str]] = None
+        config: Dict[str, Any],
+        config_dir: str,
+        search_paths: Optional[List[str]] = None,
+        max_processes: Optional[int] = 1,
     ) -> "IeeNxp":
         """Converts the configuration option into an IEE image object.
 
@@ -711,6 +750,8 @@ class IeeNxp(Iee):
         :param config: array of IEE configuration dictionaries.
         :param config_dir: directory where the config is located
         :param search_paths: List of paths where to search for the file, defaults to None
+        :param max_processes: Count of processes used for AES-XTS encryption of big images,
+            None for cpu_count, defaults to 1
         :return: initialized IEE object.
         """
         iee_config: List[Dict[str, Any]] = config.get("key_blobs", [config.get("key_blob")])
@@ -797,6 +838,7 @@ class IeeNxp(Iee):
                     key1=key1,
                     key2=key2,
                     page_offset=page_offset,
+                    max_processes=max_processes,
                 )
             )
 
@@ -18,7 +18,7 @@ from crcmod.predefined import mkPredefinedCrcFun
 from spsdk import version as spsdk_version
 from spsdk.apps.utils.utils import filepath_from_config
 from spsdk.crypto.rng import random_bytes
-from spsdk.crypto.symmetric import Counter, aes_ctr_encrypt, aes_key_wrap
+from spsdk.crypto.symmetric import Counter, aes_ctr_encrypt_counter, aes_key_wrap
 from spsdk.exceptions import SPSDKError, SPSDKValueError
 from spsdk.utils.database import DatabaseManager, get_db, get_families, get_schema_file
 from spsdk.utils.exceptions import SPSDKRegsErrorBitfieldNotFound
@@ -26,10 +26,12 @@ from spsdk.utils.images import BinaryImage
 from spsdk.utils.misc import (
     Endianness,
     align_block,
+    get_range_owner,
+    get_unit_regions,
     load_binary,
     load_hex_string,
     reverse_bits_in_bytes,
-    split_data,
+    swap_bytes_in_groups,
     value_to_bytes,
     value_to_int,
 )
@@ -304,8 +306,6 @@ class KeyBlob:
                 f"{hex(self.start_addr)}-{hex(self.end_addr)}."
                 " Ignore this if flash remap feature is used"
             )
-        result = bytes()
-
         if not counter_value:
             counter_value = self.start_addr
 
@@ -313,29 +313,13 @@ class KeyBlob:
             self._get_ctr_nonce(), ctr_value=counter_value, ctr_byteorder_encoding=Endianness.BIG
         )
 
-        for index in range(0, data_len, 16):
-            # prepare data in byte order
-            if byte_swap:
-                # swap 8 bytes + swap 8 bytes
-                data_2_encr = (
-                    data[-data_len + index + 7 : -data_len + index - 1 : -1]
-                    + data[-data_len + index + 15 : -data_len + index + 7 : -1]
-                )
-            else:
-                data_2_encr = data[index : index + 16]
-            # encrypt
-            encr_data = aes_ctr_encrypt(self.key, data_2_encr, counter.value)
-            # fix byte order in result
-            if byte_swap:
-                result += encr_data[-9:-17:-1] + encr_data[-1:-9:-1]  # swap 8 bytes + swap 8 bytes
-            else:
-                result += encr_data
-            # update counter for encryption
-            counter.increment(16)
-
-        if len(result) != data_len:
-            raise SPSDKError("Invalid length of encrypted data")
-        return bytes(result)
+        if byte_swap:
+            data = swap_bytes_in_groups(data, 8)
+        # the counter is incremented by block size (address) for each block
+        result = aes_ctr_encrypt_counter(self.key, data, counter, step=self._ENCRYPTION_BLOCK_SIZE)
+        if byte_swap:
+            result = swap_bytes_in_groups(result, 8)
+        return result
 
     @property
     def is_encrypted(self) -> bool:
@@ -385,18 +369,18 @@ class Otfad:
         :return: encrypted image
         """
         encrypted_data = bytearray(image)
-        addr = base_addr
-        for block in split_data(image, self.OTFAD_DATA_UNIT):
-            for key_blob in self._key_blobs:
-                if key_blob.matches_range(addr, addr + len(block)):
-                    logger.debug(
-                        f"Encrypting {hex(addr)}:{hex(len(block) + addr)}"
-                        f" with keyblob: \n {str(key_blob)}"
-                    )
-                    encrypted_data[
-                        addr - base_addr : len(block) + addr - base_addr
-                    ] = key_blob.encrypt_image(addr, block, byte_swap, counter_value=addr)
-            addr += len(block)
+        # consecutive data units encrypted by the same key blob are encrypted at once
+        regions = get_unit_regions(
+            base_addr,
+            len(image),
+            self.OTFAD_DATA_UNIT,
+            lambda start, end: get_range_owner(self._key_blobs, start, end, KeyBlob.matches_range),
+        )
+        for start, end, key_blob in regions:
+            logger.debug(f"Encrypting {hex(start)}:{hex(end)} with keyblob: \n {str(key_blob)}")
+            encrypted_data[start - base_addr : end - base_addr] = key_blob.encrypt_image(
+                start, image[start - base_addr : end - base_addr], byte_swap, counter_value=start
+            )
 
         return bytes(encrypted_data)
 
@@ -11,8 +11,8 @@ import logging
 import os
 import pickle
 import shutil
-from copy import copy, deepcopy
-from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+from copy import deepcopy
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple, Union
 
 import platformdirs
 from typing_extensions import Self
@@ -329,7 +329,6 @@ class Device:
         :param other_devices: Other devices used to allow aliases.
         :return: The Device object.
         """
-        dev_cfg = load_configuration(os.path.join(path, "database.yaml"))
         dev_alias_name = dev_cfg["alias"]
         # Let get() function raise exception in case that device not exists in database
         ret = deepcopy(other_devices.get(dev_alias_name))
@@ -436,8 +435,123 @@ class Device:
         return path
 
 
-class Devices(List[Device]):
-    """List of devices."""
+def _get_key_tree(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Get the tree of dictionary keys, where all non-dictionary values are replaced by None.
+
+    :param data: Source dictionary
+    :return: Dictionary with the same nested keys structure.
+    """
+    return {k: _get_key_tree(v) if isinstance(v, dict) else None for k, v in data.items()}
+
+
+def _check_sub_keys(data: Dict[str, Any], sub_keys: List[str]) -> bool:
+    """Check that the nested dictionaries contain the path of keys.
+
+    :param data: Dictionary to check
+    :param sub_keys: Path of keys in nested dictionaries
+    :return: True if all nested keys exist, False otherwise.
+    """
+    for key in sub_keys:
+        if not isinstance(data, dict) or key not in data:
+            return False
+        data = data[key]
+    return True
+
+
+class Devices:
+    """Collection of devices.
+
+    The devices could be registered without their data, in such case the device is loaded
+    by the loader function on its first access. The collection keeps the index of features
+    supported by the devices to answer the queries without the scanning of all devices.
+    """
+
+    def __init__(self, loader: Optional[Callable[[str], Device]] = None) -> None:
+        """Constructor of devices collection.
+
+        :param loader: Function that loads the not yet loaded device by its name
+        """
+        self._devices: Dict[str, Optional[Device]] = {}
+        # Tree of keys of the latest revision features for each device
+        self._feature_keys: Dict[str, Dict[str, Any]] = {}
+        # Feature name -> sorted names of devices supporting the feature
+        self._feature_index: Optional[Dict[str, List[str]]] = None
+        self._families_cache: Dict[Tuple[str, Tuple[str, ...]], List[str]] = {}
+        self._loading: Set[str] = set()
+        self._loader = loader
+
+    def __len__(self) -> int:
+        return len(self._devices)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._devices
+
+    def __iter__(self) -> Iterator[Device]:
+        for name in list(self._devices):
+            try:
+                yield self.get(name)
+            except SPSDKErrorMissingDevice:
+                continue
+
+    def _invalidate_index(self) -> None:
+        """Invalidate index of features after change of devices."""
+        self._feature_index = None
+        self._families_cache.clear()
+
+    def append(self, device: Device) -> None:
+        """Add loaded device into the collection.
+
+        :param device: Device to add
+        """
+        self._devices[device.name] = device
+        self._feature_keys[device.name] = _get_key_tree(device.revisions.get_latest().features)
+        self._invalidate_index()
+
+    def register(self, name: str, feature_keys: Optional[Dict[str, Any]] = None) -> None:
+        """Register device that will be loaded on its first access.
+
+        :param name: Device name
+        :param feature_keys: Tree of keys of the latest revision features, if already known
+        """
+        self._devices[name] = None
+        if feature_keys is not None:
+            self._feature_keys[name] = feature_keys
+        self._invalidate_index()
+
+    def _load(self, name: str) -> Device:
+        """Load the registered device.
+
+        In case of failure the device is removed from the collection.
+
+        :param name: Device name
+        :raises SPSDKError: The device cannot be loaded
+        :raises SPSDKErrorMissingDevice: Loading of the device failed
+        :return: Loaded device.
+        """
+        if not self._loader:
+            raise SPSDKError(f"The device {name} cannot be loaded.")
+        if name in self._loading:
+            raise SPSDKError(f"Cannot load device {name}, its aliases are cyclic.")
+        logger.debug(f"Loading device {name} on its first access")
+        self._loading.add(name)
+        try:
+            dev = self._loader(name)
+        except SPSDKError as exc:
+            self._devices.pop(name, None)
+            self._feature_keys.pop(name, None)
+            self._invalidate_index()
+            logger.error(
+                f"Failed loading device '{name}' into SPSDK database. Details:\n{str(exc)}"
+            )
+            raise SPSDKErrorMissingDevice(
+                f"The device with name {name} is not in the database."
+            ) from exc
+        finally:
+            self._loading.discard(name)
+        self._devices[name] = dev
+        if name not in self._feature_keys:
+            self._feature_keys[name] = _get_key_tree(dev.revisions.get_latest().features)
+        return dev
 
     def get(self, name: str) -> Device:
         """Return database device structure.
@@ -446,24 +560,70 @@ class Devices(List[Device]):
         :raises SPSDKErrorMissingDevice: In case the device with given name does not exist
         :return: Dictionary device configuration structure or None:
         """
-        dev = find_first(self, lambda dev: dev.name == name)
-        if not dev:
+        if name not in self._devices:
             raise SPSDKErrorMissingDevice(f"The device with name {name} is not in the database.")
-        return dev
+        return self._devices[name] or self._load(name)
+
+    def get_feature_keys(self, name: str) -> Dict[str, Any]:
+        """Get the tree of keys of the latest revision features.
+
+        The device is loaded only if its features are not known yet.
+
+        :param name: Device name
+        :raises SPSDKErrorMissingDevice: In case the device with given name does not exist
+        :return: Dictionary with nested keys of device features.
+        """
+        if name not in self._feature_keys:
+            self.get(name)
+        return self._feature_keys[name]
+
+    @property
+    def feature_index(self) -> Dict[str, List[str]]:
+        """Get the index of features with sorted names of devices supporting the feature."""
+        if self._feature_index is None:
+            index: Dict[str, List[str]] = {}
+            for name in sorted(self._devices):
+                try:
+                    feature_keys = self.get_feature_keys(name)
+                except SPSDKErrorMissingDevice:
+                    continue
+                for feature in feature_keys:
+                    index.setdefault(feature, []).append(name)
+            self._feature_index = index
+        return self._feature_index
+
+    def get_devices_with_feature(
+        self, feature: str, sub_keys: Optional[List[str]] = None
+    ) -> List[str]:
+        """Get the sorted list of device names that supports requested feature.
+
+        :param feature: Name of feature
+        :param sub_keys: Optional sub keys to specify the nested dictionaries that feature needs to has to be counted
+        :returns: List of devices that supports requested feature.
+        """
+        key = (feature, tuple(sub_keys or []))
+        if key not in self._families_cache:
+            self._families_cache[key] = [
+                name
+                for name in self.feature_index.get(feature, [])
+                if not sub_keys or _check_sub_keys(self._feature_keys[name][feature], sub_keys)
+            ]
+        return list(self._families_cache[key])
 
     @property
     def devices_names(self) -> List[str]:
         """Get the list of devices names."""
-        return [dev.name for dev in self]
+        return list(self._devices)
 
     def feature_items(self, feature: str, key: str) -> Iterator[Tuple[str, str, Any]]:
         """Iter the whole database for the feature items.
 
+        Only the devices that support the feature are loaded.
+
         :return: Tuple of Device name, revision name and items value.
         """
-        for device in self:
-            if not feature in device.features_list:
-                continue
+        for name in self.get_devices_with_feature(feature):
+            device = self.get(name)
             for rev in device.revisions:
                 value = rev.features[feature].get(key)
                 if value is None:
@@ -474,63 +634,56 @@ class Devices(List[Device]):
     def load(devices_path: str, defaults: Dict[str, Any]) -> "Devices":
         """Loads the devices from SPSDK database path.
 
+        Just the devices folders are scanned, the device configuration is parsed
+        on the first access of the device.
+
         :param devices_path: Devices data path.
         :param defaults: Devices defaults data.
         :return: The Devices object.
         """
-        devices = Devices()
-        uncompleted_aliases: List[os.DirEntry] = []
+
+        def load_device(name: str) -> Device:
+            return Device.load(
+                name=name,
+                path=os.path.join(devices_path, name),
+                defaults=defaults,
+                other_devices=devices,
+            )
+
+        devices = Devices(loader=load_device)
         for dev in os.scandir(devices_path):
             if dev.is_dir():
-                try:
-                    try:
-                        devices.append(
-                            Device.load(
-                                name=dev.name,
-                                path=dev.path,
-                                defaults=defaults,
-                                other_devices=devices,
-                            )
-                        )
-                    except SPSDKErrorMissingDevice:
-                        uncompleted_aliases.append(dev)
-                except SPSDKError as exc:
-                    logger.error(
-                        f"Failed loading device '{dev.name}' into SPSDK database. Details:\n{str(exc)}"
-                    )
-        while uncompleted_aliases:
-            prev_len = len(uncompleted_aliases)
-            for dev in copy(uncompleted_aliases):
-                try:
-                    devices.append(
-                        Device.load(
-                            name=dev.name, path=dev.path, defaults=defaults, other_devices=devices
-                        )
-                    )
-                    uncompleted_aliases.remove(dev)
-                except SPSDKErrorMissingDevice:
-                    pass
-            if prev_len == len(uncompleted_aliases):
-                raise SPSDKError("Cannot load all alias devices in database.")
+                devices.register(dev.name)
         return devices
 
 
 class Database:
     """Class that helps manage used databases in SPSDK."""
 
-    def __init__(self, path: str) -> None:
+    def __init__(
+        self,
+        path: str,
+        defaults: Optional[Dict[str, Any]] = None,
+        devices: Optional[Devices] = None,
+    ) -> None:
         """Register Configuration class constructor.
 
         :param path: The path to configuration JSON file.
+        :param defaults: Already loaded database defaults, loaded from path if not specified
+        :param devices: Already prepared devices, loaded from path if not specified
         """
         self._cfg_cache: Dict[str, Dict[str, Any]] = {}
         self.path = path
         self.common_folder_path = os.path.join(path, "common")
         self.devices_folder_path = os.path.join(path, "devices")
-        self._defaults = load_configuration(
-            os.path.join(self.common_folder_path, "database_defaults.yaml")
-        )
-        self._devices = Devices.load(devices_path=self.devices_folder_path, defaults=self._defaults)
+        if defaults is None:
+            defaults = load_configuration(
+                os.path.join(self.common_folder_path, "database_defaults.yaml")
+            )
+        self._defaults = defaults
+        if devices is None:
+            devices = Devices.load(devices_path=self.devices_folder_path, defaults=defaults)
+        self._devices = devices
 
         # optional Database hash that could be used for identification of consistency
         self.db_hash = bytes()
@@ -616,31 +769,7 @@ class Database:
         :param sub_keys: Optional sub keys to specify the nested dictionaries that feature needs to has to be counted
         :returns: List of devices that supports requested feature.
         """
-
-        def check_sub_keys(d: dict, sub_keys: List[str]) -> bool:
-            key = sub_keys.pop(0)
-            if not key in d:
-                return False
-
-            if len(sub_keys) == 0:
-                return True
-
-            nested = d[key]
-            if not isinstance(nested, dict):
-                return False
-            return check_sub_keys(nested, sub_keys)
-
-        devices = []
-        for device in self.devices:
-            if feature in device.features_list:
-                if sub_keys and not check_sub_keys(
-                    device.revisions.get_latest().features[feature], copy(sub_keys)
-                ):
-                    continue
-                devices.append(device.name)
-
-        devices.sort()
-        return devices
+        return self.devices.get_devices_with_feature(feature, sub_keys)
 
     def __hash__(self) -> int:
         """Hash function of the database."""
@@ -659,6 +788,9 @@ class DatabaseManager:
     def get_cache_filename() -> Tuple[str, str]:
         """Get database cache folder and file name.
 
+        The file contains the database index, the devices data are stored separately
+        in folder with the same name as the index file without extension.
+
         :return: Tuple of cache path and database file name.
         """
         data_folder = SPSDK_DATA_FOLDER.lower()
@@ -670,12 +802,91 @@ class DatabaseManager:
         cache_path = platformdirs.user_cache_dir(appname="spsdk", version=spsdk.version)
         return (cache_path, os.path.join(cache_path, cache_name))
 
+    @staticmethod
+    def get_device_cache_filename(cache_file_name: str, device: str) -> str:
+        """Get cache file name of single device.
+
+        :param cache_file_name: Database cache file name
+        :param device: Device name
+        :return: Device cache file name.
+        """
+        return os.path.join(os.path.splitext(cache_file_name)[0], f"{device}.cache")
+
     @staticmethod
     def clear_cache() -> None:
         """Clear SPSDK cache."""
         path, _ = DatabaseManager.get_cache_filename()
         shutil.rmtree(path)
 
+    @staticmethod
+    def store_cache(db: Database, cache_file_name: str, devices: bool = True) -> None:
+        """Store the database into cache.
+
+        The index file contains the database hash, defaults, loaded configuration files
+        and the feature keys of all devices. Each device is stored in its own file,
+        so the device is deserialized only when it is really used.
+
+        :param db: Database to store
+        :param cache_file_name: Database cache file name
+        :param devices: Store also devices, otherwise just the existing index is updated
+        :raises FileNotFoundError: The cache folder doesn't exist when updating just the index
+        """
+        if devices:
+            os.makedirs(os.path.dirname(cache_file_name), exist_ok=True)
+            for device in db.devices:
+                device_file_name = DatabaseManager.get_device_cache_filename(
+                    cache_file_name, device.name
+                )
+                os.makedirs(os.path.dirname(device_file_name), exist_ok=True)
+                with open(device_file_name, mode="wb") as f:
+                    pickle.dump(device, f, pickle.HIGHEST_PROTOCOL)
+        index = {
+            "db_hash": db.db_hash,
+            "defaults": db._defaults,  # pylint: disable=protected-access
+            "cfg_cache": db._cfg_cache,  # pylint: disable=protected-access
+            "devices": {
+                name: db.devices.get_feature_keys(name) for name in db.devices.devices_names
+            },
+        }
+        with open(cache_file_name, mode="wb") as f:
+            pickle.dump(index, f, pickle.HIGHEST_PROTOCOL)
+
+    @staticmethod
+    def load_cache(path: str, cache_file_name: str, db_hash: bytes) -> Database:
+        """Load the database from cache.
+
+        Just the index is loaded, devices are loaded from cache on their first access.
+
+        :param path: Database data path
+        :param cache_file_name: Database cache file name
+        :param db_hash: Expected hash of the database
+        :raises SPSDKError: The cache is not valid
+        :return: Database object.
+        """
+        with open(cache_file_name, mode="rb") as f:
+            index = pickle.load(f)
+        if not isinstance(index, dict) or index.get("db_hash") != db_hash:
+            raise SPSDKError(f"Existing cached DB ({cache_file_name}) has invalid hash")
+
+        def load_device(name: str) -> Device:
+            device_file_name = DatabaseManager.get_device_cache_filename(cache_file_name, name)
+            try:
+                with open(device_file_name, mode="rb") as f:
+                    device = pickle.load(f)
+                assert isinstance(device, Device)
+                return device
+            except Exception as exc:  # pylint: disable=broad-except
+                logger.debug(f"Cannot load device {name} from cache: {str(exc)}")
+            return Devices.load(os.path.join(path, "devices"), index["defaults"]).get(name)
+
+        devices = Devices(loader=load_device)
+        for name, feature_keys in index["devices"].items():
+            devices.register(name, feature_keys)
+        db = Database(path, defaults=index["defaults"], devices=devices)
+        db._cfg_cache = index["cfg_cache"]  # pylint: disable=protected-access
+        db.db_hash = db_hash
+        return db
+
     @classmethod
     def _get_database(cls) -> Database:
         """Get database and count with cache."""
@@ -687,26 +898,20 @@ class DatabaseManager:
 
         if os.path.exists(cls._db_cache_file_name):
             try:
-                with open(cls._db_cache_file_name, mode="rb") as f:
-                    loaded_db = pickle.load(f)
-                    assert isinstance(loaded_db, Database)
-                    if db_hash == loaded_db.db_hash:
-                        logger.debug(f"Loaded database from cache: {cls._db_cache_file_name}")
-                        return loaded_db
-                    # if the hash is not same clear cache and make a new one
-                    logger.debug(f"Existing cached DB ({cls._db_cache_file_name}) has invalid hash")
-                    DatabaseManager.clear_cache()
-            except Exception as exc:
+                db = DatabaseManager.load_cache(SPSDK_DATA_FOLDER, cls._db_cache_file_name, db_hash)
+                logger.debug(f"Loaded database from cache: {cls._db_cache_file_name}")
+                return db
+            except Exception as exc:  # pylint: disable=broad-except
+                # if the cache is not valid clear cache and make a new one
                 logger.debug(f"Cannot load database cache: {str(exc)}")
+                DatabaseManager.clear_cache()
 
         db = Database(SPSDK_DATA_FOLDER)
         db.db_hash = db_hash
         try:
-            os.makedirs(cls._db_cache_folder_name, exist_ok=True)
-            with open(cls._db_cache_file_name, mode="wb") as f:
-                pickle.dump(db, f, pickle.HIGHEST_PROTOCOL)
-                logger.debug(f"Created database cache: {cls._db_cache_file_name}")
-        except Exception as exc:
+            DatabaseManager.store_cache(db, cls._db_cache_file_name)
+            logger.debug(f"Created database cache: {cls._db_cache_file_name}")
+        except Exception as exc:  # pylint: disable=broad-except
             logger.debug(f"Cannot store database cache: {str(exc)}")
         return db
 
@@ -725,17 +930,37 @@ class DatabaseManager:
 
     @staticmethod
     def get_db_hash(path: str) -> bytes:
-        """Get the real db hash."""
+        """Get the real db hash.
+
+        The hash is computed from the manifest of all JSON and YAML files (relative path,
+        modification time and size) collected by single pass over the database folder.
+
+        :param path: Database data path
+        :return: Hash of the database.
+        """
+        manifest: List[Tuple[str, int, int, int]] = []
+        folders = [path]
+        while folders:
+            with os.scandir(folders.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        folders.append(entry.path)
+                    elif os.path.splitext(entry.name)[1] in [".json", ".yaml"]:
+                        stat = entry.stat()
+                        manifest.append(
+                            (
+                                os.path.relpath(entry.path, path),
+                                stat.st_mtime_ns,
+                                stat.st_ctime_ns,
+                                stat.st_size,
+                            )
+                        )
         hash_obj = Hash(EnumHashAlgorithm.SHA1)
-        for root, dirs, files in os.walk(path):
-            for _dir in dirs:
-                hash_obj.update(DatabaseManager.get_db_hash(os.path.join(root, _dir)))
-            for file in files:
-                if os.path.splitext(file)[1] in [".json", ".yaml"]:
-                    stat = os.stat(os.path.join(root, file))
-                    hash_obj.update_int(stat.st_mtime_ns)
-                    hash_obj.update_int(stat.st_ctime_ns)
-                    hash_obj.update_int(stat.st_size)
+        for file_name, mtime, ctime, size in sorted(manifest):
+            hash_obj.update(file_name.encode())
+            hash_obj.update_int(mtime)
+            hash_obj.update_int(ctime)
+            hash_obj.update_int(size)
 
         return hash_obj.finalize()
 
@@ -785,9 +1010,10 @@ def on_delete() -> None:
         return
     if DatabaseManager._db_hash != hash(DatabaseManager._db):
         try:
-            with open(DatabaseManager._db_cache_file_name, mode="wb") as f:
-                logger.debug(f"Updating cache: {DatabaseManager._db_cache_file_name}")
-                pickle.dump(DatabaseManager().db, f, pickle.HIGHEST_PROTOCOL)
+            logger.debug(f"Updating cache: {DatabaseManager._db_cache_file_name}")
+            DatabaseManager.store_cache(
+                DatabaseManager().db, DatabaseManager._db_cache_file_name, devices=False
+            )
         except FileNotFoundError:
             pass
 
@@ -11,21 +11,13 @@ import math
 import os
 import re
 import textwrap
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, BinaryIO, Dict, Iterator, List, NamedTuple, Optional
 
 import colorama
 
 from spsdk.exceptions import SPSDKError, SPSDKOverlapError, SPSDKValueError
 from spsdk.utils.database import DatabaseManager
-from spsdk.utils.misc import (
-    BinaryPattern,
-    align,
-    align_block,
-    find_file,
-    format_value,
-    size_fmt,
-    write_file,
-)
+from spsdk.utils.misc import BinaryPattern, align, find_file, format_value, size_fmt, write_file
 from spsdk.utils.schema_validator import CommentedConfig
 
 if TYPE_CHECKING:
@@ -72,10 +64,73 @@ class ColorPicker:
         return ColorPicker.COLORS[self.index]
 
 
-class BinaryImage:
+class BinaryExtent(NamedTuple):
+    """Continuous part of the exported binary image with single source of data."""
+
+    start: int
+    end: int
+    # Binary data of the extent, None in case that the extent is filled by pattern
+    data: Optional[bytes] = None
+    # Pattern of the extent, None in case that the extent is filled by zeros
+    pattern: Optional[BinaryPattern] = None
+    # Offset of the first byte of data (or the beginning of the pattern)
+    base: int = 0
+
+    def shift(self, offset: int) -> "BinaryExtent":
+        """Get the extent moved by offset.
+
+        :param offset: Offset to move the extent by
+        :return: Moved extent.
+        """
+        return BinaryExtent(
+            self.start + offset, self.end + offset, self.data, self.pattern, self.base + offset
+        )
+
+    def get_block(self, start: int, end: int) -> bytes:
+        """Get the data of the part of extent.
+
+        :param start: Start offset of the part, must be inside the extent
+        :param end: End offset of the part, must be inside the extent
+        :return: Data of the extent part.
+        """
+        if self.data is not None:
+            return self.data[start - self.base : end - self.base]
+        if self.pattern:
+            return self.pattern.get_block(end - start, start - self.base)
+        return bytes(end - start)
+
+
+def _overlay_extents(extents: List[BinaryExtent], layer: List[BinaryExtent]) -> None:
+    """Overlay the list of extents by the new continuous layer of extents.
+
+    Both lists must be sorted by offsets. The layers are typically added in ascending order,
+    so the position of the layer is searched from the end of the extents list.
+
+    :param extents: Sorted list of extents to update
+    :param layer: Sorted continuous list of extents that overrides the extents
+    """
+    if not layer:
+        return
+    start, end = layer[0].start, layer[-1].end
+    first = len(extents)
+    while first > 0 and extents[first - 1].end > start:
+        first -= 1
+    last = first
+    while last < len(extents) and extents[last].start < end:
+        last += 1
+    head, tail = [], []
+    if first < last and extents[first].start < start:
+        head.append(extents[first]._replace(end=start))
+    if first < last and extents[last - 1].end > end:
+        tail.append(extents[last - 1]._replace(start=end))
+    extents[first:last] = head + layer + tail
+
+
+class BinaryImage:  # pylint: disable=too-many-public-methods
     """Binary Image class."""
 
     MINIMAL_DRAW_WIDTH = 30
+    EXPORT_CHUNK_SIZE = 0x10000
 
     def __init__(
         self,
@@ -108,7 +163,7 @@ class BinaryImage:
         self.alignment = alignment
         self.parent = parent
 
-        if parent:
+        if parent is not None:
             assert isinstance(parent, BinaryImage)
         self.sub_images: List["BinaryImage"] = []
 
@@ -122,17 +177,48 @@ class BinaryImage:
         """Size property setter."""
         self._size = align(value, self.alignment)
 
+    def _bisect_sub_images(self, offset: int) -> int:
+        """Find the index of the first sub image with bigger offset than given one.
+
+        The sub images are kept sorted by offsets, so binary search is used.
+
+        :param offset: Offset in the image
+        :return: Index into the list of sub images.
+        """
+        low, high = 0, len(self.sub_images)
+        while low < high:
+            middle = (low + high) // 2
+            if offset < self.sub_images[middle].offset:
+                high = middle
+            else:
+                low = middle + 1
+        return low
+
     def add_image(self, image: "BinaryImage") -> None:
         """Add new sub image information.
 
         :param image: Image object.
         """
         image.parent = self
-        for i, child in enumerate(self.sub_images):
-            if image.offset < child.offset:
-                self.sub_images.insert(i, image)
-                return
-        self.sub_images.append(image)
+        if not self.sub_images or image.offset >= self.sub_images[-1].offset:
+            self.sub_images.append(image)
+            return
+        self.sub_images.insert(self._bisect_sub_images(image.offset), image)
+
+    def find_sub_image(self, offset: int) -> Optional["BinaryImage"]:
+        """Find the sub image that contains the given offset.
+
+        :param offset: Offset in the image
+        :return: Sub image containing the offset, None if the offset is not covered by any sub image.
+        """
+        index = self._bisect_sub_images(offset)
+        while index:
+            image = self.sub_images[index - 1]
+            # skip the empty images
+            if len(image):
+                return image if offset < image.offset + len(image) else None
+            index -= 1
+        return None
 
     def join_images(self) -> None:
         """Join all sub images into main binary block."""
@@ -146,7 +232,7 @@ class BinaryImage:
 
         :return: Full Image name
         """
-        if self.parent:
+        if self.parent is not None:
             return self.parent.image_name + "=>" + self.name
         return self.name
 
@@ -156,7 +242,7 @@ class BinaryImage:
 
         :return: Absolute address relative to base parent
         """
-        if self.parent:
+        if self.parent is not None:
             return self.parent.absolute_address + self.offset
         return self.offset
 
@@ -203,31 +289,47 @@ class BinaryImage:
             raise SPSDKValueError(
                 f"Image offset of {self.image_name} cannot be in negative numbers."
             )
-        if len(self) < 0:
+        size = len(self)
+        if size < 0:
             raise SPSDKValueError(f"Image size of {self.image_name} cannot be in negative numbers.")
-        for image in self.sub_images:
+        # Sorting of already sorted list is linear, it just ensures correct order
+        # in case that offsets of sub images has been changed after adding them
+        sub_images = sorted(self.sub_images, key=lambda image: image.offset)
+        # The sibling with the highest end from all previous siblings
+        furthest: Optional[BinaryImage] = None
+        furthest_end = -1
+        for i, image in enumerate(sub_images):
             image.validate()
             begin = image.offset
             end = begin + len(image) - 1
             # Check if it fits inside the parent image
-            if end >= len(self):
+            if end >= size:
                 raise SPSDKOverlapError(
                     f"The image {image.name} doesn't fit into {self.name} parent image."
                 )
-            # Check if it doesn't overlap any other sibling image
-            for sibling in self.sub_images:
-                if sibling != image:
-                    sibling_begin = sibling.offset
-                    sibling_end = sibling_begin + len(sibling) - 1
-                    if end < sibling_begin or begin > sibling_end:
-                        continue
-
-                    raise SPSDKOverlapError(
-                        f"The image overlap error:\n"
-                        f"{str(image)}\n"
-                        "overlaps the:\n"
-                        f"{str(sibling)}\n"
-                    )
+            # Empty image cannot overlap anything
+            if end < begin:
+                continue
+            # Check if it doesn't overlap any previous or the next sibling image
+            sibling: Optional[BinaryImage] = None
+            if furthest is not None and begin <= furthest_end:
+                sibling = furthest
+            else:
+                # the next non-empty sibling
+                j = i + 1
+                while j < len(sub_images) and len(sub_images[j]) == 0:
+                    j += 1
+                if j < len(sub_images) and sub_images[j].offset <= end:
+                    sibling = sub_images[j]
+            if sibling is not None:
+                raise SPSDKOverlapError(
+                    f"The image overlap error:\n"
+                    f"{str(image)}\n"
+                    "overlaps the:\n"
+                    f"{str(sibling)}\n"
+                )
+            if end > furthest_end:
+                furthest, furthest_end = image, end
 
     def _get_size_line(self, size: int) -> str:
         """Get string of size line.
@@ -316,7 +418,7 @@ class BinaryImage:
             except SPSDKError:
                 color = colorama.Fore.RED
 
-        block = "" if self.parent else "\n"
+        block = "" if self.parent is not None else "\n"
         min_width = self.get_min_draw_width(include_sub_images)
         if not width and self.parent is None:
             width = min_width
@@ -389,30 +491,99 @@ class BinaryImage:
             max_size = max(size, max_size)
         return align(max_size, self.alignment)
 
-    def export(self) -> bytes:
-        """Export represented binary image.
+    def _get_export_length(self) -> int:
+        """Get length of exported image.
 
-        :return: Byte array of binary image.
+        :return: Length of the exported binary image.
         """
-        if self.binary and len(self) == len(self.binary) and len(self.sub_images) == 0:
-            return self.binary
+        length = len(self)
+        if self.binary and len(self.binary) > length:
+            length = len(self.binary)
+        return align(length, self.alignment)
 
-        if self.pattern:
-            ret = bytearray(self.pattern.get_block(len(self)))
-        else:
-            ret = bytearray(len(self))
+    def get_extents(self) -> List[BinaryExtent]:
+        """Get sparse representation of the exported binary image.
+
+        The image is described by sorted list of continuous extents, each extent is either
+        filled by binary data of one of the images or by its pattern. No data are copied.
 
+        :return: List of extents covering the whole exported image.
+        :raises SPSDKOverlapError: The sub image exceeds the parent image data.
+        """
+        length = self._get_export_length()
+        if self.binary and len(self.binary) == length and not self.sub_images:
+            return [BinaryExtent(0, length, self.binary)]
+
+        extents = [BinaryExtent(0, len(self), pattern=self.pattern)] if len(self) else []
         if self.binary:
-            binary_view = memoryview(self.binary)
-            ret[: len(self.binary)] = binary_view
+            _overlay_extents(extents, [BinaryExtent(0, len(self.binary), self.binary)])
+        data_length = max(len(self), len(self.binary or b""))
 
         for image in self.sub_images:
-            image_data = image.export()
-            ret_slice = memoryview(ret)[image.offset : image.offset + len(image_data)]
-            image_data_view = memoryview(image_data)
-            ret_slice[:] = image_data_view
+            layer = [extent.shift(image.offset) for extent in image.get_extents()]
+            # The sub image cannot exceed the parent data
+            if layer and layer[-1].end > data_length:
+                raise SPSDKOverlapError(
+                    f"The image {image.name} doesn't fit into {self.name} parent image."
+                )
+            _overlay_extents(extents, layer)
+
+        if length > data_length:
+            extents.append(
+                BinaryExtent(data_length, length, pattern=self.pattern, base=data_length)
+            )
+        return extents
+
+    def iter_chunks(self, chunk_size: int = EXPORT_CHUNK_SIZE) -> Iterator[bytes]:
+        """Iterate over the exported binary image by chunks.
+
+        The padding is generated lazily, so the memory consumption is given by the image data
+        and not by the size of image.
+
+        :param chunk_size: Maximal size of one chunk
+        :return: Iterator of exported binary image chunks.
+        """
+        # The extents are resolved immediately, so the image errors are raised before iterating
+        extents = self.get_extents()
+        return (
+            extent.get_block(start, min(start + chunk_size, extent.end))
+            for extent in extents
+            for start in range(extent.start, extent.end, chunk_size)
+        )
+
+    def write_to(self, fileobj: BinaryIO, chunk_size: int = EXPORT_CHUNK_SIZE) -> int:
+        """Write the exported binary image into the file object.
+
+        :param fileobj: File object opened for binary writing
+        :param chunk_size: Maximal size of one written chunk
+        :return: Count of written bytes.
+        """
+        written = 0
+        for chunk in self.iter_chunks(chunk_size):
+            fileobj.write(chunk)
+            written += len(chunk)
+        return written
+
+    def export(self) -> bytes:
+        """Export represented binary image.
+
+        :return: Byte array of binary image.
+        """
+        if self.binary and len(self) == len(self.binary) and len(self.sub_images) == 0:
+            return self.binary
 
-        return align_block(ret, self.alignment, self.pattern)
+        extents = self.get_extents()
+        ret = bytearray(extents[-1].end if extents else 0)
+        for extent in extents:
+            if extent.data is not None:
+                data = memoryview(extent.data)[
+                    extent.start - extent.base : extent.end - extent.base
+                ]
+                ret[extent.start : extent.end] = data
+            # the zero filled extents are already prepared
+            elif extent.pattern:
+                ret[extent.start : extent.end] = extent.get_block(extent.start, extent.end)
+        return bytes(ret)
 
     @staticmethod
     def get_validation_schemas() -> List[Dict[str, Any]]:
@@ -479,7 +650,14 @@ class BinaryImage:
             raise SPSDKValueError(f"Invalid input file format: {file_format}")
 
         if file_format == "BIN":
-            write_file(self.export(), path, mode="wb")
+            folder = os.path.dirname(path)
+            if folder:
+                os.makedirs(folder, exist_ok=True)
+            chunks = self.iter_chunks()
+            logger.debug(f"Storing binary file at {path}")
+            with open(path, mode="wb") as f:
+                for chunk in chunks:
+                    f.write(chunk)
             return
 
         def add_into_binary(bin_image: BinaryImage) -> None:
@@ -7,7 +7,8 @@
 
 """Low level serial device."""
 import logging
-from typing import List, Optional
+from functools import partial
+from typing import Callable, List, Optional
 
 from serial import Serial, SerialException, SerialTimeoutException
 from serial.tools.list_ports import comports
@@ -16,6 +17,7 @@ from typing_extensions import Self
 from spsdk.exceptions import SPSDKConnectionError
 from spsdk.utils.exceptions import SPSDKTimeoutError
 from spsdk.utils.interfaces.device.base import DeviceBase
+from spsdk.utils.interfaces.scanner_helper import scan_ports
 
 logger = logging.getLogger(__name__)
 
@@ -41,6 +43,10 @@ class SerialDevice(DeviceBase):
         """
         super().__init__()
         self._timeout = timeout
+        # data received from the port in bulk, but not read yet
+        self._rx_buffer = bytearray()
+        # input is discarded before each write, unless there are responses still expected
+        self.reset_input_on_write = True
         try:
             timeout_s = timeout / 1000
             self._device = Serial(
@@ -93,6 +99,7 @@ class SerialDevice(DeviceBase):
 
         :raises SPSDKConnectionError: when closing device fails
         """
+        self._rx_buffer.clear()
         if self.is_opened:
             try:
                 self._device.reset_input_buffer()
@@ -104,6 +111,9 @@ class SerialDevice(DeviceBase):
     def read(self, length: int, timeout: Optional[int] = None) -> bytes:
         """Read 'length' amount for bytes from device.
 
+        All the data already waiting in the port are received at once and buffered,
+        so reading of a frame byte by byte doesn't access the port each time.
+
         :param length: Number of bytes to read
         :param timeout: Read timeout
         :return: Data read from the device
@@ -112,13 +122,19 @@ class SerialDevice(DeviceBase):
         """
         if not self.is_opened:
             raise SPSDKConnectionError("Device is not opened for reading")
-        try:
-            data = self._device.read(length)
-        except Exception as e:
-            raise SPSDKConnectionError(str(e)) from e
+        missing = length - len(self._rx_buffer)
+        if missing > 0:
+            try:
+                self._rx_buffer += self._device.read(max(missing, self._device.in_waiting))
+            except Exception as e:
+                raise SPSDKConnectionError(str(e)) from e
+        data = bytes(self._rx_buffer[:length])
+        # deleting from the beginning of bytearray just moves its start
+        del self._rx_buffer[:length]
         if not data:
             raise SPSDKTimeoutError()
-        logger.debug(f"<{' '.join(f'{b:02x}' for b in data)}>")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"<{data.hex(' ')}>")
         return data
 
     def write(self, data: bytes, timeout: Optional[int] = None) -> None:
@@ -131,9 +147,13 @@ class SerialDevice(DeviceBase):
         """
         if not self.is_opened:
             raise SPSDKConnectionError("Device is not opened for reading")
-        logger.debug(f"[{' '.join(f'{b:02x}' for b in data)}]")
+        # formatting of the data dump is expensive, do it only when it's logged
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"[{bytes(data).hex(' ')}]")
         try:
-            self._device.reset_input_buffer()
+            if self.reset_input_on_write:
+                self._rx_buffer.clear()
+                self._device.reset_input_buffer()
             self._device.reset_output_buffer()
             self._device.write(data)
             self._device.flush()
@@ -161,38 +181,60 @@ class SerialDevice(DeviceBase):
         port: Optional[str] = None,
         baudrate: Optional[int] = None,
         timeout: Optional[int] = None,
+        check: Optional[Callable[[Self], bool]] = None,
+        max_workers: Optional[int] = None,
+        scan_timeout: Optional[int] = None,
+        cache_negative: bool = False,
     ) -> List[Self]:
         """Scan connected serial ports.
 
         Returns list of serial ports with devices that respond to PING command.
         If 'port' is specified, only that serial port is checked
         If no devices are found, return an empty list.
+        All the serial ports are checked concurrently.
 
         :param port: name of preferred serial port, defaults to None
         :param baudrate: speed of the UART interface, defaults to 56700
         :param timeout: timeout in milliseconds, defaults to 5000
+        :param check: additional check of the device on the port, e.g. the PING command
+        :param max_workers: maximal count of ports checked at the same time
+        :param scan_timeout: overall time limit of the scan in milliseconds, defaults to no limit
+        :param cache_negative: skip the ports without a device by scans within the next few
+            seconds, defaults to False
         :return: list of interfaces responding to the PING command
         """
         baudrate = baudrate or cls.default_baudrate
         timeout = timeout or 5000
+
         if port:
-            device = cls._check_port(port, baudrate, timeout)
-            devices = [device] if device else []
-        else:
-            all_ports = [
-                cls._check_port(comport.device, baudrate, timeout)
-                for comport in comports(include_links=True)
-            ]
-            devices = list(filter(None, all_ports))
-        return devices
+            device = cls._check_port(port, baudrate, timeout, check)
+            return [device] if device else []
+        cache_key = None
+        if cache_negative:
+            check_name = getattr(check, "__qualname__", "open") if check else "open"
+            cache_key = f"{cls.__qualname__}:{check_name}:{baudrate}"
+        return scan_ports(
+            [comport.device for comport in comports(include_links=True)],
+            partial(cls._check_port, baudrate=baudrate, timeout=timeout, check=check),
+            max_workers=max_workers,
+            scan_timeout=scan_timeout,
+            cache_key=cache_key,
+        )
 
     @classmethod
-    def _check_port(cls, port: str, baudrate: int, timeout: int) -> Optional[Self]:
+    def _check_port(
+        cls,
+        port: str,
+        baudrate: int,
+        timeout: int,
+        check: Optional[Callable[[Self], bool]] = None,
+    ) -> Optional[Self]:
         """Check if device on comport 'port' responds to PING command.
 
         :param port: name of port to check
         :param baudrate: speed of the UART interface, defaults to 56700
         :param timeout: timeout in milliseconds
+        :param check: additional check of the device on the port
         :return: None if device doesn't respond to PING, instance of Interface if it does
         """
         try:
@@ -200,6 +242,8 @@ class SerialDevice(DeviceBase):
             device = cls(port=port, baudrate=baudrate, timeout=timeout)
             device.open()
             device.close()
+            if check and not check(device):
+                return None
             return device
         except Exception as e:  # pylint: disable=broad-except
             logger.debug(f"{type(e).__name__}: {e}")
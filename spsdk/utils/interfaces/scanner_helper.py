@@ -7,11 +7,28 @@
 
 """Helper module used for supporting the scanning."""
 
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass
-from typing import Dict, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, TypeVar
 
 from spsdk.exceptions import SPSDKKeyError
 
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Maximal count of ports checked at the same time
+SCAN_MAX_WORKERS = 8
+# Time in seconds, for which the ports without a device are not checked again
+SCAN_NEGATIVE_CACHE_TIMEOUT = 3.0
+
+# (cache key, port) -> time of expiration
+_negative_cache: Dict[Tuple[str, str], float] = {}
+_negative_cache_lock = threading.Lock()
+
 
 def parse_plugin_config(plugin_conf: str) -> Tuple:
     """Extract 'identifier' from plugin params and build the params back to original format.
@@ -35,3 +52,72 @@ class InterfaceParams:
     is_defined: bool
     params: Optional[str] = None
     extra_params: Optional[str] = None
+
+
+def clear_scan_cache() -> None:
+    """Forget all the ports, where no device has been found."""
+    with _negative_cache_lock:
+        _negative_cache.clear()
+
+
+def scan_ports(
+    ports: Sequence[str],
+    check: Callable[[str], Optional[T]],
+    max_workers: Optional[int] = None,
+    scan_timeout: Optional[int] = None,
+    cache_key: Optional[str] = None,
+) -> List[T]:
+    """Check all the ports concurrently.
+
+    :param ports: Names of ports to check
+    :param check: Function checking the port, returns None if there is no device
+    :param max_workers: Maximal count of ports checked at the same time, defaults to SCAN_MAX_WORKERS
+    :param scan_timeout: Overall time limit of the scan in milliseconds, defaults to None (no limit);
+        the ports not checked within the limit are skipped, the checks already running are
+        finished (and their ports closed) before returning, but their results are dropped
+    :param cache_key: Identification of the check, if specified the ports without a device
+        are remembered and skipped for SCAN_NEGATIVE_CACHE_TIMEOUT seconds; disabled by default
+    :return: Results of the ports with a device, in the same order as the ports
+    """
+    if cache_key is not None:
+        now = time.monotonic()
+        with _negative_cache_lock:
+            skipped = [port for port in ports if _negative_cache.get((cache_key, port), 0.0) > now]
+        if skipped:
+            logger.debug(f"Skipping recently checked ports without a device: {', '.join(skipped)}")
+            ports = [port for port in ports if port not in skipped]
+    if not ports:
+        return []
+
+    def check_port(port: str) -> Optional[T]:
+        try:
+            return check(port)
+        except Exception as e:  # pylint: disable=broad-except
+            logger.debug(f"Checking of port {port} failed: {type(e).__name__}: {e}")
+            return None
+
+    workers = min(max_workers or SCAN_MAX_WORKERS, len(ports))
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="scan")
+    futures: Dict[str, Future] = {}
+    try:
+        for port in ports:
+            futures[port] = executor.submit(check_port, port)
+        _, not_done = wait(futures.values(), timeout=scan_timeout / 1000 if scan_timeout else None)
+    finally:
+        # the checks not started yet are cancelled, the running ones must release their ports
+        for future in futures.values():
+            future.cancel()
+        executor.shutdown(wait=True)
+    results = []
+    expiration = time.monotonic() + SCAN_NEGATIVE_CACHE_TIMEOUT
+    for port, future in futures.items():
+        if future in not_done:
+            logger.warning(f"Checking of port {port} didn't finish within the scan timeout")
+            continue
+        result = future.result()
+        if result is not None:
+            results.append(result)
+        elif cache_key is not None:
+            with _negative_cache_lock:
+                _negative_cache[(cache_key, port)] = expiration
+    return results
@@ -10,6 +10,7 @@ import hashlib
 import json
 import logging
 import math
+import multiprocessing
 import os
 import re
 import textwrap
@@ -26,6 +27,7 @@ from typing import (
     Iterator,
     List,
     Optional,
+    Tuple,
     Type,
     TypeVar,
     Union,
@@ -89,10 +91,12 @@ class BinaryPattern:
 
         self._pattern = pattern
 
-    def get_block(self, size: int) -> bytes:
+    def get_block(self, size: int, offset: int = 0) -> bytes:
         """Get block filled with pattern.
 
         :param size: Size of block to return.
+        :param offset: Offset of the block in the pattern, used to continue the pattern
+            of the previous block, defaults to 0
         :return: Filled up block with specified pattern.
         """
         if self._pattern == "zeros":
@@ -105,11 +109,12 @@ class BinaryPattern:
             return random_bytes(size)
 
         if self._pattern == "inc":
-            return bytes((x & 0xFF for x in range(size)))
-
-        pattern = value_to_bytes(self._pattern, align_to_2n=False)
-        block = bytes(pattern * (int((size / len(pattern))) + 1))
-        return block[:size]
+            pattern = bytes(range(0x100))
+        else:
+            pattern = value_to_bytes(self._pattern, align_to_2n=False)
+        offset %= len(pattern)
+        block = bytes(pattern * (int(((offset + size) / len(pattern))) + 1))
+        return block[offset : offset + size]
 
     @property
     def pattern(self) -> str:
@@ -584,6 +589,38 @@ def reverse_bytes_in_longs(arr: bytes) -> bytes:
     return bytes(result)
 
 
+def swap_bytes_in_groups(arr: bytes, group_size: int) -> bytes:
+    """The function reverse byte order in each group of bytes from input bytes.
+
+    :param arr: Input array.
+    :param group_size: Count of bytes in group.
+    :return: New array with reversed bytes in groups.
+    :raises SPSDKError: Raises when length of input is not aligned to group size.
+    """
+    if len(arr) % group_size != 0:
+        raise SPSDKError(f"The input array is not in modulo {group_size}!")
+    result = bytearray(len(arr))
+    for i in range(group_size):
+        result[i::group_size] = arr[group_size - 1 - i :: group_size]
+    return bytes(result)
+
+
+def xor_bytes(arr1: bytes, arr2: bytes) -> bytes:
+    """The function computes XOR of two byte arrays of the same length.
+
+    :param arr1: First input array.
+    :param arr2: Second input array.
+    :return: New array with XOR of inputs.
+    :raises SPSDKError: Raises when inputs have different length.
+    """
+    if len(arr1) != len(arr2):
+        raise SPSDKError("The input arrays have different length!")
+    result = int.from_bytes(arr1, Endianness.LITTLE.value) ^ int.from_bytes(
+        arr2, Endianness.LITTLE.value
+    )
+    return result.to_bytes(len(arr1), Endianness.LITTLE.value)
+
+
 def reverse_bits_in_bytes(arr: bytes) -> bytes:
     """The function reverse bits order in input bytes.
 
@@ -864,6 +901,64 @@ def split_data(data: Union[bytearray, bytes], size: int) -> Generator[bytes, Non
         yield data[i : i + size]
 
 
+def get_process_count(max_processes: Optional[int], data_size: int, min_size: int) -> int:
+    """Get count of processes used for processing of the data.
+
+    Processing in more processes is opt-in, because the start of a process pool takes
+    a significant time on platforms spawning the processes.
+
+    :param max_processes: Requested count of processes, None for cpu_count
+    :param data_size: Size of the processed data in bytes
+    :param min_size: Minimal size of data processed by more processes
+    :return: Count of processes, 1 means processing in the current process
+    """
+    if max_processes == 1 or data_size < min_size:
+        return 1
+    return max_processes or multiprocessing.cpu_count()
+
+
+def get_unit_regions(
+    start: int, length: int, unit_size: int, get_owner: Callable[[int, int], Optional[T]]
+) -> List[Tuple[int, int, T]]:
+    """Split address range into data units and merge the consecutive units of the same owner.
+
+    :param start: Start address of the range
+    :param length: Length of the range
+    :param unit_size: Size of data unit
+    :param get_owner: Function returning owner of the unit (from its start and end address),
+        None if the unit has no owner
+    :return: List of regions given by start address, end address and owner
+    """
+    regions: List[Tuple[int, int, T]] = []
+    for addr in range(start, start + length, unit_size):
+        end = min(addr + unit_size, start + length)
+        owner = get_owner(addr, end)
+        if owner is None:
+            continue
+        if regions and regions[-1][1] == addr and regions[-1][2] is owner:
+            regions[-1] = (regions[-1][0], end, owner)
+        else:
+            regions.append((addr, end, owner))
+    return regions
+
+
+def get_range_owner(
+    owners: List[T], start: int, end: int, matches_range: Callable[[T, int, int], bool]
+) -> Optional[T]:
+    """Get owner of the address range, the later owners take precedence over the earlier ones.
+
+    :param owners: List of possible owners
+    :param start: Start address of the range
+    :param end: End address of the range
+    :param matches_range: Function checking whether the owner matches the address range
+    :return: The last owner matching the address range, None if there is no such owner
+    """
+    for owner in reversed(owners):
+        if matches_range(owner, start, end):
+            return owner
+    return None
+
+
 def get_hash(text: Union[str, bytes]) -> str:
     """Returns hash of given text."""
     if isinstance(text, str):
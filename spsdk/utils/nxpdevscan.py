@@ -21,6 +21,7 @@ from spsdk.sdp.exceptions import SdpConnectionError
 from spsdk.sdp.interfaces.uart import SdpUARTInterface
 from spsdk.sdp.sdp import SDP
 from spsdk.utils.interfaces.device.serial_device import SerialDevice
+from spsdk.utils.interfaces.scanner_helper import scan_ports
 
 from .devicedescription import (
     SDIODeviceDescription,
@@ -110,42 +111,50 @@ def search_nxp_usb_devices(extend_vid_list: Optional[list] = None) -> List[USBDe
     return nxp_usb_devices
 
 
-def search_nxp_uart_devices() -> List[UartDeviceDescription]:
+def search_nxp_uart_devices(
+    max_workers: Optional[int] = None, scan_timeout: Optional[int] = None
+) -> List[UartDeviceDescription]:
     """Returns a list of all NXP devices connected via UART.
 
+    All COM ports are checked concurrently.
+
+    :param max_workers: Maximal count of ports checked at the same time
+    :param scan_timeout: Overall time limit of the scan in milliseconds, defaults to no limit
     :retval: list of UartDeviceDescription devices from devicedescription module
     """
-    retval = []
-
     # Get all available COM ports on target PC
     ports = [port.device for port in comports()]
 
-    # Iterate over every com port we have and check, whether mboot or sdp responds
-    for port in ports:
-        if MbootUARTInterface.scan(port=port, timeout=50):
-            uart_dev = UartDeviceDescription(name=port, dev_type="mboot device")
-            retval.append(uart_dev)
-            continue
+    # Check every com port we have, whether mboot or sdp responds
+    return scan_ports(ports, _check_uart_port, max_workers=max_workers, scan_timeout=scan_timeout)
 
-        # Seems the port is not mboot, let's try SDP protocol
-        # The SDP protocol is on uart interface, so opening just the port is not
-        # sufficient, to say, that the interface is SDP compared to mboot, where
-        # ping command must be sent.
-        # So we create an SDP interface and try to read the status code. If
-        # we get a response, we are connected to an SDP device.
-        try:
-            device = SerialDevice(port=port, timeout=50)
-            sdp_com = SDP(SdpUARTInterface(device))
-            if sdp_com.read_status() is not None:
-                uart_dev = UartDeviceDescription(name=port, dev_type="SDP device")
-                retval.append(uart_dev)
-        except SdpConnectionError as e:
-            logger.debug(
-                f"Exception {type(e).__name__} occurred while reading status via SDP. \
-Arguments: {e.args}"
-            )
 
-    return retval
+def _check_uart_port(port: str) -> Optional[UartDeviceDescription]:
+    """Check whether mboot or sdp device responds on the com port.
+
+    :param port: Name of the com port
+    :return: Description of the device, None if no device responds
+    """
+    if MbootUARTInterface.scan(port=port, timeout=50):
+        return UartDeviceDescription(name=port, dev_type="mboot device")
+
+    # Seems the port is not mboot, let's try SDP protocol
+    # The SDP protocol is on uart interface, so opening just the port is not
+    # sufficient, to say, that the interface is SDP compared to mboot, where
+    # ping command must be sent.
+    # So we create an SDP interface and try to read the status code. If
+    # we get a response, we are connected to an SDP device.
+    try:
+        device = SerialDevice(port=port, timeout=50)
+        sdp_com = SDP(SdpUARTInterface(device))
+        if sdp_com.read_status() is not None:
+            return UartDeviceDescription(name=port, dev_type="SDP device")
+    except SdpConnectionError as e:
+        logger.debug(
+            f"Exception {type(e).__name__} occurred while reading status via SDP. \
+Arguments: {e.args}"
+        )
+    return None
 
 
 # This function has been left for potential future uses. At the moment it's
@@ -490,6 +490,7 @@ class RegsRegister:
         self.access = access or "RW"
         self.reverse = reverse
         self._bitfields: List[RegsBitField] = []
+        self._bitfields_index: Dict[str, RegsBitField] = {}
         self._set_value_hooks: List = []
         self._value = 0
         self._reset_value = 0
@@ -805,6 +806,7 @@ class RegsRegister:
         :param bitfield: New bitfield value for register.
         """
         self._bitfields.append(bitfield)
+        self._bitfields_index.setdefault(bitfield.name, bitfield)
 
     def get_bitfields(self, exclude: Optional[List[str]] = None) -> List[RegsBitField]:
         """Returns register bitfields.
@@ -837,9 +839,9 @@ class RegsRegister:
         :return: Instance of the bitfield.
         :raises SPSDKRegsErrorBitfieldNotFound: The bitfield doesn't exist.
         """
-        for bitfield in self._bitfields:
-            if name == bitfield.name:
-                return bitfield
+        bitfield = self._bitfields_index.get(name)
+        if bitfield is not None:
+            return bitfield
 
         raise SPSDKRegsErrorBitfieldNotFound(f" The {name} is not found in register {self.name}.")
 
@@ -884,6 +886,12 @@ class Registers:
     def __init__(self, device_name: str, base_endianness: Endianness = Endianness.BIG) -> None:
         """Initialization of Registers class."""
         self._registers: List[RegsRegister] = []
+        # Indexes of registers by names (including aliases) and by offsets,
+        # the first added register wins in the same way as in the list of registers
+        self._names_index: Dict[str, RegsRegister] = {}
+        self._offsets_index: Dict[int, RegsRegister] = {}
+        # Index of sub-registers of group registers by their names
+        self._sub_regs_index: Dict[str, RegsRegister] = {}
         self.dev_name = device_name
         self.base_endianness = base_endianness
 
@@ -906,20 +914,34 @@ class Registers:
         :return: Instance of the register.
         :raises SPSDKRegsErrorRegisterNotFound: The register doesn't exist.
         """
-        for reg in self._registers:
-            if name == reg.name:
-                return reg
-            if name in reg._alias_names:
-                return reg
-            if include_group_regs and reg.has_group_registers():
-                for sub_reg in reg.sub_regs:
-                    if name == sub_reg.name:
-                        return sub_reg
+        reg = self._names_index.get(name)
+        if reg is None and include_group_regs:
+            if name not in self._sub_regs_index:
+                # The sub-registers could be added directly into the group register
+                self._update_sub_regs_index()
+            reg = self._sub_regs_index.get(name)
+        if reg is not None:
+            return reg
 
         raise SPSDKRegsErrorRegisterNotFound(
             f"The {name} is not found in loaded registers for {self.dev_name} device."
         )
 
+    def _update_sub_regs_index(self) -> None:
+        """Update index of sub-registers of all group registers."""
+        for reg in self._registers:
+            for sub_reg in reg.sub_regs:
+                self._sub_regs_index.setdefault(sub_reg.name, sub_reg)
+
+    def _update_offsets_index(self, reg: RegsRegister) -> None:
+        """Update index of offsets by the register.
+
+        :param reg: Register with possibly updated offset.
+        """
+        # TODO solve problem with group register that are always at 0 offset
+        if reg.offset != 0:
+            self._offsets_index.setdefault(reg.offset, reg)
+
     def add_register(self, reg: RegsRegister) -> None:
         """Adds register into register list.
 
@@ -930,26 +952,37 @@ class Registers:
         if not isinstance(reg, RegsRegister):
             raise SPSDKError("The 'reg' has invalid type.")
 
-        if reg.name in self.get_reg_names():
+        register = self._names_index.get(reg.name)
+        if register is not None and register.name == reg.name:
             raise SPSDKRegsError(f"Cannot add register with same name: {reg.name}.")
 
-        for idx, register in enumerate(self._registers):
-            # TODO solve problem with group register that are always at 0 offset
-            if register.offset == reg.offset != 0:
-                logger.debug(
-                    f"Found register at the same offset {hex(reg.offset)}"
-                    f", adding {reg.name} as an alias to {register.name}"
-                )
-                self._registers[idx].add_alias(reg.name)
-                self._registers[idx]._bitfields.extend(reg._bitfields)
-                return
+        register = self._offsets_index.get(reg.offset) if reg.offset != 0 else None
+        if register is not None and register.offset == reg.offset:
+            logger.debug(
+                f"Found register at the same offset {hex(reg.offset)}"
+                f", adding {reg.name} as an alias to {register.name}"
+            )
+            register.add_alias(reg.name)
+            self._names_index.setdefault(reg.name, register)
+            for bitfield in reg._bitfields:
+                register.add_bitfield(bitfield)
+            return
         # update base endianness for all registers in group
         reg.base_endianness = self.base_endianness
         self._registers.append(reg)
+        self._names_index.setdefault(reg.name, reg)
+        for alias in reg._alias_names:
+            self._names_index.setdefault(alias, reg)
+        self._update_offsets_index(reg)
+        for sub_reg in reg.sub_regs:
+            self._sub_regs_index.setdefault(sub_reg.name, sub_reg)
 
     def remove_registers(self) -> None:
         """Remove all registers."""
         self._registers.clear()
+        self._names_index.clear()
+        self._offsets_index.clear()
+        self._sub_regs_index.clear()
 
     def get_registers(
         self, exclude: Optional[List[str]] = None, include_group_regs: bool = False
@@ -1229,7 +1262,11 @@ class Registers:
                     )
 
                     self.add_register(group_reg)
-                group_reg.add_group_reg(RegsRegister.from_xml_element(xml_reg))
+                sub_reg = RegsRegister.from_xml_element(xml_reg)
+                group_reg.add_group_reg(sub_reg)
+                self._sub_regs_index.setdefault(sub_reg.name, sub_reg)
+                # The offset of group register is given by its first member
+                self._update_offsets_index(group_reg)
             else:
                 self.add_register(RegsRegister.from_xml_element(xml_reg))
 
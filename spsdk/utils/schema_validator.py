@@ -7,13 +7,17 @@
 """Module for schema-based configuration validation."""
 
 import copy
+import hashlib
 import io
+import json
 import logging
 import os
+import tempfile
 from collections import OrderedDict
 from typing import Any, Callable, Dict, List, Optional, Union
 
 import fastjsonschema
+import platformdirs
 from deepmerge import Merger, always_merger
 from deepmerge.strategy.dict import DictStrategies
 from deepmerge.strategy.list import ListStrategies
@@ -22,7 +26,8 @@ from ruamel.yaml import YAML
 from ruamel.yaml.comments import CommentedMap as CMap
 from ruamel.yaml.comments import CommentedSeq as CSeq
 
-from spsdk import SPSDK_YML_INDENT
+import spsdk
+from spsdk import SPSDK_CACHE_DISABLED, SPSDK_YML_INDENT
 from spsdk.exceptions import SPSDKError
 from spsdk.utils.misc import (
     find_dir,
@@ -35,9 +40,18 @@ from spsdk.utils.misc import (
 from spsdk.utils.spsdk_enum import SpsdkEnum
 
 ENABLE_DEBUG = False
+# Maximal count of compiled validators kept in memory
+VALIDATORS_CACHE_SIZE = 64
+# Store the generated code of validators into SPSDK cache folder to be reused by next runs;
+# the stored code is executed on load, so it's opt-in by SPSDK_VALIDATORS_CACHE env variable
+VALIDATORS_CACHE_PERSISTENT = (
+    bool(os.environ.get("SPSDK_VALIDATORS_CACHE")) and not SPSDK_CACHE_DISABLED
+)
 
 logger = logging.getLogger(__name__)
 
+_validators_cache: "OrderedDict[str, Callable[..., Any]]" = OrderedDict()
+
 
 def cmap_update(cmap: CMap, updater: CMap) -> None:
     """Update CMap including comments.
@@ -164,6 +178,126 @@ def _print_validation_fail_reason(
     return message
 
 
+def get_validators_cache_dir() -> str:
+    """Get folder of persistent cache of the generated validators.
+
+    :return: Path to the cache folder.
+    """
+    cache_path = platformdirs.user_cache_dir(appname="spsdk", version=spsdk.version)
+    return os.path.join(cache_path, "schema_validators")
+
+
+def clear_validators_cache() -> None:
+    """Clear in-memory cache of compiled validators."""
+    _validators_cache.clear()
+
+
+def _get_schemas_fingerprint(
+    schemas: List[Dict[str, Any]], formats: Dict[str, Callable[[str], bool]]
+) -> str:
+    """Get stable fingerprint of validation schemas and set of formatters.
+
+    The formatters are identified just by name (callables) or by the pattern (regular
+    expressions), callables are passed to the compiled validator on each validation.
+
+    :param schemas: List of validation schemas
+    :param formats: Custom formatters
+    :return: Hexadecimal digest of the fingerprint
+    """
+    formats_ids = {name: fmt if isinstance(fmt, str) else None for name, fmt in formats.items()}
+    fingerprint = json.dumps(
+        [fastjsonschema.VERSION, formats_ids, schemas], sort_keys=True, default=str
+    )
+    return hashlib.sha256(fingerprint.encode("utf-8")).hexdigest()
+
+
+def _load_validator_code(code: str) -> Callable[..., Any]:
+    """Execute generated code of validator.
+
+    :param code: Generated code of validator
+    :return: Validation function
+    """
+    global_state: Dict[str, Any] = {}
+    exec(code, global_state)  # pylint: disable=exec-used
+    return global_state["validator"]
+
+
+def _load_persistent_validator(fingerprint: str) -> Optional[Callable[..., Any]]:
+    """Load validator from persistent cache.
+
+    :param fingerprint: Fingerprint of the validator
+    :return: Validation function, None if not cached
+    """
+    file_name = os.path.join(get_validators_cache_dir(), f"{fingerprint}.py")
+    if not os.path.isfile(file_name):
+        return None
+    try:
+        with open(file_name, encoding="utf-8") as f:
+            return _load_validator_code(f.read())
+    except Exception as exc:  # pylint: disable=broad-except
+        logger.debug(f"Cannot load cached validator {file_name}: {str(exc)}")
+        return None
+
+
+def _store_persistent_validator(fingerprint: str, code: str) -> None:
+    """Store generated code of validator into persistent cache.
+
+    :param fingerprint: Fingerprint of the validator
+    :param code: Generated code of validator
+    """
+    cache_dir = get_validators_cache_dir()
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        # write into temporary file first to not expose partial file to concurrent processes
+        fd, tmp_name = tempfile.mkstemp(suffix=".tmp", dir=cache_dir)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(code)
+        os.replace(tmp_name, os.path.join(cache_dir, f"{fingerprint}.py"))
+    except OSError as exc:
+        logger.debug(f"Cannot store validator into cache: {str(exc)}")
+
+
+def get_validator(
+    schemas: List[Dict[str, Any]], formats: Dict[str, Callable[[str], bool]]
+) -> Callable[..., Any]:
+    """Get compiled validator of merged validation schemas.
+
+    Compiled validators are kept in LRU cache, optionally persisted as generated code in SPSDK
+    cache folder. The returned function must be called with 'custom_formats' argument.
+
+    :param schemas: List of validation schemas
+    :param formats: Custom formatters
+    :raises SPSDKError: Invalid validation schema
+    :return: Validation function
+    """
+    fingerprint = _get_schemas_fingerprint(schemas, formats)
+    validator = _validators_cache.get(fingerprint)
+    if validator:
+        _validators_cache.move_to_end(fingerprint)
+        return validator
+
+    if VALIDATORS_CACHE_PERSISTENT:
+        validator = _load_persistent_validator(fingerprint)
+    if not validator:
+        schema: Dict[str, Any] = {}
+        for sch in schemas:
+            always_merger.merge(schema, copy.deepcopy(sch))
+        try:
+            code = fastjsonschema.compile_to_code(schema, formats=formats)
+            scope_name = fastjsonschema.RefResolver.from_schema(schema, store={}).get_scope_name()
+        except (TypeError, fastjsonschema.JsonSchemaDefinitionException) as exc:
+            raise SPSDKError(f"Invalid validation schema to check config: {str(exc)}") from exc
+        code += f"\n\nvalidator = {scope_name}\n"
+        validator = _load_validator_code(code)
+        if VALIDATORS_CACHE_PERSISTENT:
+            _store_persistent_validator(fingerprint, code)
+
+    _validators_cache[fingerprint] = validator
+    while len(_validators_cache) > VALIDATORS_CACHE_SIZE:
+        _validators_cache.popitem(last=False)
+    return validator
+
+
 def check_config(
     config: Union[str, Dict[str, Any]],
     schemas: List[Dict[str, Any]],
@@ -197,19 +331,18 @@ def check_config(
     else:
         config_to_check = copy.deepcopy(config)
 
-    schema: Dict[str, Any] = {}
-    for sch in schemas:
-        always_merger.merge(schema, copy.deepcopy(sch))
-    validator = None
     formats = always_merger.merge(custom_formatters, extra_formatters or {})
-    try:
-        if ENABLE_DEBUG:
+    if ENABLE_DEBUG:
+        schema: Dict[str, Any] = {}
+        for sch in schemas:
+            always_merger.merge(schema, copy.deepcopy(sch))
+        try:
             validator_code = fastjsonschema.compile_to_code(schema, formats=formats)
-            write_file(validator_code, "validator_file.py")
-        else:
-            validator = fastjsonschema.compile(schema, formats=formats)
-    except (TypeError, fastjsonschema.JsonSchemaDefinitionException) as exc:
-        raise SPSDKError(f"Invalid validation schema to check config: {str(exc)}") from exc
+        except (TypeError, fastjsonschema.JsonSchemaDefinitionException) as exc:
+            raise SPSDKError(f"Invalid validation schema to check config: {str(exc)}") from exc
+        write_file(validator_code, "validator_file.py")
+    else:
+        validator = get_validator(schemas, formats)
     try:
         if ENABLE_DEBUG:
             # pylint: disable=import-error,import-outside-toplevel
@@ -217,8 +350,7 @@ def check_config(
 
             validator_file.validate(config_to_check, formats)
         else:
-            assert validator is not None
-            validator(config_to_check)
+            validator(config_to_check, custom_formats=formats)
     except fastjsonschema.JsonSchemaValueException as exc:
         message = _print_validation_fail_reason(exc, formats)
         raise SPSDKError(f"Configuration validation failed: {message}") from exc
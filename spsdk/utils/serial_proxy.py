@@ -74,6 +74,14 @@ class SerialProxy:
         self.buffer = self.responses[data]
         logger.debug(f"setting buffer to: '{self.buffer!r}'")
 
+    @property
+    def in_waiting(self) -> int:
+        """Simulates count of received bytes waiting for read.
+
+        Responses are simulated as produced on request, so nothing is ever waiting.
+        """
+        return 0
+
     def read(self, length: int) -> bytes:
         """Read portion of pre-configured data.
 
@@ -20,10 +20,11 @@ def gather(
     group: Union[click.Group, click.Command], func: Callable, command_name: str = ""
 ) -> Iterator[bool]:
     if isinstance(group, click.Group):
-        for name in sorted(group.commands):
+        ctx = click.Context(group)
+        for name in group.list_commands(ctx):
             if name in ["blhost", "sdphost", "sdpshost", "dk6prog"]:
                 continue
-            sub_group = group.commands[name]
+            sub_group = group.get_command(ctx, name)
             next_level = f"{command_name} {name}" if command_name else name
             yield from gather(group=sub_group, func=func, command_name=next_level)
     elif isinstance(group, click.Command):
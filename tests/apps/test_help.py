@@ -7,6 +7,8 @@
 """Test that help message for all registered CLI apps works."""
 import logging
 
+import click
+
 from spsdk.apps import spsdk_apps
 from tests.cli_runner import CliRunner
 
@@ -22,11 +24,13 @@ def test_spsdk_apps_help(cli_runner: CliRunner):
 
 
 def test_spsdk_apps_subcommands_help(cli_runner: CliRunner):
-    devscan = spsdk_apps.main.commands.pop("nxpdevscan")
+    ctx = click.Context(spsdk_apps.main)
+    devscan = spsdk_apps.main.get_command(ctx, "nxpdevscan")
     run_help(cli_runner, devscan, help_option=True)
-    for name, command in spsdk_apps.main.commands.items():
-        if name == "clear-cache":
+    for name in spsdk_apps.main.list_commands(ctx):
+        if name in ["clear-cache", "nxpdevscan"]:
             continue
         logging.debug(f"running help for {name}")
+        command = spsdk_apps.main.get_command(ctx, name)
         run_help(cli_runner, command, help_option=True)
         run_help(cli_runner, command, help_option=False)
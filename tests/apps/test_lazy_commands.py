@@ -0,0 +1,150 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+#
+# Copyright 2024 NXP
+#
+# SPDX-License-Identifier: BSD-3-Clause
+"""Benchmark of import time of the CLI apps entry points and test of lazy loading of commands."""
+import logging
+import subprocess
+import sys
+from typing import Dict
+
+import click
+import pytest
+
+from spsdk.apps import nxpimage, spsdk_apps
+from tests.cli_runner import CliRunner
+
+# Entry point: budget of CPU time of the import in seconds
+ENTRY_POINTS = {
+    "blhost": 3.0,
+    "dk6prog": 3.0,
+    "ifr": 3.0,
+    "nxpcrypto": 3.0,
+    "nxpdebugmbox": 3.0,
+    "nxpdevhsm": 3.0,
+    "nxpdevscan": 3.0,
+    "nxpele": 3.0,
+    "nxpgang": 3.0,
+    "nxpimage": 1.0,
+    "nxpmemcfg": 3.0,
+    "nxpwpc": 3.0,
+    "pfr": 3.0,
+    "sdphost": 3.0,
+    "sdpshost": 3.0,
+    "shadowregs": 3.0,
+    "spsdk_apps": 1.0,
+}
+
+NOT_IMPORTED = {
+    "spsdk_apps": ["spsdk.apps.blhost", "spsdk.apps.nxpimage", "spsdk.utils.database"],
+    "nxpimage": ["spsdk.apps.nxpimage_apps", "spsdk.image", "spsdk.sbfile", "spsdk.crypto.keys"],
+}
+
+
+def get_import_times(code: str) -> Dict[str, int]:
+    """Run code in new interpreter and get cumulative import times of all imported modules.
+
+    :param code: Python code to run, e.g. 'import module'
+    :return: Dictionary with module name and its cumulative import time in microseconds
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def get_import_cpu_time(module: str) -> float:
+    """Import module in new interpreter and get CPU time of the import.
+
+    The CPU time doesn't depend on the load of the machine as much as the import time.
+
+    :param module: Name of the module to import
+    :return: CPU time of the import in seconds
+    """
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            f"import time; start = time.process_time(); import {module}; "
+            "print(time.process_time() - start)",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return float(result.stdout.splitlines()[-1])
+
+
+@pytest.mark.parametrize("app, budget", ENTRY_POINTS.items())
+def test_import_time_benchmark(app, budget):
+    """Benchmark of import time of the entry point of application."""
+    module = f"spsdk.apps.{app}"
+    times = get_import_times(f"import {module}")
+    cpu_time = get_import_cpu_time(module)
+    logging.info(
+        f"Import of {module}: {times[module] / 1000:.1f} ms, CPU time {cpu_time * 1000:.1f} ms, "
+        f"{len(times)} modules imported"
+    )
+    assert cpu_time < budget
+
+
+@pytest.mark.parametrize("app, not_imported", NOT_IMPORTED.items())
+def test_lazy_import(app, not_imported):
+    times = get_import_times(f"import spsdk.apps.{app}")
+    for module in not_imported:
+        assert module not in times
+
+
+@pytest.mark.parametrize("app, not_imported", NOT_IMPORTED.items())
+def test_lazy_help(app, not_imported):
+    """The help of the main group doesn't import the lazily loaded sub-commands."""
+    code = (
+        "import sys\n"
+        f"from spsdk.apps.{app} import main\n"
+        "try:\n"
+        "    main(['--help'])\n"
+        "except SystemExit as exc:\n"
+        "    assert not exc.code\n"
+        "print('\\n'.join(sys.modules), file=sys.stderr)\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    loaded = result.stderr.splitlines()
+    assert "Commands:" in result.stdout
+    assert f"spsdk.apps.{app}" in loaded
+    for module in not_imported:
+        assert not any(name.startswith(module) for name in loaded)
+
+
+@pytest.mark.parametrize("group", [spsdk_apps.main, nxpimage.main])
+def test_lazy_commands(group: click.Group):
+    ctx = click.Context(group)
+    assert group.list_commands(ctx) == sorted(set(group.commands) | set(group.lazy_commands))
+    for name, (_, short_help) in group.lazy_commands.items():
+        command = group.get_command(ctx, name)
+        assert isinstance(command, click.Command)
+        assert command.name == name
+        assert group.commands[name] is command
+        # short help of the not loaded sub-command must match the help of the command
+        assert command.help.partition("\n")[0] == short_help
+    assert group.get_command(ctx, "unknown") is None
+
+
+def test_lazy_commands_help(cli_runner: CliRunner):
+    """The help of the main group shows also the not loaded sub-commands."""
+    result = cli_runner.invoke(nxpimage.main, ["--help"])
+    for name, (_, short_help) in nxpimage.NXPIMAGE_COMMANDS.items():
+        assert name in result.output
+        assert short_help in result.output
@@ -7,6 +7,8 @@
 """Test that help message for all registered CLI apps works."""
 import logging
 
+import click
+
 from spsdk import __version__ as spsdk_version
 from spsdk.apps import spsdk_apps
 from tests.cli_runner import CliRunner
@@ -22,8 +24,9 @@ def test_spsdk_apps_help(cli_runner: CliRunner):
 
 
 def test_spsdk_apps_subcommands_help(cli_runner: CliRunner):
-    for name, command in spsdk_apps.main.commands.items():
+    ctx = click.Context(spsdk_apps.main)
+    for name in spsdk_apps.main.list_commands(ctx):
         if name == "clear-cache":
             continue
         logging.debug(f"running help for {name}")
-        run_version(cli_runner, command)
+        run_version(cli_runner, spsdk_apps.main.get_command(ctx, name))
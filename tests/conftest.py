@@ -11,6 +11,7 @@ from os import environ, path
 import pytest
 from cryptography.hazmat.backends.openssl import backend
 
+from spsdk.utils import schema_validator
 from tests.cli_runner import CliRunner
 
 # Disable RSA key blinding to speed up unit tests in cryptography 37+
@@ -24,6 +25,8 @@ except ImportError:
     collect_ignore_glob = ["tp*"]
 
 environ["SPSDK_ENV_CACHE_DISABLED"] = "False"
+# Tests must not use or fill the persistent cache of validators in user cache folder
+schema_validator.VALIDATORS_CACHE_PERSISTENT = False
 
 
 @pytest.fixture
@@ -63,6 +63,15 @@ def test_get_signature(tmpdir, key_type):
         assert ECDSASignature.get_encoding(signature) == SPSDKEncoding.NXP
     else:
         assert private_key.signature_size == len(signature)
+    signatures = provider.sign_many([b"1", b"2"])
+    assert len(signatures) == 2
+    assert private_key.get_public_key().verify_signature(signatures[1], b"2")
+    # the signatures are in the same format as from get_signature
+    for signature in signatures:
+        if isinstance(private_key, PrivateKeyEcc):
+            assert ECDSASignature.get_encoding(signature) == SPSDKEncoding.NXP
+        else:
+            assert private_key.signature_size == len(signature)
 
 
 @pytest.mark.skipif(
@@ -0,0 +1,135 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+#
+# Copyright 2024 NXP
+#
+# SPDX-License-Identifier: BSD-3-Clause
+"""Tests for HTTP proxy Signature Provider using a local stand-in signing server."""
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Generator, List
+
+import pytest
+
+from spsdk.crypto.keys import ECDSASignature, PrivateKeyEcc, PublicKeyEcc
+from spsdk.crypto.signature_provider import HttpProxySP, SignatureProvider
+from spsdk.crypto.types import SPSDKEncoding
+from spsdk.exceptions import SPSDKError
+
+
+class SigningServer(ThreadingHTTPServer):
+    """Stand-in of the signing server implementing the proxy signature provider API."""
+
+    def __init__(self) -> None:
+        super().__init__(("localhost", 0), SigningRequestHandler)
+        self.private_key = PrivateKeyEcc.generate_key()
+        self.connections = 0
+        self.requests: List[str] = []
+        self.payloads: List[Dict[str, Any]] = []
+
+    def handle_api(self, endpoint: str, payload: Dict[str, Any]) -> Any:
+        self.requests.append(endpoint)
+        self.payloads.append(payload)
+        if endpoint == "sign":
+            return self.private_key.sign(bytes.fromhex(payload["data"])).hex()
+        if endpoint == "sign_many":
+            # DER encoded signatures, the provider converts them as the other signatures
+            return [
+                self.private_key.sign(bytes.fromhex(item), der_format=True).hex()
+                for item in payload["data"]
+            ]
+        if endpoint == "signature_length":
+            return self.private_key.signature_size
+        if endpoint == "verify_public_key":
+            public_key = PublicKeyEcc.parse(bytes.fromhex(payload["data"]))
+            return self.private_key.verify_public_key(public_key)
+        raise KeyError(endpoint)
+
+
+class SigningRequestHandler(BaseHTTPRequestHandler):
+    """Handler of the stand-in signing server requests."""
+
+    protocol_version = "HTTP/1.1"
+    server: SigningServer
+
+    def setup(self) -> None:
+        super().setup()
+        self.server.connections += 1
+
+    def do_GET(self) -> None:  # pylint: disable=invalid-name
+        payload = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        try:
+            response = {"data": self.server.handle_api(self.path.split("/")[-1], payload)}
+            status = 200
+        except KeyError:
+            response = {"error": "Unknown endpoint"}
+            status = 404
+        content = json.dumps(response).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, format: str, *args: Any) -> None:  # pylint: disable=redefined-builtin
+        """Don't log the requests."""
+
+
+@pytest.fixture
+def server() -> Generator[SigningServer, None, None]:
+    server = SigningServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def provider(server: SigningServer) -> Generator[HttpProxySP, None, None]:
+    sp = SignatureProvider.create(
+        f"type=proxy;host=localhost;port={server.server_address[1]};key_type=IMG;key_index=0"
+    )
+    assert isinstance(sp, HttpProxySP)
+    yield sp
+    sp.close()
+
+
+def test_proxy_sign(server: SigningServer, provider: HttpProxySP):
+    public_key = server.private_key.get_public_key()
+    for i in range(5):
+        data = bytes([i]) * 100
+        assert public_key.verify_signature(provider.sign(data), data)
+    # all requests use the same connection
+    assert server.connections == 1
+    assert server.payloads[0]["key_type"] == "IMG"
+
+
+def test_proxy_cached_properties(server: SigningServer, provider: HttpProxySP):
+    for _ in range(10):
+        assert provider.signature_length == server.private_key.signature_size
+        assert provider.verify_public_key(server.private_key.get_public_key().export())
+    other_key = PrivateKeyEcc.generate_key().get_public_key().export()
+    assert not provider.verify_public_key(other_key)
+    assert not provider.verify_public_key(other_key)
+    assert server.requests == ["signature_length", "verify_public_key", "verify_public_key"]
+
+
+def test_proxy_sign_many(server: SigningServer, provider: HttpProxySP):
+    public_key = server.private_key.get_public_key()
+    data = [bytes([i]) * 100 for i in range(20)]
+    signatures = provider.sign_many(data)
+    assert len(signatures) == len(data)
+    for item, signature in zip(data, signatures):
+        assert ECDSASignature.get_encoding(signature) == SPSDKEncoding.NXP
+        assert len(signature) == server.private_key.signature_size
+        assert public_key.verify_signature(signature, item)
+    assert provider.sign_many([]) == []
+    assert server.requests == ["sign_many", "signature_length"]
+
+
+def test_proxy_error(server: SigningServer, provider: HttpProxySP):
+    provider.base_url += "unknown/"
+    with pytest.raises(SPSDKError):
+        provider._handle_request("unknown")
@@ -8,14 +8,21 @@
 
 from binascii import unhexlify
 
+import pytest
+
+from spsdk.crypto import symmetric
 from spsdk.crypto.symmetric import (
+    Counter,
     aes_ctr_decrypt,
+    aes_ctr_decrypt_counter,
     aes_ctr_encrypt,
+    aes_ctr_encrypt_counter,
     aes_key_unwrap,
     aes_key_wrap,
     sm4_cbc_decrypt,
     sm4_cbc_encrypt,
 )
+from spsdk.utils.misc import Endianness
 
 
 def test_aes_key_wrap():
@@ -52,6 +59,28 @@ def test_aes_ctr_decrypt():
     assert calc_plain_text == plain_text
 
 
+@pytest.mark.parametrize("byte_order", [Endianness.LITTLE, Endianness.BIG])
+@pytest.mark.parametrize("length", [16, 100, 1024])
+@pytest.mark.parametrize("step", [1, 16])
+def test_aes_ctr_encrypt_counter(monkeypatch, byte_order, length, step):
+    monkeypatch.setattr(symmetric, "AES_CTR_CHUNK_SIZE", 64)
+    key = b"1234567812345678"
+    nonce = bytes(range(12)) + b"\xf0\x00\x00\xf0"
+    plain_text = bytes(i & 0xFF for i in range(length))
+    # reference: each block encrypted separately with its counter value
+    counter = Counter(nonce, ctr_byteorder_encoding=byte_order)
+    cipher_text = b""
+    for offset in range(0, length, 16):
+        cipher_text += aes_ctr_encrypt(key, plain_text[offset : offset + 16], counter.value)
+        counter.increment(step)
+
+    counter = Counter(nonce, ctr_byteorder_encoding=byte_order)
+    assert aes_ctr_encrypt_counter(key, plain_text, counter, step) == cipher_text
+    assert counter.value == Counter(nonce, (length + 15) // 16 * step, byte_order).value
+    counter = Counter(nonce, ctr_byteorder_encoding=byte_order)
+    assert aes_ctr_decrypt_counter(key, cipher_text, counter, step) == plain_text
+
+
 def test_aes_sm4_encrypt():
     key = b"1234567812345678"
     nonce = b"\x00" * 16
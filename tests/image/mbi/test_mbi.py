@@ -6,7 +6,9 @@
 # SPDX-License-Identifier: BSD-3-Clause
 
 import json
+import logging
 import os
+import time
 from typing import Optional
 
 import pytest
@@ -15,9 +17,20 @@ from spsdk.crypto.certificate import Certificate
 from spsdk.crypto.signature_provider import SignatureProvider
 from spsdk.exceptions import SPSDKError
 from spsdk.image.keystore import KeySourceType, KeyStore
-from spsdk.image.mbi.mbi import MasterBootImage, create_mbi_class, get_all_mbi_classes
-from spsdk.image.mbi.mbi_mixin import Mbi_MixinRelocTable, MultipleImageEntry, MultipleImageTable
-from spsdk.image.trustzone import TrustZone
+from spsdk.image.mbi.mbi import (
+    MasterBootImage,
+    create_mbi_class,
+    get_all_mbi_classes,
+    get_mbi_class,
+    get_mbi_classes,
+)
+from spsdk.image.mbi.mbi_mixin import (
+    Mbi_Mixin,
+    Mbi_MixinRelocTable,
+    MultipleImageEntry,
+    MultipleImageTable,
+)
+from spsdk.image.trustzone import TrustZone, TrustZoneType
 from spsdk.utils.crypto.cert_blocks import CertBlockV1
 from spsdk.utils.database import DatabaseManager, get_schema_file
 from spsdk.utils.misc import load_binary, load_configuration, write_file
@@ -726,3 +739,67 @@ def test_get_mbi_classes():
     mbi_classes = get_all_mbi_classes()
     for mbi in mbi_classes:
         assert issubclass(mbi, MasterBootImage)
+
+
+def test_mbi_classes_cache():
+    assert create_mbi_class("crc_xip", "lpc55s6x") is create_mbi_class("crc_xip", "lpc55s6x")
+    config = {
+        "family": "lpc55s6x",
+        "outputImageExecutionTarget": "xip",
+        "outputImageAuthenticationType": "crc",
+    }
+    assert get_mbi_class(config) is create_mbi_class("crc_xip", "lpc55s6x")
+    mbi_classes = get_mbi_classes("lpc55s6x")
+    mbi_classes.clear()
+    assert get_mbi_classes("lpc55s6x")["lpc55s6x_xip_crc"][0] is get_mbi_class(config)
+
+
+def test_mbi_layout_cache():
+    mbi_cls = create_mbi_class("crc_xip", "lpc55s6x")
+    mixins = mbi_cls._get_mixins()
+    assert mixins == [base for base in mbi_cls.__bases__ if issubclass(base, Mbi_Mixin)]
+    assert mbi_cls._get_mixin_methods("mix_len") == tuple(mixin.mix_len for mixin in mixins)
+    trust_zone = TrustZone(family="lpc55s6x", customizations={})
+    tz_len = len(trust_zone.export())
+    mbi = mbi_cls(app=bytes(0x100), trust_zone=trust_zone)
+    assert mbi.total_len == 0x100 + tz_len
+    assert mbi.app_len == 0x100 + tz_len
+    # the lengths are not cached outside of the export, in place changes are reflected
+    trust_zone.type = TrustZoneType.ENABLED
+    assert mbi.total_len == 0x100
+    lengths = []
+
+    def collect_data():
+        lengths.append(mbi.total_len)
+        trust_zone.type = TrustZoneType.CUSTOM
+        lengths.append(mbi.total_len)
+        # the lengths cached within the export are invalidated explicitly after in place change
+        mbi.clear_layout_cache()
+        lengths.append(mbi.total_len)
+        # or automatically after the attribute change
+        mbi.app = bytes(0x200)
+        lengths.append(mbi.total_len)
+        return bytes(mbi.total_len)
+
+    mbi.collect_data = collect_data
+    mbi.export()
+    assert lengths == [0x100, 0x100, 0x100 + tz_len, 0x200 + tz_len]
+    assert "_layout_cache" not in mbi.__dict__
+
+
+def test_mbi_generation_benchmark():
+    """Benchmark of the generation of many MBI images."""
+    config = {
+        "family": "lpc55s6x",
+        "outputImageExecutionTarget": "xip",
+        "outputImageAuthenticationType": "crc",
+    }
+    count = 200
+    start = time.perf_counter()
+    images = set()
+    for i in range(count):
+        mbi = get_mbi_class(config)(app=bytes([i]) * 0x1000)
+        images.add(bytes(mbi.export()))
+    duration = time.perf_counter() - start
+    logging.info(f"MBI generation: {count / duration:.0f} images/s")
+    assert len(images) == count
@@ -5,6 +5,9 @@
 #
 # SPDX-License-Identifier: BSD-3-Clause
 
+import logging
+import os
+import time
 from typing import Optional
 
 import pytest
@@ -12,14 +15,16 @@ import pytest
 from spsdk.crypto.rng import random_bytes
 from spsdk.exceptions import SPSDKError
 from spsdk.image.bee import (
+    BEE_ENCR_BLOCK_SIZE,
     BeeBaseClass,
     BeeFacRegion,
     BeeKIB,
+    BeeNxp,
     BeeProtectRegionBlock,
     BeeRegionHeader,
 )
 from spsdk.image.segments import SegBEE
-from spsdk.utils.misc import load_binary
+from spsdk.utils.misc import load_binary, split_data
 from spsdk.utils.spsdk_enum import SpsdkEnum
 
 
@@ -225,3 +230,52 @@ def test_seg_bee_invalid_encrypt_data() -> None:
     seg = SegBEE([])
     with pytest.raises(SPSDKError, match="Invalid start address"):
         seg.encrypt_data(start_addr=0xFFFFFFFFFFFFFFFFFFFF, data=bytes(16))
+
+
+def _encrypt_blocks_reference(hdr: BeeRegionHeader, start_addr: int, data: bytes) -> bytes:
+    """Encrypt data block by block."""
+    result = bytearray()
+    for block in split_data(data, BEE_ENCR_BLOCK_SIZE):
+        result += hdr.encrypt_block(start_addr + len(result), block)
+    return bytes(result)
+
+
+def test_bee_encrypt_data() -> None:
+    hdr = BeeRegionHeader(sw_key=random_bytes(16))
+    hdr.add_fac(BeeFacRegion(0x60001000, 0x3000, 0))
+    hdr.add_fac(BeeFacRegion(0x60004000, 0x1000, 0))
+    hdr.add_fac(BeeFacRegion(0x60008000, 0x1000, 0))
+    data = os.urandom(0xA000)
+    for start_addr in [0x60000000, 0x60000C00, 0x60003000]:
+        encrypted = hdr.encrypt_data(start_addr, data)
+        assert encrypted == _encrypt_blocks_reference(hdr, start_addr, data)
+    assert hdr._prdb.get_encrypted_spans(0x60000000, len(data)) == [
+        (0x1000, 0x5000),
+        (0x8000, 0x9000),
+    ]
+    # data outside of FAC regions are untouched
+    encrypted = hdr.encrypt_data(0x60000000, data)
+    assert encrypted[:0x1000] == data[:0x1000]
+    assert encrypted[0x5000:0x8000] == data[0x5000:0x8000]
+    assert hdr.encrypt_data(0x50000000, data) == data
+    # block exceeds the FAC region
+    with pytest.raises(SPSDKError, match="Invalid range of region"):
+        hdr.encrypt_data(0x60000200, data)
+
+
+def test_bee_export_image_benchmark() -> None:
+    """Benchmark of the image encryption compared with block by block encryption."""
+    hdr = BeeRegionHeader(sw_key=random_bytes(16))
+    hdr.add_fac(BeeFacRegion(0x60001000, 0x3FF000, 0))
+    data = os.urandom(0x40_0000)
+    start = time.perf_counter()
+    reference = _encrypt_blocks_reference(hdr, 0x60000000, data)
+    reference_duration = time.perf_counter() - start
+    start = time.perf_counter()
+    encrypted = BeeNxp([hdr, None], data, 0x60000000).export_image()
+    duration = time.perf_counter() - start
+    logging.info(
+        f"BEE encryption: {len(data) / duration / 1e6:.2f} MB/s, "
+        f"block by block: {len(data) / reference_duration / 1e6:.2f} MB/s"
+    )
+    assert encrypted == reference
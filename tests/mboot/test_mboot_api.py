@@ -79,6 +79,84 @@ def test_cmd_read_memory_timeout(mcuboot: McuBoot, target):
     assert exc_info.value.error_value == StatusCode.NO_RESPONSE
 
 
+def test_cmd_read_memory_windowed(mcuboot: McuBoot, target, config):
+    mcuboot._interface.device.fail_step = None
+    read_commands = 0
+    process_cmd = mcuboot._process_cmd
+
+    def counting_process_cmd(cmd_packet):
+        nonlocal read_commands
+        if cmd_packet.header.tag == CommandTag.READ_MEMORY:
+            read_commands += 1
+        return process_cmd(cmd_packet)
+
+    mcuboot._process_cmd = counting_process_cmd
+    mcuboot.read_window_packets = 4
+    try:
+        length = config.max_packet_size * 10 + 5
+        data = mcuboot._read_memory_windowed(0, length, 0)
+    finally:
+        mcuboot.read_window_packets = McuBoot.DEFAULT_READ_WINDOW_PACKETS
+        del mcuboot._process_cmd
+    assert mcuboot.status_code == StatusCode.SUCCESS
+    assert len(data) == length
+    assert read_commands == 3
+
+
+def test_cmd_read_memory_windowed_timeout(mcuboot: McuBoot, target):
+    mcuboot._interface.device.fail_step = 0
+    try:
+        data = mcuboot._read_memory_windowed(0, 100, 0)
+        assert data == b""
+        assert mcuboot.status_code == StatusCode.NO_RESPONSE
+
+        mcuboot._cmd_exception = True
+        with pytest.raises(McuBootCommandError) as exc_info:
+            mcuboot._read_memory_windowed(0, 100, 0)
+        assert exc_info.value.error_value == StatusCode.NO_RESPONSE
+    finally:
+        mcuboot._cmd_exception = False
+        mcuboot._interface.device.fail_step = None
+
+
+@pytest.mark.parametrize("cmd_exception", [False, True])
+def test_cmd_read_memory_windowed_resume(mcuboot: McuBoot, target, config, cmd_exception):
+    """The data received before timeout are kept and the read resumes at the first missing byte."""
+    mcuboot._interface.device.fail_step = None
+    addresses = []
+    data_reads = 0
+    process_cmd = mcuboot._process_cmd
+    readinto = mcuboot._interface.readinto
+
+    def recording_process_cmd(cmd_packet):
+        if cmd_packet.header.tag == CommandTag.READ_MEMORY:
+            addresses.append(cmd_packet.params[0])
+        return process_cmd(cmd_packet)
+
+    def failing_readinto(buffer):
+        nonlocal data_reads
+        data_reads += 1
+        # timeout after the first packet of the first window
+        if data_reads == 2:
+            raise TimeoutError()
+        return readinto(buffer)
+
+    mcuboot._process_cmd = recording_process_cmd
+    mcuboot._interface.readinto = failing_readinto
+    mcuboot._cmd_exception = cmd_exception
+    mcuboot.read_window_packets = 4
+    try:
+        length = config.max_packet_size * 6
+        data = mcuboot._read_memory_windowed(0, length, 0)
+    finally:
+        mcuboot.read_window_packets = McuBoot.DEFAULT_READ_WINDOW_PACKETS
+        mcuboot._cmd_exception = False
+        del mcuboot._process_cmd
+        del mcuboot._interface.readinto
+    assert len(data) == length
+    assert addresses == [0, config.max_packet_size, config.max_packet_size * 5]
+
+
 def test_cmd_write_memory(mcuboot: McuBoot, target):
     data = b"\x00" * 100
     assert mcuboot.write_memory(0, data)
@@ -117,6 +195,49 @@ def test_cmd_get_property(mcuboot: McuBoot, target, config):
         assert values == config.get_property_values(property_tag.tag)
 
 
+def test_cmd_get_property_cached(mcuboot: McuBoot, target, config):
+    get_property_commands = 0
+    process_cmd = mcuboot._process_cmd
+
+    def counting_process_cmd(cmd_packet):
+        nonlocal get_property_commands
+        if cmd_packet.header.tag == CommandTag.GET_PROPERTY:
+            get_property_commands += 1
+        return process_cmd(cmd_packet)
+
+    mcuboot._process_cmd = counting_process_cmd
+    try:
+        mcuboot.clear_property_cache()
+        for _ in range(3):
+            assert mcuboot.get_property(PropertyTag.MAX_PACKET_SIZE) == [config.max_packet_size]
+            assert mcuboot.status_code == StatusCode.SUCCESS
+        assert get_property_commands == 1
+        # volatile properties are never cached
+        mcuboot.get_property(PropertyTag.FLASH_SECURITY_STATE)
+        mcuboot.get_property(PropertyTag.FLASH_SECURITY_STATE)
+        assert get_property_commands == 3
+        # cache is invalidated by commands reconfiguring the target
+        mcuboot.configure_memory(0, 0)
+        mcuboot.get_property(PropertyTag.MAX_PACKET_SIZE)
+        assert get_property_commands == 4
+        # and by commands changing security state of the target
+        for command in [
+            mcuboot.flash_erase_all_unsecure,
+            lambda: mcuboot.flash_security_disable(bytes(8)),
+            lambda: mcuboot.efuse_program_once(0, 0),
+        ]:
+            command()
+            mcuboot.get_property(PropertyTag.MAX_PACKET_SIZE)
+        assert get_property_commands == 7
+        # opt-out
+        mcuboot.cache_properties = False
+        mcuboot.get_property(PropertyTag.MAX_PACKET_SIZE)
+        assert get_property_commands == 8
+    finally:
+        mcuboot.cache_properties = True
+        del mcuboot._process_cmd
+
+
 def test_cmd_set_property(mcuboot: McuBoot, target):
     assert not mcuboot.set_property(PropertyTag.VERIFY_WRITES, 0)
     assert mcuboot.status_code == StatusCode.UNKNOWN_COMMAND
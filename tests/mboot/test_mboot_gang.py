@@ -0,0 +1,139 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+#
+# Copyright 2024 NXP
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Testing the gang programming of multiple targets."""
+import json
+import os
+from unittest.mock import patch
+
+import pytest
+
+from spsdk.apps import nxpgang
+from spsdk.exceptions import SPSDKError
+from spsdk.mboot.error_codes import StatusCode
+from spsdk.mboot.gang import GangCommand, GangProgrammer
+from tests.cli_runner import CliRunner
+
+from .virtual_device import VirtualDevice, VirtualMbootInterface
+
+SCRIPT = """
+# erase and program the application
+flash-erase-region 0x0 0x1000
+write-memory 0x0 app.bin
+verify-memory 0x0 app.bin
+"""
+
+
+@pytest.fixture
+def script_file(tmpdir):
+    with open(os.path.join(tmpdir, "app.bin"), "wb") as f:
+        f.write(bytes(1000))
+    script_path = os.path.join(tmpdir, "script.txt")
+    with open(script_path, "w") as f:
+        f.write(SCRIPT)
+    return script_path
+
+
+def get_interfaces(config, count: int):
+    return [VirtualMbootInterface(VirtualDevice(config)) for _ in range(count)]
+
+
+def test_parse_script(script_file):
+    commands = GangProgrammer.load_script(script_file)
+    assert [cmd.name for cmd in commands] == [
+        "flash-erase-region",
+        "write-memory",
+        "verify-memory",
+    ]
+    assert commands[0].data is None
+    assert commands[1].data == bytes(1000)
+    assert str(commands[1]) == "write-memory 0x0 app.bin"
+
+
+@pytest.mark.parametrize(
+    "script",
+    [
+        "unknown-command 0",
+        "flash-erase-region 0x0",
+        "write-memory 0x0",
+        "reset\nflash-erase-all",
+    ],
+)
+def test_parse_script_invalid(script):
+    with pytest.raises(SPSDKError):
+        GangProgrammer.parse_script(script)
+
+
+def test_gang_run(config, script_file):
+    interfaces = get_interfaces(config, 4)
+    programmer = GangProgrammer(interfaces, GangProgrammer.load_script(script_file), max_workers=2)
+    reported = []
+    results = programmer.run(progress_callback=reported.append)
+    assert len(results) == len(reported) == 4
+    assert [result.device for result in results] == [str(interface) for interface in interfaces]
+    for result in results:
+        assert result.success, str(result)
+        assert result.status_code == StatusCode.SUCCESS
+        assert len(result.command_durations) == 3
+    assert all(not interface.is_opened for interface in interfaces)
+
+
+def test_gang_run_failure(config):
+    interfaces = get_interfaces(config, 2)
+    # erase outside of the flash fails on all targets
+    commands = [GangCommand("flash-erase-region", [hex(config.flash_size * 2), "0x1000"])]
+    results = GangProgrammer(interfaces, commands).run()
+    for result in results:
+        assert not result.success
+        assert result.failed_command == str(commands[0])
+        assert result.status_code == StatusCode.FLASH_ADDRESS_ERROR
+
+
+def test_gang_reset_last(config):
+    commands = [GangCommand("flash-erase-all"), GangCommand("reset")]
+    results = GangProgrammer(get_interfaces(config, 2), commands).run()
+    assert all(result.success for result in results)
+    with pytest.raises(SPSDKError):
+        GangProgrammer(get_interfaces(config, 1), commands[::-1])
+
+
+def test_gang_run_unexpected_error(config):
+    interfaces = get_interfaces(config, 3)
+    commands = [GangCommand("flash-erase-all")]
+    erase_all = GangProgrammer.COMMANDS["flash-erase-all"]
+
+    def failing_erase(mboot, cmd):
+        if mboot._interface is interfaces[1]:
+            raise OSError("Device disconnected")
+        return erase_all[0](mboot, cmd)
+
+    with patch.dict(GangProgrammer.COMMANDS, {"flash-erase-all": (failing_erase, 0, None)}):
+        results = GangProgrammer(interfaces, commands).run()
+    assert [result.success for result in results] == [True, False, True]
+    assert results[1].error == "Device disconnected"
+    assert results[1].failed_command == "flash-erase-all"
+    assert results[1].status_code == StatusCode.FAIL
+
+
+def test_gang_no_device():
+    with pytest.raises(SPSDKError):
+        GangProgrammer([], [])
+
+
+def test_nxpgang_cli(cli_runner: CliRunner, config, script_file):
+    interfaces = get_interfaces(config, 3)
+    with patch("spsdk.apps.nxpgang.get_mboot_interfaces", return_value=interfaces):
+        result = cli_runner.invoke(
+            nxpgang.main, ["run", "-u", "0x1fc9:0x0021", "-s", script_file, "-j"]
+        )
+    output = json.loads(result.output)
+    assert len(output) == 3
+    assert all(device["success"] for device in output)
+
+
+def test_nxpgang_cli_no_device(cli_runner: CliRunner, script_file):
+    cli_runner.invoke(nxpgang.main, ["run", "-s", script_file], expected_code=1)
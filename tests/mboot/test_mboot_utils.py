@@ -5,8 +5,12 @@
 #
 # SPDX-License-Identifier: BSD-3-Clause
 
+import io
+import os
+
 import pytest
 
+from spsdk.mboot.exceptions import McuBootError
 from spsdk.mboot.mcuboot import McuBoot, PropertyTag, _clamp_down_memory_id
 
 
@@ -23,7 +27,7 @@ def test_data_splitting(mcuboot: McuBoot):
     mcuboot._interface.need_data_split = False
 
     data_in = bytes(4 * max_packet_size)
-    data_out = mcuboot._split_data(data_in)
+    data_out = list(mcuboot._split_data(data_in))
     assert len(data_out) == 1
     assert len(data_out[0]) == 4 * max_packet_size
 
@@ -31,18 +35,72 @@ def test_data_splitting(mcuboot: McuBoot):
 
     data_in = bytes(4 * max_packet_size)
     # data size is aligned to MAX_PACKET_SIZE
-    data_out = mcuboot._split_data(data_in)
+    data_out = list(mcuboot._split_data(data_in))
     assert len(data_out) == 4
     assert all(len(chunk) == max_packet_size for chunk in data_out)
 
     # data size is misaligned
     data_in = bytes(max_packet_size + 10)
-    data_out = mcuboot._split_data(data_in)
+    data_out = list(mcuboot._split_data(data_in))
     assert len(data_out) == 2
     assert len(data_out[0]) == max_packet_size
     assert len(data_out[1]) == 10
 
 
+def test_data_splitting_streams(mcuboot: McuBoot):
+    """Test lazy splitting of file objects and chunk iterables."""
+    max_packet_size = mcuboot.get_property(PropertyTag.MAX_PACKET_SIZE)[0]
+    data_in = bytes(range(256)) * 4
+
+    data_out = list(mcuboot._split_data(io.BytesIO(data_in)))
+    assert all(len(chunk) <= max_packet_size for chunk in data_out)
+    assert b"".join(data_out) == data_in
+
+    data_out = list(mcuboot._split_data(io.BytesIO(data_in), length=100))
+    assert b"".join(data_out) == data_in[:100]
+
+    blocks = [
+        data_in[:10],
+        data_in[10 : 10 + 3 * max_packet_size],
+        data_in[10 + 3 * max_packet_size :],
+    ]
+    data_out = list(mcuboot._split_data(iter(blocks)))
+    assert all(len(chunk) <= max_packet_size for chunk in data_out)
+    assert b"".join(data_out) == data_in
+
+
+def test_write_memory_streams(mcuboot: McuBoot):
+    """Test writing data provided as file object, memoryview and iterable."""
+    data_in = bytes(1000)
+    progress = []
+
+    assert mcuboot.write_memory(
+        0, io.BytesIO(data_in), progress_callback=lambda x, y: progress.append((x, y))
+    )
+    assert progress[-1] == (1000, 1000)
+    assert mcuboot.write_memory(0, memoryview(data_in))
+    assert mcuboot.write_memory(0, iter([data_in[:500], data_in[500:]]), length=1000)
+    assert mcuboot.receive_sb_file(io.BytesIO(data_in))
+    with pytest.raises(McuBootError):
+        mcuboot.write_memory(0, iter([data_in]))
+
+
+def test_receive_sb_file_unseekable_stream(mcuboot: McuBoot):
+    """Test sending data from a non-seekable file object such as stdin or a pipe."""
+    data_in = bytes(range(256)) * 4
+    read_fd, write_fd = os.pipe()
+    os.write(write_fd, data_in)
+    os.close(write_fd)
+    with open(read_fd, "rb") as pipe:
+        assert not pipe.seekable()
+        assert mcuboot.receive_sb_file(pipe)
+    read_fd, write_fd = os.pipe()
+    os.write(write_fd, data_in)
+    os.close(write_fd)
+    with open(read_fd, "rb") as pipe:
+        assert mcuboot.write_memory(0, pipe)
+
+
 @pytest.mark.parametrize(
     "memory_id, clamped_mem_id",
     [(0, 0), (1, 0), (0xA, 0), (256, 256), (1000, 1000), (0x102, 0x102)],
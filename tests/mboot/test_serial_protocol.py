@@ -0,0 +1,220 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+#
+# Copyright 2024 NXP
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Testing the framing of the MBoot serial protocol."""
+import logging
+import struct
+import time
+from typing import List, Optional
+
+import pytest
+from crcmod.predefined import mkPredefinedCrcFun
+
+from spsdk.mboot.commands import CmdPacket, CommandTag
+from spsdk.mboot.exceptions import McuBootConnectionError, McuBootDataAbortError
+from spsdk.mboot.interfaces.uart import MbootUARTInterface
+from spsdk.mboot.protocol.serial_protocol import FPType, MbootSerialProtocol
+from spsdk.utils.interfaces.device.serial_device import SerialDevice
+
+
+class LoopbackSerial:
+    """Serial port simulating the target, each received frame is acknowledged.
+
+    Frames of the target are sent one by one, the next one after ACK of the previous one.
+    """
+
+    def __init__(self, latency: float = 0, report_waiting: bool = True) -> None:
+        """Initialize the loopback port.
+
+        :param latency: Duration of each read call in seconds (e.g. USB-UART bridge latency)
+        :param report_waiting: Report count of received bytes, like the real port does
+        """
+        self.is_open = True
+        self.timeout = 1.0
+        self.write_timeout = 1.0
+        self.latency = latency
+        self.report_waiting = report_waiting
+        self.read_calls = 0
+        self.rx_data = bytearray()
+        self.tx_frames: List[bytes] = []
+        self.written: List[bytes] = []
+
+    @property
+    def in_waiting(self) -> int:
+        return len(self.rx_data) if self.report_waiting else 0
+
+    def read(self, size: int = 1) -> bytes:
+        self.read_calls += 1
+        if self.latency:
+            time.sleep(self.latency)
+        data = bytes(self.rx_data[:size])
+        del self.rx_data[:size]
+        return data
+
+    def write(self, data: bytes) -> int:
+        self.written.append(bytes(data))
+        if data[1] in (FPType.CMD, FPType.DATA):
+            self.rx_data += bytes((MbootSerialProtocol.FRAME_START_BYTE, FPType.ACK.tag))
+        if data[1] == FPType.ACK and self.tx_frames:
+            self.rx_data += self.tx_frames.pop(0)
+        return len(data)
+
+    def send_frames(self, frames: List[bytes]) -> None:
+        self.rx_data += frames[0]
+        self.tx_frames.extend(frames[1:])
+
+    def flush(self) -> None:
+        """Data are written immediately."""
+
+    def open(self) -> None:
+        self.is_open = True
+
+    def close(self) -> None:
+        self.is_open = False
+
+    def reset_input_buffer(self) -> None:
+        self.rx_data.clear()
+
+    def reset_output_buffer(self) -> None:
+        """Nothing to reset."""
+
+
+def _create_frame_reference(data: bytes, frame_type: int) -> bytes:
+    """Reference implementation of the frame encapsulation."""
+    crc_function = mkPredefinedCrcFun("xmodem")
+    crc = crc_function(struct.pack(f"<BBH{len(data)}B", 0x5A, frame_type, len(data), *data))
+    return struct.pack(f"<BBHH{len(data)}B", 0x5A, frame_type, len(data), crc, *data)
+
+
+@pytest.fixture
+def port() -> LoopbackSerial:
+    return LoopbackSerial()
+
+
+@pytest.fixture
+def protocol(port: LoopbackSerial) -> MbootSerialProtocol:
+    device = SerialDevice()
+    device._device = port
+    return MbootUARTInterface(device)
+
+
+@pytest.mark.parametrize("length", [0, 1, 32, 512, 4096])
+def test_create_frame(protocol: MbootSerialProtocol, length):
+    data = bytes(i & 0xFF for i in range(length))
+    for frame_type in [FPType.CMD, FPType.DATA]:
+        frame = protocol._create_frame(data, frame_type)
+        assert frame == _create_frame_reference(data, frame_type.tag)
+        assert protocol._create_frame(memoryview(data), frame_type) == frame
+        assert protocol._calc_frame_crc(data, frame_type.tag) == int.from_bytes(
+            frame[4:6], "little"
+        )
+
+
+def test_write_and_read(protocol: MbootSerialProtocol, port: LoopbackSerial):
+    cmd = CmdPacket(CommandTag.GET_PROPERTY, 0, 1)
+    protocol.write_command(cmd)
+    protocol.write_data(b"\x01\x02\x03")
+    assert port.written == [
+        _create_frame_reference(cmd.to_bytes(padding=False), FPType.CMD.tag),
+        _create_frame_reference(b"\x01\x02\x03", FPType.DATA.tag),
+    ]
+
+    port.rx_data += _create_frame_reference(bytes(range(100)), FPType.DATA.tag)
+    assert protocol.read() == bytes(range(100))
+    assert port.written[-1] == bytes((0x5A, FPType.ACK.tag))
+
+    frame = bytearray(_create_frame_reference(bytes(range(100)), FPType.DATA.tag))
+    frame[-1] ^= 0xFF
+    port.rx_data += frame
+    with pytest.raises(McuBootConnectionError):
+        protocol.read()
+
+    port.rx_data += _create_frame_reference(b"", FPType.DATA.tag)
+    with pytest.raises(McuBootDataAbortError):
+        protocol.read()
+
+
+def test_framing_benchmark(protocol: MbootSerialProtocol, port: LoopbackSerial):
+    """Benchmark of frames encapsulation and sending over the loopback device."""
+    data = bytes(range(256)) * 2
+    count = 5000
+    start = time.perf_counter()
+    for _ in range(count):
+        protocol.write_data(data)
+    duration = time.perf_counter() - start
+    logging.info(f"Serial framing of {len(data)} B payload: {count / duration:.0f} frames/s")
+
+    assert len(port.written) == count
+    assert port.written[-1] == _create_frame_reference(data, FPType.DATA.tag)
+    assert not port.rx_data
+
+
+def test_buffered_read(protocol: MbootSerialProtocol, port: LoopbackSerial):
+    port.send_frames([_create_frame_reference(bytes(range(100)), FPType.DATA.tag)] * 2)
+    assert protocol.read() == bytes(range(100))
+    assert protocol.read() == bytes(range(100))
+    # whole frame was waiting, so it's received at once
+    assert port.read_calls == 2
+
+
+def test_overlapped_ack(protocol: MbootSerialProtocol, port: LoopbackSerial):
+    protocol.overlapped_ack = True
+    for _ in range(3):
+        protocol.write_data(b"\x01\x02\x03")
+    assert port.written == [_create_frame_reference(b"\x01\x02\x03", FPType.DATA.tag)] * 3
+    # ACK of the last frame is still pending
+    assert protocol._pending_acks == 1
+    port.send_frames([_create_frame_reference(b"\x04\x05", FPType.DATA.tag)])
+    assert protocol.read() == b"\x04\x05"
+    assert protocol._pending_acks == 0
+
+    protocol.write_data(b"\x01\x02\x03")
+    port.rx_data[-1] = FPType.ABORT.tag
+    with pytest.raises(McuBootDataAbortError):
+        protocol.overlapped_ack = False
+    assert protocol._pending_acks == 0
+
+
+@pytest.mark.parametrize(
+    "report_waiting, overlapped_ack",
+    [(False, False), (True, False), (True, True)],
+    ids=["unbuffered", "buffered", "overlapped"],
+)
+def test_transfer_benchmark(report_waiting, overlapped_ack):
+    """Benchmark of data transfer over loopback port with latency of each read."""
+    port = LoopbackSerial(latency=0.0002, report_waiting=report_waiting)
+    device = SerialDevice()
+    device._device = port
+    protocol = MbootUARTInterface(device)
+    protocol.overlapped_ack = overlapped_ack
+    data = bytes(range(256)) * 2
+    count = 200
+
+    start = time.perf_counter()
+    for _ in range(count):
+        protocol.write_data(data)
+    protocol._wait_for_pending_acks()
+    write_reads = port.read_calls
+    port.send_frames([_create_frame_reference(data, FPType.DATA.tag)] * count)
+    for _ in range(count):
+        assert protocol.read() == data
+    duration = time.perf_counter() - start
+    logging.info(
+        f"Serial transfer ({'buffered' if report_waiting else 'unbuffered'}, "
+        f"overlapped ACK {'on' if overlapped_ack else 'off'}): {2 * count / duration:.0f} frames/s, "
+        f"{port.read_calls} port reads"
+    )
+    assert len(port.written) == 2 * count
+    if not report_waiting:
+        # ACK: start byte and type, frame: start byte, type, length, CRC and data
+        assert port.read_calls == 2 * count + 5 * count
+    elif not overlapped_ack:
+        assert port.read_calls == 2 * count
+    else:
+        # ACKs of two consecutive frames are received at once
+        assert write_reads == count // 2
+        assert port.read_calls == write_reads + count
@@ -409,6 +409,14 @@ class VirtualMbootInterface:
     def read(self, length: Optional[int] = None) -> Union[CmdResponseBase, bytes]:
         return self.device.read(length or 0)
 
+    def readinto(self, buffer: memoryview) -> Union[CmdResponseBase, int]:
+        response = self.read(len(buffer))
+        if isinstance(response, CmdResponseBase):
+            return response
+        length = min(len(response), len(buffer))
+        buffer[:length] = response[:length]
+        return length
+
     def write_data(self, data: bytes) -> None:
         """Encapsulate data into frames and send them to device.
 
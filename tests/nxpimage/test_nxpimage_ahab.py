@@ -7,17 +7,30 @@
 
 """Test AHAB part of nxpimage app."""
 import filecmp
+import logging
 import os
 import shutil
+import time
+import tracemalloc
+from typing import List, Optional
 
 import pytest
 
 from spsdk.apps import nxpimage
+from spsdk.apps.nxpimage_apps import nxpimage_ahab
+from spsdk.crypto.hash import EnumHashAlgorithm, get_hash
 from spsdk.crypto.keys import IS_OSCCA_SUPPORTED
 from spsdk.exceptions import SPSDKValueError
-from spsdk.image.ahab.ahab_container import AHABImage
+from spsdk.image.ahab import ahab_container
+from spsdk.image.ahab.ahab_container import AHABContainer, AHABImage
 from spsdk.image.ahab.signed_msg import MessageCommands, SignedMessage
-from spsdk.utils.misc import load_binary, use_working_directory
+from spsdk.utils.misc import (
+    align,
+    load_binary,
+    load_configuration,
+    use_working_directory,
+    write_file,
+)
 from tests.cli_runner import CliRunner
 from tests.nxpimage.test_nxpimage_cert_block import process_config_file
 
@@ -321,3 +334,209 @@ def test_nxpimage_ahab_get_template(cli_runner: CliRunner, tmpdir, family):
     cmd = f"ahab get-template -f {family} -o {tmpdir}/tmp.yaml"
     cli_runner.invoke(nxpimage.main, cmd.split())
     assert os.path.isfile(f"{tmpdir}/tmp.yaml")
+
+
+def _load_ahab_image(data_dir: str, config_file: str, images: Optional[List[str]] = None):
+    """Load AHAB image from configuration, optionally with replaced images of the last container.
+
+    :param data_dir: Test data directory
+    :param config_file: Configuration file name in 'ahab' sub-directory
+    :param images: Paths to images to be used instead of the configured ones
+    :return: Loaded AHAB image
+    """
+    config = load_configuration(os.path.join(data_dir, "ahab", config_file))
+    if images:
+        image_config = config["containers"][-1]["container"]["images"][0]
+        offset = int(image_config["image_offset"], 0)
+        image_configs = []
+        for image in images:
+            image_configs.append(
+                {
+                    **image_config,
+                    "image_path": image,
+                    "image_offset": hex(offset),
+                    "load_address": hex(0x2000_0000 + offset),
+                    "entry_point": hex(0x2000_0000 + offset),
+                }
+            )
+            offset = align(offset + os.path.getsize(image), 0x400)
+        config["containers"][-1]["container"]["images"] = image_configs
+    with use_working_directory(data_dir):
+        return AHABImage.load_from_config(config, search_paths=[data_dir])
+
+
+def test_ahab_update_fields_memoization(data_dir, monkeypatch):
+    hashed = []
+    signed = []
+
+    def counting_get_hash(data, algorithm=EnumHashAlgorithm.SHA256):
+        hashed.append(len(data))
+        return get_hash(data, algorithm=algorithm)
+
+    monkeypatch.setattr(ahab_container, "get_hash", counting_get_hash)
+    ahab = _load_ahab_image(data_dir, "ctcm_cm33_signed_sb.yaml")
+    container = ahab.ahab_containers[-1]
+    signature = container.signature_block.signature
+    get_signature = signature.signature_provider.get_signature
+    monkeypatch.setattr(
+        signature.signature_provider,
+        "get_signature",
+        lambda data: signed.append(len(data)) or get_signature(data),
+    )
+    image_entry = container.image_array[0]
+    image_size = len(image_entry.image)
+
+    ahab.update_fields()
+    exported = ahab.export()
+    # the container is signed just once, after the final layout is known
+    assert len(signed) == 1
+    assert hashed.count(image_size) == 1
+    assert signature._signed[0] == container.get_signature_data()
+
+    # nothing has changed, so nothing is hashed or signed again
+    ahab.update_fields()
+    assert ahab.export() == exported
+    assert len(signed) == 1
+    assert hashed.count(image_size) == 1
+
+    # changed image is hashed and the container is signed again
+    image_entry.image = bytes(image_size)
+    ahab.update_fields()
+    assert len(signed) == 2
+    assert hashed.count(image_size) == 2
+    assert image_entry.image_hash[:64] == get_hash(
+        bytes(image_size), algorithm=EnumHashAlgorithm.SHA512
+    )
+    ahab.validate()
+
+
+def test_ahab_parsed_image_hash_reused(data_dir, monkeypatch):
+    ahab = _load_ahab_image(data_dir, "ctcm_cm33_encrypted_img.yaml")
+    ahab.update_fields()
+    exported = ahab.export()
+
+    hashed = []
+
+    def counting_get_hash(data, algorithm=EnumHashAlgorithm.SHA256):
+        hashed.append(len(data))
+        return get_hash(data, algorithm=algorithm)
+
+    monkeypatch.setattr(ahab_container, "get_hash", counting_get_hash)
+    parsed = AHABImage(family="rt118x", target_memory=ahab.target_memory)
+    parsed.parse(exported)
+    count = len(hashed)
+    parsed.update_fields(update_offsets=False)
+    assert len(hashed) == count
+    assert parsed.export() == exported
+
+
+@pytest.mark.parametrize("image_count", [1, 3])
+def test_ahab_parallel_update_fields(data_dir, tmpdir, monkeypatch, image_count):
+    images = []
+    for i in range(image_count):
+        images.append(os.path.join(tmpdir, f"image_{i}.bin"))
+        write_file(bytes(range(256)) * (0x400 * (i + 1)) + bytes([i]), images[-1], mode="wb")
+
+    monkeypatch.setattr(AHABContainer, "PARALLEL_MIN_SIZE", 1 << 32)
+    serial = _load_ahab_image(data_dir, "ctcm_cm33_encrypted_img.yaml", images)
+    serial.update_fields()
+    monkeypatch.setattr(AHABContainer, "PARALLEL_MIN_SIZE", 0)
+    parallel = _load_ahab_image(data_dir, "ctcm_cm33_encrypted_img.yaml", images)
+    parallel.update_fields()
+
+    assert parallel.export() == serial.export()
+    parallel.validate()
+    assert all(entry.already_encrypted_image for entry in parallel.ahab_containers[-1].image_array)
+
+
+def test_ahab_update_fields_benchmark(data_dir, tmpdir):
+    """Benchmark of update of fields (encryption, hashing and signing) of big AHAB image."""
+    images = []
+    for i in range(4):
+        images.append(os.path.join(tmpdir, f"image_{i}.bin"))
+        write_file(os.urandom(0x40_0000), images[-1], mode="wb")
+    ahab = _load_ahab_image(data_dir, "ctcm_cm33_encrypted_img.yaml", images)
+    size = sum(len(entry.plain_image) for entry in ahab.ahab_containers[-1].image_array)
+
+    start = time.perf_counter()
+    ahab.update_fields()
+    duration = time.perf_counter() - start
+    start = time.perf_counter()
+    ahab.update_fields()
+    duration_again = time.perf_counter() - start
+    ahab.validate()
+    logging.info(
+        f"AHAB update fields of {size / 0x10_0000:.0f} MB of encrypted images: "
+        f"{size / 0x10_0000 / duration:.1f} MB/s, repeated update: {duration_again * 1000:.1f} ms"
+    )
+
+
+@pytest.mark.parametrize(
+    "binary,family,target_memory",
+    [
+        ("cntr_signed_ctcm_cm33.bin", "rt118x", "nor"),
+        ("cntr_signed_ctcm_cm33_sb.bin", "rt118x", "serial_downloader"),
+        ("cntr_encrypted_ctcm_cm33.bin", "rt118x", "nor"),
+    ],
+)
+def test_nxpimage_ahab_parse_zero_copy(data_dir, binary, family, target_memory):
+    original_file = load_binary(f"{data_dir}/ahab/{binary}")
+    ahab = AHABImage(family, "a0", target_memory)
+    ahab.parse(original_file)
+    for container in ahab.ahab_containers:
+        for image_entry in container.image_array:
+            # the images are views into the parsed binary
+            assert isinstance(image_entry.image, memoryview)
+            assert image_entry.image.obj is original_file
+    ahab.update_fields()
+    ahab.validate()
+    assert ahab.export() == original_file
+
+
+@pytest.mark.parametrize(
+    "binary,family,expected_code",
+    [
+        ("cntr_signed_ctcm_cm33.bin", "rt118x", 0),
+        ("cntr_signed_ctcm_cm33_sb.bin", "rt118x", 0),
+        ("cntr_signed_ctcm_cm33_sb_mx93.bin", "mx93", 0),
+        ("cntr_encrypted_ctcm_cm33.bin", "rt118x", 0),
+        ("test_parse_ahab.bin", "rt118x", 0),
+        ("cntr_signed_ctcm_cm33_cert_wrong_signature.bin", "rt118x", 1),
+        ("inc13.bin", "rt118x", 1),
+    ],
+)
+def test_nxpimage_ahab_verify_cli(cli_runner: CliRunner, data_dir, binary, family, expected_code):
+    cmd = f"ahab verify -f {family} -b {data_dir}/ahab/{binary}"
+    result = cli_runner.invoke(nxpimage.main, cmd.split(), expected_code=expected_code)
+    if not expected_code:
+        assert "has been verified" in result.output
+
+
+def test_nxpimage_ahab_parse_mapped_benchmark(data_dir, tmpdir):
+    """Benchmark of parse and verification of big AHAB image from memory mapped file."""
+    images = []
+    for i in range(4):
+        images.append(os.path.join(tmpdir, f"image_{i}.bin"))
+        write_file(os.urandom(0x40_0000), images[-1], mode="wb")
+    binary = os.path.join(tmpdir, "ahab.bin")
+    write_file(
+        _load_ahab_image(data_dir, "ctcm_cm33_encrypted_img.yaml", images).export(),
+        binary,
+        mode="wb",
+    )
+    size = os.path.getsize(binary)
+
+    for name, load in [("loaded", load_binary), ("memory mapped", nxpimage_ahab.map_binary)]:
+        tracemalloc.start()
+        start = time.perf_counter()
+        ahab = nxpimage_ahab.ahab_parse_image("rt118x", load(binary))
+        duration = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        assert ahab
+        logging.info(
+            f"AHAB parse and verification of {size / 0x10_0000:.0f} MB {name} image: "
+            f"{size / 0x10_0000 / duration:.1f} MB/s, peak memory {peak / 1024:.0f} kB"
+        )
+    # just the containers headers are copied into memory
+    assert peak < 0x10_0000
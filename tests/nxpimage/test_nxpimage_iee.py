@@ -5,6 +5,7 @@
 #
 # SPDX-License-Identifier: BSD-3-Clause
 """Test IEE part of nxpimage app."""
+import concurrent.futures
 import os
 import shutil
 
@@ -12,6 +13,7 @@ import pytest
 import yaml
 
 from spsdk.apps import nxpimage
+from spsdk.utils.crypto.iee import IeeKeyBlob
 from spsdk.utils.misc import load_binary, load_configuration, use_working_directory
 from tests.cli_runner import CliRunner
 
@@ -87,6 +89,30 @@ def test_nxpimage_iee(cli_runner: CliRunner, tmpdir, data_dir, case, config, ref
             assert reference_keyblob == keyblobs_nxpimage
 
 
+def test_nxpimage_iee_processes(cli_runner: CliRunner, tmpdir, data_dir, monkeypatch):
+    case = "aes_xts512"
+    work_dir = os.path.join(tmpdir, "iee", case)
+    shutil.copytree(os.path.join(data_dir, "iee", case), work_dir)
+    shutil.copy(os.path.join(data_dir, "iee", INPUT_BINARY), work_dir)
+    pool_workers = []
+
+    class ProcessPoolExecutorSpy(concurrent.futures.ProcessPoolExecutor):
+        def __init__(self, max_workers=None):
+            pool_workers.append(max_workers)
+            super().__init__(max_workers=max_workers)
+
+    monkeypatch.setattr(IeeKeyBlob, "PARALLEL_MIN_SIZE", 0)
+    monkeypatch.setattr(concurrent.futures, "ProcessPoolExecutor", ProcessPoolExecutorSpy)
+    with use_working_directory(work_dir):
+        config_dict = load_configuration("iee_config.yaml")
+        out_dir = os.path.join(work_dir, config_dict["output_folder"])
+        cli_runner.invoke(nxpimage.main, ["iee", "export", "-c", "iee_config.yaml", "-j", "2"])
+        assert pool_workers == [2]
+        assert load_binary(os.path.join(out_dir, config_dict["encrypted_name"])) == load_binary(
+            "evkmimxrt1170_iled_blinky_cm7_QSPI_FLASH_nopadding.bin"
+        )
+
+
 @pytest.mark.parametrize(
     "family",
     [
@@ -6,6 +6,7 @@
 # SPDX-License-Identifier: BSD-3-Clause
 
 """Test SecureBinary part of nxpimage app."""
+import concurrent.futures
 import json
 import os
 
@@ -14,7 +15,8 @@ import pytest
 from spsdk.apps import nxpimage
 from spsdk.crypto.exceptions import SPSDKKeysNotMatchingError
 from spsdk.crypto.keys import PrivateKeyEcc
-from spsdk.sbfile.sb31.images import SecureBinary31, SecureBinary31Header
+from spsdk.exceptions import SPSDKError
+from spsdk.sbfile.sb31.images import SecureBinary31, SecureBinary31Commands, SecureBinary31Header
 from spsdk.utils.misc import load_binary, load_configuration, use_working_directory
 from tests.cli_runner import CliRunner
 
@@ -155,6 +157,43 @@ def test_nxpimage_sb31_notime(cli_runner: CliRunner, nxpimage_data_dir, tmpdir):
         assert ref_data[0x1C:0x3C] == new_data[0x1C:0x3C]
 
 
+@pytest.mark.parametrize("device", ["lpc55s3x", "mcxn9xx"])
+def test_nxpimage_sb31_stream(cli_runner: CliRunner, nxpimage_data_dir, tmpdir, device):
+    config_file = "sb3_384_256_fixed_timestamp.yaml"
+    with use_working_directory(nxpimage_data_dir):
+        config_file = f"{nxpimage_data_dir}/workspace/cfgs/{device}/{config_file}"
+        ref_binary, new_binary, new_config = process_config_file(config_file, tmpdir)
+        cli_runner.invoke(nxpimage.main, ["sb31", "export", "-c", new_config, "--stream"])
+        assert os.path.isfile(new_binary)
+
+        sb31 = SecureBinary31.load_from_config(
+            config=load_configuration(config_file),
+            search_paths=[f"{nxpimage_data_dir}/workspace/cfgs/{device}", str(tmpdir)],
+        )
+        signature_offset = (
+            SecureBinary31Header.HEADER_SIZE
+            + len(sb31.sb_commands.final_hash)
+            + sb31.cert_block.expected_size
+        )
+        data_blocks_offset = signature_offset + sb31.signature_provider.signature_length
+        ref_data = load_binary(ref_binary)
+        new_data = load_binary(new_binary)
+        assert len(ref_data) == len(new_data)
+        assert (
+            ref_data[: SecureBinary31Header.HEADER_SIZE]
+            == new_data[: SecureBinary31Header.HEADER_SIZE]
+        )
+        assert ref_data[data_blocks_offset:] == new_data[data_blocks_offset:]
+        assert (
+            get_signing_key(config_file)
+            .get_public_key()
+            .verify_signature(
+                new_data[signature_offset:data_blocks_offset],
+                new_data[:signature_offset],
+            )
+        )
+
+
 def test_nxpimage_sb31_kaypair_not_matching(nxpimage_data_dir):
     config_file = f"{nxpimage_data_dir}/workspace/cfgs/lpc55s3x/sb3_256_256_keys_dont_match.yaml"
     sb31 = SecureBinary31.load_from_config(
@@ -163,3 +202,49 @@ def test_nxpimage_sb31_kaypair_not_matching(nxpimage_data_dir):
     )
     with pytest.raises(SPSDKKeysNotMatchingError):
         sb31.export()
+
+
+def test_nxpimage_sb31_processes(cli_runner: CliRunner, nxpimage_data_dir, tmpdir, monkeypatch):
+    device = "lpc55s3x"
+    config_file = f"{nxpimage_data_dir}/workspace/cfgs/{device}/sb3_384_256_fixed_timestamp.yaml"
+    pool_workers = []
+
+    class ProcessPoolExecutorSpy(concurrent.futures.ProcessPoolExecutor):
+        def __init__(self, max_workers=None):
+            pool_workers.append(max_workers)
+            super().__init__(max_workers=max_workers)
+
+    monkeypatch.setattr(SecureBinary31Commands, "PARALLEL_MIN_SIZE", 0)
+    monkeypatch.setattr(concurrent.futures, "ProcessPoolExecutor", ProcessPoolExecutorSpy)
+    with use_working_directory(nxpimage_data_dir):
+        ref_binary, new_binary, new_config = process_config_file(config_file, tmpdir)
+        cli_runner.invoke(nxpimage.main, ["sb31", "export", "-c", new_config, "-j", "2"])
+        assert pool_workers == [2]
+
+        sb31 = SecureBinary31.load_from_config(
+            config=load_configuration(config_file),
+            search_paths=[f"{nxpimage_data_dir}/workspace/cfgs/{device}", str(tmpdir)],
+        )
+        data_blocks_offset = (
+            SecureBinary31Header.HEADER_SIZE
+            + len(sb31.sb_commands.final_hash)
+            + sb31.cert_block.expected_size
+            + sb31.signature_provider.signature_length
+        )
+        ref_data = load_binary(ref_binary)
+        new_data = load_binary(new_binary)
+        assert ref_data[data_blocks_offset:] == new_data[data_blocks_offset:]
+
+
+def test_nxpimage_sb31_invalid_signature_length(nxpimage_data_dir, monkeypatch):
+    config_file = f"{nxpimage_data_dir}/workspace/cfgs/lpc55s3x/sb3_384_256_fixed_timestamp.yaml"
+    sb31 = SecureBinary31.load_from_config(
+        config=load_configuration(config_file),
+        search_paths=[f"{nxpimage_data_dir}/workspace/cfgs/lpc55s3x", nxpimage_data_dir],
+    )
+    signature_length = sb31.signature_provider.signature_length
+    monkeypatch.setattr(
+        sb31.signature_provider, "get_signature", lambda data: bytes(signature_length - 1)
+    )
+    with pytest.raises(SPSDKError, match="Invalid length of signature"):
+        sb31.export()
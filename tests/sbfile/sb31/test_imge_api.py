@@ -4,6 +4,10 @@
 # Copyright 2021-2024 NXP
 #
 # SPDX-License-Identifier: BSD-3-Clause
+import io
+import logging
+import time
+
 import pytest
 
 from spsdk.crypto.hash import EnumHashAlgorithm
@@ -97,6 +101,79 @@ def test_sb31_commands_no_key_derivator():
         sc.export()
 
 
+@pytest.mark.parametrize("is_encrypted", [False, True])
+def test_sb31_commands_stream(is_encrypted):
+    sc = SecureBinary31Commands(
+        family="lpc55s3x",
+        hash_type=EnumHashAlgorithm.SHA256,
+        is_encrypted=is_encrypted,
+        pck=bytes(16),
+        timestamp=5,
+        kdk_access_rights=3,
+    )
+    sc.add_command(commands.CmdErase(address=0, length=0x10000))
+    sc.add_command(commands.CmdLoad(address=0x1000, data=bytes(range(256)) * 20 + b"\x01"))
+    sc.add_command(commands.CmdExecute(0x1000))
+
+    blocks = sc.get_cmd_blocks_to_export()
+    assert list(sc.iter_cmd_blocks_reversed()) == list(reversed(list(enumerate(blocks, start=1))))
+    data = sc.process_cmd_blocks_to_export(blocks)
+    final_hash = sc.final_hash
+    assert sc.export() == data
+    assert sc.final_hash == final_hash
+
+    output = io.BytesIO(b"prefix")
+    output.seek(0, io.SEEK_END)
+    assert sc.write_to(output) == len(data)
+    assert output.getvalue() == b"prefix" + data
+    assert output.tell() == len(output.getvalue())
+
+
+def _get_encrypted_commands(data_length: int) -> SecureBinary31Commands:
+    sc = SecureBinary31Commands(
+        family="lpc55s3x",
+        hash_type=EnumHashAlgorithm.SHA256,
+        is_encrypted=True,
+        pck=bytes(range(32)),
+        timestamp=5,
+        kdk_access_rights=3,
+    )
+    sc.add_command(
+        commands.CmdLoad(address=0x1000, data=bytes(i & 0xFF for i in range(data_length)))
+    )
+    return sc
+
+
+def test_sb31_commands_parallel_encryption():
+    sc = _get_encrypted_commands(0x10000)
+    serial_data = sc.export()
+    serial_hash = sc.final_hash
+
+    sc.max_processes = 2
+    sc.PARALLEL_MIN_SIZE = 16 * sc.DATA_CHUNK_LENGTH
+    sc.PARALLEL_BATCH_BLOCKS = 7
+    assert sc.block_count * sc.DATA_CHUNK_LENGTH >= sc.PARALLEL_MIN_SIZE
+    assert sc.export() == serial_data
+    assert sc.final_hash == serial_hash
+
+
+def test_sb31_commands_encryption_benchmark():
+    """Benchmark of serial and parallel encryption of SB3.1 commands."""
+    sc = _get_encrypted_commands(0x200000)
+    sc.PARALLEL_MIN_SIZE = 0
+    results = {}
+    for max_processes in [1, None]:
+        sc.max_processes = max_processes
+        start = time.perf_counter()
+        results[max_processes] = sc.export()
+        duration = time.perf_counter() - start
+        logging.info(
+            f"SB3.1 encryption using {max_processes or 'all'} process(es): "
+            f"{len(results[max_processes]) / duration / 1e6:.2f} MB/s"
+        )
+    assert results[1] == results[None]
+
+
 def test_sb31_parse(data_dir):
     data = load_binary(f"{data_dir}/sb3_384_384.sb3")
     header = SecureBinary31Header.parse(data)
@@ -5,13 +5,16 @@
 #
 # SPDX-License-Identifier: BSD-3-Clause
 
+import logging
 import os
+import time
 
 import pytest
 
 from spsdk.crypto.certificate import Certificate
+from spsdk.crypto.hmac import hmac
 from spsdk.crypto.rng import random_bytes
-from spsdk.crypto.symmetric import Counter
+from spsdk.crypto.symmetric import Counter, aes_ctr_encrypt
 from spsdk.exceptions import SPSDKError
 from spsdk.sbfile.sb2.commands import CmdErase, CmdLoad, CmdReset
 from spsdk.sbfile.sb2.sections import BootSectionV2, CertSectionV2
@@ -52,6 +55,74 @@ def test_boot_section_v2():
         assert BootSectionV2.parse(data, 0, False, dek, random_bytes(32), Counter(nonce))
 
 
+def _export_boot_section_v2_reference(
+    section: BootSectionV2, dek: bytes, mac: bytes, counter: Counter
+) -> bytes:
+    """Reference export of boot section, each block is encrypted separately."""
+    commands_data = b"".join(cmd.export() for cmd in section._commands)
+    commands_data += bytes(-len(commands_data) % 16)
+    section._header.data = section.hmac_count
+    section._header.count = len(commands_data) // 16
+    encrypted_header = aes_ctr_encrypt(dek, section._header.export(), counter.value)
+    hmac_data = hmac(mac, encrypted_header)
+    counter.increment(1 + (section.hmac_count + 1) * 2)
+    encrypted_commands = b""
+    for index in range(0, len(commands_data), 16):
+        encrypted_commands += aes_ctr_encrypt(dek, commands_data[index : index + 16], counter.value)
+        counter.increment()
+    block_size = (section._header.count // section.hmac_count) * 16
+    for index in range(section.hmac_count):
+        end = None if index == section.hmac_count - 1 else (index + 1) * block_size
+        hmac_data += hmac(mac, encrypted_commands[index * block_size : end])
+    return encrypted_header + hmac_data + encrypted_commands
+
+
+@pytest.mark.parametrize("hmac_count", [1, 3, 10])
+def test_boot_section_v2_export_reference(hmac_count):
+    boot_section = BootSectionV2(
+        0,
+        CmdErase(address=0, length=100000),
+        CmdLoad(address=0, data=bytes(range(256)) * 20 + b"0123456789"),
+        CmdReset(),
+        hmac_count=hmac_count,
+    )
+    dek = random_bytes(32)
+    mac = random_bytes(32)
+    nonce = random_bytes(12) + b"\xfe\xff\xff\x00"
+    counter = Counter(nonce)
+    data = boot_section.export(dek, mac, counter)
+    ref_counter = Counter(nonce)
+    assert data == _export_boot_section_v2_reference(boot_section, dek, mac, ref_counter)
+    assert counter.value == ref_counter.value
+    assert len(data) == boot_section.raw_size
+
+    counter = Counter(nonce)
+    parsed = BootSectionV2.parse(data, 0, False, dek, mac, counter)
+    assert parsed.export(dek, mac, Counter(nonce)) == data
+    assert counter.value == ref_counter.value
+
+
+def test_boot_section_v2_export_benchmark():
+    """Benchmark of export and parse of boot section with big load command."""
+    boot_section = BootSectionV2(
+        0, CmdLoad(address=0, data=random_bytes(0x40_0000)), CmdReset(), hmac_count=10
+    )
+    dek = random_bytes(32)
+    mac = random_bytes(32)
+    nonce = random_bytes(16)
+    start = time.perf_counter()
+    data = boot_section.export(dek, mac, Counter(nonce))
+    export_duration = time.perf_counter() - start
+    start = time.perf_counter()
+    BootSectionV2.parse(data, 0, False, dek, mac, Counter(nonce))
+    parse_duration = time.perf_counter() - start
+    logging.info(
+        f"SB2 boot section with {len(data) / 0x10_0000:.0f} MB of data: "
+        f"export {len(data) / 0x10_0000 / export_duration:.1f} MB/s, "
+        f"parse {len(data) / 0x10_0000 / parse_duration:.1f} MB/s"
+    )
+
+
 def test_boot_section_v2_invalid_export():
     boot_section = BootSectionV2(
         0, CmdErase(address=0, length=100000), CmdLoad(address=0, data=b"0123456789"), CmdReset()
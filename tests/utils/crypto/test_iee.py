@@ -5,7 +5,9 @@
 #
 # SPDX-License-Identifier: BSD-3-Clause
 
+import logging
 import os
+import time
 
 import pytest
 
@@ -109,3 +111,56 @@ def test_keyblob_invalid():
 
     with pytest.raises(SPSDKError, match="Invalid start/end address"):
         IeeKeyBlob(attribute, start_addr=0x08001000, end_addr=0x08000000)
+
+
+def _get_key_blob(aes_mode: IeeKeyBlobModeAttributes) -> IeeKeyBlob:
+    keyblob_attribute = IeeKeyBlobAttribute(
+        IeeKeyBlobLockAttributes.UNLOCK, IeeKeyBlobKeyAttributes.CTR256XTS512, aes_mode
+    )
+    return IeeKeyBlob(
+        attributes=keyblob_attribute,
+        start_addr=0x30000000,
+        end_addr=0x30FFFFFF,
+        key1=bytes(range(32)),
+        key2=bytes(keyblob_attribute.key2_size),
+    )
+
+
+def test_iee_calculate_tweak():
+    assert IeeKeyBlob.calculate_tweak(0x30001FFF) == bytes.fromhex("01000300") + bytes(12)
+    assert IeeKeyBlob.calculate_tweak(0) == bytes(16)
+
+
+def test_iee_ctr_overflow():
+    key_blob = _get_key_blob(IeeKeyBlobModeAttributes.AesCTRWAddress)
+    # the words of nonce are reversed, counter of the first block is 0xFFFFFFFF
+    key_blob.key2 = bytes(12) + (0xFFFFFFFF - 0x3000000).to_bytes(4, "little")
+    assert len(key_blob.encrypt_image(0x30000000, bytes(16))) == 16
+    with pytest.raises(SPSDKError):
+        key_blob.encrypt_image(0x30000000, bytes(32))
+
+
+@pytest.mark.parametrize(
+    "aes_mode", [IeeKeyBlobModeAttributes.AesXTS, IeeKeyBlobModeAttributes.AesCTRWAddress]
+)
+def test_iee_encrypt_image_benchmark(aes_mode):
+    """Benchmark of the image encryption in single and more processes."""
+    key_blob = _get_key_blob(aes_mode)
+    data = os.urandom(0x40_0000)
+    results = {}
+    for max_processes in [1, 2]:
+        key_blob.max_processes = max_processes
+        key_blob.PARALLEL_MIN_SIZE = 0
+        start = time.perf_counter()
+        results[max_processes] = key_blob.encrypt_image(0x30001000, data)
+        duration = time.perf_counter() - start
+        logging.info(
+            f"IEE {aes_mode.label} encryption using {max_processes} process(es): "
+            f"{len(data) / duration / 1e6:.2f} MB/s"
+        )
+    assert results[1] == results[2]
+    assert len(results[1]) == len(data)
+
+    iee = Iee()
+    iee.add_key_blob(key_blob)
+    assert iee.encrypt_image(data, 0x30001000) == results[1]
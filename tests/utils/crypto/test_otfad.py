@@ -5,13 +5,16 @@
 #
 # SPDX-License-Identifier: BSD-3-Clause
 
+import logging
 import os
+import time
 
 import pytest
 
+from spsdk.crypto.symmetric import Counter, aes_ctr_encrypt
 from spsdk.exceptions import SPSDKError
 from spsdk.utils.crypto.otfad import KeyBlob, Otfad
-from spsdk.utils.misc import align_block
+from spsdk.utils.misc import Endianness, align_block
 
 
 def test_otfad_keyblob(data_dir):
@@ -140,3 +143,40 @@ def test_keyblob_invalid():
     key_blob.ctr_init_vector = bytes(99)
     with pytest.raises(SPSDKError, match="Invalid length of counter init"):
         key_blob._get_ctr_nonce()
+
+
+def _encrypt_image_reference(key_blob: KeyBlob, base_address: int, data: bytes) -> bytes:
+    """Reference implementation encrypting the image block by block, with byte swap."""
+    counter = Counter(
+        key_blob._get_ctr_nonce(), ctr_value=base_address, ctr_byteorder_encoding=Endianness.BIG
+    )
+    result = bytearray()
+    for index in range(0, len(data), 16):
+        block = data[index : index + 8][::-1] + data[index + 8 : index + 16][::-1]
+        encrypted = aes_ctr_encrypt(key_blob.key, block, counter.value)
+        result += encrypted[:8][::-1] + encrypted[8:][::-1]
+        counter.increment(16)
+    return bytes(result)
+
+
+def test_otfad_encrypt_image_benchmark():
+    """Benchmark of the image encryption compared with block by block encryption."""
+    key_blob = KeyBlob(start_addr=0x08000000, end_addr=0x08FFFFFF)
+    data = os.urandom(0x40_0000)
+
+    start = time.perf_counter()
+    reference = _encrypt_image_reference(key_blob, 0x08000000, data[:0x4_0000])
+    reference_duration = time.perf_counter() - start
+    start = time.perf_counter()
+    encrypted = key_blob.encrypt_image(0x08000000, data, byte_swap=True)
+    duration = time.perf_counter() - start
+    logging.info(
+        f"OTFAD encryption: {len(data) / duration / 1e6:.2f} MB/s, "
+        f"block by block: {len(reference) / reference_duration / 1e6:.2f} MB/s"
+    )
+    assert encrypted[: len(reference)] == reference
+    assert len(encrypted) == len(data)
+
+    otfad = Otfad()
+    otfad.add_key_blob(key_blob)
+    assert otfad.encrypt_image(data, 0x08000000, True) == encrypted
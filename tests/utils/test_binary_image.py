@@ -5,11 +5,14 @@
 #
 # SPDX-License-Identifier: BSD-3-Clause
 
+import io
+import logging
 import os
+import time
 
 import pytest
 
-from spsdk.exceptions import SPSDKError, SPSDKValueError
+from spsdk.exceptions import SPSDKError, SPSDKOverlapError, SPSDKValueError
 from spsdk.utils.images import BinaryImage, BinaryPattern
 
 
@@ -143,3 +146,106 @@ def test_binary_image_load_elf(data_dir):
     assert binary.offset == 0x8000_2000
     binary.add_image(BinaryImage.load_binary_image(os.path.join(data_dir, "images/image.s19")))
     assert binary.size == 582818
+
+
+def test_binary_image_pattern_offset():
+    assert BinaryPattern("inc").get_block(4, offset=0x1FE) == b"\xfe\xff\x00\x01"
+    assert BinaryPattern("0x1234").get_block(3, offset=1) == b"\x34\x12\x34"
+
+
+def test_binary_image_iter_chunks():
+    image = BinaryImage(name="main", size=16, pattern=BinaryPattern("inc"))
+    image.add_image(BinaryImage(name="data", offset=2, binary=b"\xaa\xbb\xcc"))
+    image.add_image(BinaryImage(name="ones", offset=8, size=2, pattern=BinaryPattern("ones")))
+    image.add_image(BinaryImage(name="zeros", offset=12, size=2))
+    expected = bytes([0, 1, 0xAA, 0xBB, 0xCC, 5, 6, 7, 0xFF, 0xFF, 10, 11, 0, 0, 14, 15])
+
+    assert image.export() == expected
+    assert len(image.get_extents()) == 7
+    assert b"".join(image.iter_chunks(chunk_size=3)) == expected
+    assert all(len(chunk) <= 3 for chunk in image.iter_chunks(chunk_size=3))
+    stream = io.BytesIO()
+    assert image.write_to(stream) == len(expected)
+    assert stream.getvalue() == expected
+
+
+def test_binary_image_export_sub_image_too_big(tmpdir):
+    image = BinaryImage(name="main", size=8)
+    image.add_image(BinaryImage(name="data", offset=4, binary=bytes(8)))
+    with pytest.raises(SPSDKOverlapError):
+        image.export()
+    with pytest.raises(SPSDKOverlapError):
+        image.write_to(io.BytesIO())
+    with pytest.raises(SPSDKOverlapError):
+        image.save_binary_image(os.path.join(tmpdir, "image.bin"))
+    assert not os.path.exists(os.path.join(tmpdir, "image.bin"))
+
+
+def test_binary_image_sparse_export(tmpdir):
+    """Export of the image with big gaps doesn't allocate the whole image."""
+    image = BinaryImage(name="main", pattern=BinaryPattern("ones"))
+    image.add_image(BinaryImage(name="low", offset=0, binary=b"\x01" * 16))
+    image.add_image(BinaryImage(name="high", offset=0x100_0000, binary=b"\x02" * 16))
+    extents = image.get_extents()
+    assert [(extent.start, extent.end) for extent in extents] == [
+        (0, 0x10),
+        (0x10, 0x100_0000),
+        (0x100_0000, 0x100_0010),
+    ]
+    assert max(len(chunk) for chunk in image.iter_chunks()) == BinaryImage.EXPORT_CHUNK_SIZE
+
+    path = os.path.join(tmpdir, "sparse.bin")
+    image.save_binary_image(path)
+    assert os.path.getsize(path) == 0x100_0010
+    with open(path, "rb") as f:
+        assert f.read(17) == b"\x01" * 16 + b"\xff"
+        f.seek(0x100_0000 - 1)
+        assert f.read() == b"\xff" + b"\x02" * 16
+
+
+def test_binary_image_sub_images_lookup():
+    image = BinaryImage(name="main", size=0x100)
+    for offset in (0x80, 0x00, 0x40, 0xC0):
+        image.add_image(BinaryImage(name=hex(offset), offset=offset, size=0x10))
+    assert [child.offset for child in image.sub_images] == [0x00, 0x40, 0x80, 0xC0]
+    image.validate()
+    assert image.find_sub_image(0x45).name == "0x40"
+    assert image.find_sub_image(0xCF).name == "0xc0"
+    assert image.find_sub_image(0x50) is None
+    image.add_image(BinaryImage(name="overlap", offset=0x4F, size=0x10))
+    with pytest.raises(SPSDKOverlapError):
+        image.validate()
+
+
+def _get_srec_record(address: int, data: bytes) -> str:
+    record = (len(data) + 5).to_bytes(1, "big") + address.to_bytes(4, "big") + data
+    checksum = (~sum(record)) & 0xFF
+    return f"S3{record.hex().upper()}{checksum:02X}"
+
+
+def test_binary_image_merge_srec_benchmark(tmpdir):
+    """Benchmark of merging SREC file with 10k segments into the binary image."""
+    segments = 10_000
+    path = os.path.join(tmpdir, "segments.srec")
+    with open(path, "w", encoding="ascii") as f:
+        for i in range(segments):
+            # the gaps between records keep the segments separated
+            f.write(_get_srec_record(i * 32, bytes([i & 0xFF]) * 16) + "\n")
+        f.write("S70500000000FA\n")
+
+    start = time.perf_counter()
+    image = BinaryImage.load_binary_image(path)
+    loaded = time.perf_counter()
+    image.validate()
+    validated = time.perf_counter()
+    data = image.export()
+    exported = time.perf_counter()
+    logging.info(
+        f"Merge of {segments} segments: load {loaded - start:.3f} s, "
+        f"validate {validated - loaded:.3f} s, export {exported - validated:.3f} s"
+    )
+
+    assert len(image.sub_images) == segments
+    assert len(data) == (segments - 1) * 32 + 16
+    assert data[32 * 100 : 32 * 100 + 17] == bytes([100]) * 16 + b"\x00"
+    assert image.find_sub_image(32 * 5000 + 3).name == "Segment 5000"
@@ -11,7 +11,7 @@ from typing import List
 
 import pytest
 
-from spsdk.exceptions import SPSDKValueError
+from spsdk.exceptions import SPSDKError, SPSDKValueError
 from spsdk.utils import database
 from spsdk.utils.database import Database, DatabaseManager, SPSDKErrorMissingDevice
 
@@ -161,6 +161,20 @@ def test_invalid_revision(mock_test_database):
         database.DatabaseManager().db.devices.get("dev2").revisions.get("invalid")
 
 
+def test_lazy_devices(data_dir):
+    db = Database(os.path.join(data_dir, "test_db"))
+    assert sorted(db.devices.devices_names) == ["dev1", "dev1_alias", "dev2"]
+    assert all(dev is None for dev in db.devices._devices.values())
+    # loading of alias device loads also the aliased device
+    assert db.devices.get("dev1_alias").device_alias is db.devices.get("dev1")
+    assert db.devices._devices["dev2"] is None
+    assert db.devices.feature_index["feature3"] == ["dev1", "dev1_alias"]
+    families = db.get_devices_with_feature("feature1", ["sub_feature1"])
+    assert families == ["dev2"]
+    families.append("modified")
+    assert db.get_devices_with_feature("feature1", ["sub_feature1"]) == ["dev2"]
+
+
 def test_load_database():
     assert isinstance(DatabaseManager().db, Database)
 
@@ -168,3 +182,39 @@ def test_load_database():
 def test_load_database_without_cache():
     database.SPSDK_CACHE_DISABLED = True
     assert isinstance(DatabaseManager().db, Database)
+
+
+def test_database_cache(data_dir, tmpdir):
+    path = os.path.join(data_dir, "test_db")
+    cache_file = os.path.join(tmpdir, "db.cache")
+    db = Database(path)
+    db.db_hash = DatabaseManager.get_db_hash(path)
+    DatabaseManager.store_cache(db, cache_file)
+
+    cached_db = DatabaseManager.load_cache(path, cache_file, db.db_hash)
+    assert cached_db.devices.devices_names == db.devices.devices_names
+    assert cached_db.get_devices_with_feature("feature1", ["sub_feature1"]) == ["dev2"]
+    # devices are loaded on their first access only
+    assert all(dev is None for dev in cached_db.devices._devices.values())
+    features = cached_db.get_device_features("dev1_alias", "new_rev")
+    assert features.get_int("feature1", "atrribute_int1") == 1
+    assert [name for name, dev in cached_db.devices._devices.items() if dev] == ["dev1_alias"]
+
+    with pytest.raises(SPSDKError):
+        DatabaseManager.load_cache(path, cache_file, bytes(20))
+
+
+def test_database_hash(tmpdir):
+    os.makedirs(os.path.join(tmpdir, "a", "b"))
+    with open(os.path.join(tmpdir, "a", "b", "database.yaml"), "w") as f:
+        f.write("key: value")
+    with open(os.path.join(tmpdir, "a", "ignored.txt"), "w") as f:
+        f.write("text")
+    db_hash = DatabaseManager.get_db_hash(str(tmpdir))
+    assert db_hash == DatabaseManager.get_db_hash(str(tmpdir))
+    with open(os.path.join(tmpdir, "a", "ignored.txt"), "w") as f:
+        f.write("changed text")
+    assert db_hash == DatabaseManager.get_db_hash(str(tmpdir))
+    with open(os.path.join(tmpdir, "a", "b", "database.yaml"), "w") as f:
+        f.write("key: changed value")
+    assert db_hash != DatabaseManager.get_db_hash(str(tmpdir))
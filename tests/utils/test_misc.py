@@ -26,17 +26,22 @@ from spsdk.utils.misc import (
     find_first,
     format_value,
     get_bytes_cnt_of_int,
+    get_process_count,
+    get_range_owner,
+    get_unit_regions,
     load_binary,
     load_file,
     reverse_bits_in_bytes,
     reverse_bytes_in_longs,
     size_fmt,
     swap16,
+    swap_bytes_in_groups,
     use_working_directory,
     value_to_bool,
     value_to_bytes,
     value_to_int,
     write_file,
+    xor_bytes,
 )
 
 
@@ -283,6 +288,24 @@ def test_reg_long_reverse():
         reverse_bytes_in_longs(test_val1)
 
 
+def test_swap_bytes_in_groups():
+    data = bytes(range(32))
+    assert swap_bytes_in_groups(data, 4) == reverse_bytes_in_longs(data)
+    assert swap_bytes_in_groups(data, 8) == bytes(range(7, -1, -1)) + bytes(range(15, 7, -1)) + (
+        bytes(range(23, 15, -1)) + bytes(range(31, 23, -1))
+    )
+    assert swap_bytes_in_groups(b"", 8) == b""
+    with pytest.raises(SPSDKError):
+        swap_bytes_in_groups(data[:-1], 8)
+
+
+def test_xor_bytes():
+    assert xor_bytes(b"\x0f\xf0\x00", b"\xff\xff\x01") == b"\xf0\x0f\x01"
+    assert xor_bytes(b"", b"") == b""
+    with pytest.raises(SPSDKError):
+        xor_bytes(b"\x00", b"")
+
+
 @pytest.mark.parametrize(
     "num, output, align_2_2n, byte_cnt, exception",
     [
@@ -471,3 +494,37 @@ def test_size_format(input_value, use_kibibyte, expected):
 def test_swap16_invalid():
     with pytest.raises(SPSDKError, match="Incorrect number to be swapped"):
         swap16(0xFFFFA)
+
+
+def test_get_process_count():
+    # more processes are used only on request and for big data
+    assert get_process_count(1, 0x100_0000, 0x1000) == 1
+    assert get_process_count(4, 0x100, 0x1000) == 1
+    assert get_process_count(4, 0x1000, 0x1000) == 4
+    assert get_process_count(None, 0x1000, 0x1000) == os.cpu_count()
+
+
+def test_get_unit_regions():
+    def get_owner(start, end):
+        if end <= 0x1400:
+            return "low"
+        return "high" if start >= 0x1800 else None
+
+    assert get_unit_regions(0x1000, 0x1100, 0x400, get_owner) == [
+        (0x1000, 0x1400, "low"),
+        (0x1800, 0x2100, "high"),
+    ]
+    assert get_unit_regions(0x1000, 0, 0x400, get_owner) == []
+
+
+def test_get_range_owner():
+    owners = [(0x1000, 0x2000), (0x1800, 0x3000), (0x1800, 0x1C00)]
+
+    def matches_range(owner, start, end):
+        return owner[0] <= start and end <= owner[1]
+
+    assert get_range_owner(owners, 0x1000, 0x1400, matches_range) is owners[0]
+    assert get_range_owner(owners, 0x1800, 0x1C00, matches_range) is owners[2]
+    assert get_range_owner(owners, 0x1C00, 0x2000, matches_range) is owners[1]
+    assert get_range_owner(owners, 0x3000, 0x3400, matches_range) is None
+    assert get_range_owner([], 0x1000, 0x1400, matches_range) is None
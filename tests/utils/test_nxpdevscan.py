@@ -6,6 +6,8 @@
 # SPDX-License-Identifier: BSD-3-Clause
 
 import platform
+import threading
+import time
 from unittest.mock import MagicMock, patch
 
 import libusbsio
@@ -17,6 +19,8 @@ import spsdk.utils.devicedescription as devicedescription
 import spsdk.utils.nxpdevscan as nds
 from spsdk.exceptions import SPSDKError
 from spsdk.mboot.exceptions import McuBootConnectionError
+from spsdk.utils.interfaces.device.serial_device import SerialDevice
+from spsdk.utils.interfaces.scanner_helper import clear_scan_cache, scan_ports
 
 
 def test_usb_device_search():
@@ -337,3 +341,91 @@ def test_sio_device_search_fail():
     """Test, that search method returns all NXP SIO devices and its fails."""
     with pytest.raises(SPSDKError):
         nds.search_libusbsio_devices()
+
+
+def test_scan_ports_concurrent():
+    """Test, that ports are checked concurrently and the results keep the order of ports."""
+    ports = [f"COM{i}" for i in range(8)]
+    running = []
+    lock = threading.Lock()
+
+    def check(port):
+        with lock:
+            running.append(port)
+        time.sleep(0.2)
+        return port if int(port[3:]) % 2 else None
+
+    start = time.perf_counter()
+    assert scan_ports(ports, check, max_workers=4) == ["COM1", "COM3", "COM5", "COM7"]
+    # two rounds of 4 concurrent checks
+    assert time.perf_counter() - start < 0.2 * 8 / 2 + 0.3
+    assert sorted(running) == sorted(ports)
+
+
+def test_scan_ports_timeout():
+    """Test, that slow port is dropped and queued ports are skipped after the time limit."""
+    finished = []
+
+    def check(port):
+        if port == "COM2":
+            time.sleep(0.5)
+        finished.append(port)
+        return port
+
+    assert scan_ports(["COM1", "COM2", "COM3"], check, scan_timeout=200) == ["COM1", "COM3"]
+    # the running check is finished before returning, so its port is not left open
+    assert sorted(finished) == ["COM1", "COM2", "COM3"]
+    finished.clear()
+    assert scan_ports(["COM2", "COM1"], check, max_workers=1, scan_timeout=200) == []
+    assert finished == ["COM2"]
+
+
+def test_scan_ports_negative_cache():
+    """Test, that ports without a device are skipped by the following scans."""
+    clear_scan_cache()
+    checked = []
+
+    def check(port):
+        checked.append(port)
+        return port if port == "COM1" else None
+
+    assert scan_ports(["COM1", "COM2"], check, cache_key="test") == ["COM1"]
+    assert scan_ports(["COM1", "COM2"], check, cache_key="test") == ["COM1"]
+    assert sorted(checked) == ["COM1", "COM1", "COM2"]
+    # different check doesn't use the results
+    assert scan_ports(["COM1", "COM2"], check, cache_key="other") == ["COM1"]
+    assert len(checked) == 5
+    clear_scan_cache()
+    assert scan_ports(["COM1", "COM2"], check, cache_key="test") == ["COM1"]
+    assert len(checked) == 7
+
+
+@patch(
+    "spsdk.utils.interfaces.device.serial_device.comports",
+    MagicMock(return_value=list_port_info_mock),
+)
+def test_serial_device_scan():
+    """Test, that serial device scan checks all ports and applies additional check."""
+    clear_scan_cache()
+    with patch(
+        "spsdk.utils.interfaces.device.serial_device.Serial",
+        side_effect=lambda port, **kwargs: MagicMock(port=port),
+    ):
+        devices = SerialDevice.scan(check=lambda device: str(device) != "COM5")
+        assert [str(device) for device in devices] == ["COM1", "COM28"]
+        devices = SerialDevice.scan(port="COM5")
+        assert [str(device) for device in devices] == ["COM5"]
+        # the ports without a device are checked again unless the negative cache is requested
+        checked = []
+
+        def check(device):
+            checked.append(str(device))
+            return str(device) != "COM5"
+
+        for _ in range(2):
+            SerialDevice.scan(check=check)
+        assert checked.count("COM5") == 2
+        for _ in range(2):
+            SerialDevice.scan(check=check, cache_negative=True)
+        assert checked.count("COM5") == 3
+        clear_scan_cache()
@@ -227,6 +227,38 @@ def test_register_duplicate():
         regs.add_register(reg1)
 
 
+def test_registers_indexes():
+    """Test lookups of registers by names, aliases and offsets."""
+    regs = Registers(TEST_DEVICE_NAME)
+    reg = RegsRegister("REG_A", 0x10, 32)
+    regs.add_register(reg)
+    regs.add_register(RegsRegister("REG_B", 0x14, 32))
+    # register at the same offset is added as alias
+    alias = RegsRegister("REG_A_ALIAS", 0x10, 32)
+    alias.add_bitfield(RegsBitField(alias, "BITFIELD", 0, 8))
+    regs.add_register(alias)
+
+    assert regs.get_reg_names() == ["REG_A", "REG_B"]
+    assert regs.find_reg("REG_A_ALIAS") is reg
+    assert reg.find_bitfield("BITFIELD").name == "BITFIELD"
+    with pytest.raises(SPSDKRegsError):
+        regs.add_register(RegsRegister("REG_B", 0x20, 32))
+
+    # sub-registers added directly into group register are found as well
+    group = RegsRegister("GROUP", 0, 0)
+    regs.add_register(group)
+    group.add_group_reg(RegsRegister("GROUP0", 0x40, 32))
+    with pytest.raises(SPSDKRegsErrorRegisterNotFound):
+        regs.find_reg("GROUP0")
+    assert regs.find_reg("GROUP0", include_group_regs=True).offset == 0x40
+
+    regs.remove_registers()
+    with pytest.raises(SPSDKRegsErrorRegisterNotFound):
+        regs.find_reg("REG_A")
+    regs.add_register(RegsRegister("REG_A", 0x10, 32))
+    assert regs.find_reg("REG_A").offset == 0x10
+
+
 def test_register_invalid_val():
     """Invalid value register test."""
     reg = RegsRegister(
@@ -5,16 +5,21 @@
 #
 # SPDX-License-Identifier: BSD-3-Clause
 
+import logging
 import os
+import time
 from typing import Any, Dict, Optional
 
+import fastjsonschema
 import pytest
 import yaml
 
 from spsdk.exceptions import SPSDKError
+from spsdk.image.mbi.mbi import get_mbi_class
+from spsdk.utils import schema_validator
 from spsdk.utils.database import DatabaseManager
 from spsdk.utils.misc import use_working_directory
-from spsdk.utils.schema_validator import CommentedConfig, check_config
+from spsdk.utils.schema_validator import CommentedConfig, check_config, get_validator
 
 # schema for testing commented YAML configuration
 _TEST_CONFIG_SCHEMA = {
@@ -307,3 +312,103 @@ def test_load_schema_file() -> None:
 
     with pytest.raises(SPSDKError):
         DatabaseManager().db.get_schema_file("total_invalid_name")
+
+
+@pytest.fixture
+def validators_cache(tmpdir, monkeypatch):
+    """Use empty validators cache, persistent cache is stored in temporary folder."""
+    monkeypatch.setattr(schema_validator, "_validators_cache", schema_validator.OrderedDict())
+    monkeypatch.setattr(schema_validator, "VALIDATORS_CACHE_PERSISTENT", False)
+    monkeypatch.setattr(
+        schema_validator, "get_validators_cache_dir", lambda: os.path.join(tmpdir, "cache")
+    )
+    return os.path.join(tmpdir, "cache")
+
+
+def test_validators_cache(tmpdir, validators_cache, monkeypatch) -> None:
+    schema = {"type": "object", "properties": {"f1": {"type": "string", "format": "file"}}}
+    for name in ["dir1", "dir2"]:
+        os.mkdir(os.path.join(tmpdir, name))
+        with open(os.path.join(tmpdir, name, f"{name}.bin"), "wb") as f:
+            f.write(bytes(16))
+    # the cached validator uses formatters of the current call
+    check_config({"f1": "dir1.bin"}, [schema], search_paths=[os.path.join(tmpdir, "dir1")])
+    check_config({"f1": "dir2.bin"}, [schema], search_paths=[os.path.join(tmpdir, "dir2")])
+    with pytest.raises(SPSDKError):
+        check_config({"f1": "dir1.bin"}, [schema], search_paths=[os.path.join(tmpdir, "dir2")])
+    assert len(schema_validator._validators_cache) == 1
+    assert not os.path.isdir(validators_cache)
+
+    schema = {"type": "object", "properties": {"n1": {"type": "string", "format": "number"}}}
+    formats = {"number": lambda x: True}
+    validator = get_validator([schema], formats)
+    assert get_validator([dict(schema)], {"number": lambda x: False}) is validator
+    assert get_validator([schema, {"required": ["f1"]}], formats) is not validator
+    assert get_validator([schema], {"number": "^[0-9]+$"}) is not validator
+
+    monkeypatch.setattr(schema_validator, "VALIDATORS_CACHE_SIZE", 2)
+    get_validator([{"type": "string"}], formats)
+    assert len(schema_validator._validators_cache) == 2
+    assert get_validator([{"type": "string"}], formats)
+    # the least recently used validator is evicted
+    assert get_validator([schema], formats) is not validator
+
+
+def test_validators_persistent_cache(validators_cache, monkeypatch) -> None:
+    monkeypatch.setattr(schema_validator, "VALIDATORS_CACHE_PERSISTENT", True)
+    schema = {"type": "object", "properties": {"n1": {"type": "string", "format": "number"}}}
+    check_config({"n1": "0x10"}, [schema])
+    assert len(os.listdir(validators_cache)) == 1
+
+    schema_validator.clear_validators_cache()
+    # the validator is loaded from the generated code without compilation
+    monkeypatch.setattr(fastjsonschema, "compile_to_code", None)
+    check_config({"n1": "0x10"}, [schema])
+    with pytest.raises(SPSDKError):
+        check_config({"n1": "invalid"}, [schema])
+
+    # corrupted file is ignored
+    file_name = os.path.join(validators_cache, os.listdir(validators_cache)[0])
+    with open(file_name, "w") as f:
+        f.write("invalid code")
+    schema_validator.clear_validators_cache()
+    monkeypatch.undo()
+    monkeypatch.setattr(schema_validator, "VALIDATORS_CACHE_PERSISTENT", True)
+    monkeypatch.setattr(schema_validator, "get_validators_cache_dir", lambda: validators_cache)
+    check_config({"n1": "0x10"}, [schema])
+
+
+def test_check_config_benchmark(validators_cache) -> None:
+    """Benchmark of repeated validation of configurations by the same schemas."""
+    config = {
+        "family": "lpc55s6x",
+        "outputImageExecutionTarget": "xip",
+        "outputImageAuthenticationType": "crc",
+        "masterBootOutputFile": "output.bin",
+        "inputImageFile": "input.bin",
+        "outputImageExecutionAddress": 0,
+    }
+    schemas = get_mbi_class(config).get_validation_schemas()
+    cached = len(schema_validator._validators_cache)
+    count = 20
+
+    formats = {name: lambda x: True for name in ["dir", "file", "file_name", "optional_file"]}
+    formats.update({"number": lambda x: True, "hex_value": lambda x: True})
+    start = time.perf_counter()
+    for _ in range(count):
+        merged: Dict[str, Any] = {}
+        for sch in schemas:
+            schema_validator.always_merger.merge(merged, schema_validator.copy.deepcopy(sch))
+        fastjsonschema.compile(merged, formats=formats)
+    compile_duration = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(count):
+        with pytest.raises(SPSDKError, match="inputImageFile"):
+            check_config(config, schemas)
+    cached_duration = time.perf_counter() - start
+    logging.info(
+        f"Validation of {count} configurations: compiled on each call {compile_duration:.3f} s, "
+        f"cached validator {cached_duration:.3f} s"
+    )
+    assert len(schema_validator._validators_cache) == cached + 1